@@ -0,0 +1,32 @@
+"""Add cached MEC state to events
+
+Revision ID: 4c1d8e7f2a90
+Revises: cb2b543a7fe9
+Create Date: 2026-10-17 09:12:41.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4c1d8e7f2a90'
+down_revision = 'cb2b543a7fe9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('mec_center_lat', sa.Float(), nullable=True))
+    op.add_column('events', sa.Column('mec_center_lng', sa.Float(), nullable=True))
+    op.add_column('events', sa.Column('mec_radius_km', sa.Float(), nullable=True))
+    op.add_column('events', sa.Column('mec_support', sa.Text(), nullable=True))
+    op.add_column('events', sa.Column('mec_participant_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('events', 'mec_participant_count')
+    op.drop_column('events', 'mec_support')
+    op.drop_column('events', 'mec_radius_km')
+    op.drop_column('events', 'mec_center_lng')
+    op.drop_column('events', 'mec_center_lat')
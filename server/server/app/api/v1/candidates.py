@@ -1,31 +1,54 @@
 """API endpoints for candidate venue management."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
+from sqlalchemy import func, insert
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+import asyncio
+import itertools
 import json
 
-from app.db.base import get_db
+import numpy as np
+
+from app.core.config import settings
+from app.db.base import SessionLocal, get_db
 from app.models.event import Event, Participant, Candidate, Vote
 from app.schemas.event import CandidateResponse, CandidateSearch, CandidateAdd, CandidateSearchResponse, SearchAreaInfo
 from app.services.sse import sse_manager
 from app.services.google_maps import google_maps_service
-from app.services.algorithms import compute_centroid, compute_mec, haversine_distance
+from app.services.places import Place
+from app.services.enrichment import enrich_candidates
+from app.services.mec_state import read_event_mec
+from app.services.algorithms import compute_cluster_mecs, compute_travel_fairness
+from app.services.center_solvers import solve_center
+from app.services.projection import projection_cache
+from app.services.ranking import compute_scores, top_k
+from app.services import geo_kernels
 
 router = APIRouter()
 
+# Latest search generation per event (progressive pages of older searches are dropped).
+# Per process only: with several workers, a newer search served by another worker
+# does not stop this worker's pages, which keep appending until they run out.
+_search_generations = itertools.count(1)
+_active_searches: Dict[str, int] = {}
+
 
 @router.post("/events/{event_id}/candidates/search", response_model=CandidateSearchResponse)
 async def search_candidates(
     event_id: str,
     search_data: CandidateSearch,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
     Search for candidate venues using Google Places API.
 
     M2-04: Server-side MEC & In-circle POI
+
+    With progressive=true only the first result page of each area is
+    awaited; later pages are stored after the response and pushed over SSE
+    as candidates_added batches (complete=false in the response until then).
     """
     # Check if event exists
     event = db.query(Event).filter(
@@ -39,72 +62,58 @@ async def search_candidates(
             detail="Event not found"
         )
 
-    # Get participants
-    participants = db.query(Participant).filter(
-        Participant.event_id == event_id
-    ).all()
+    # Read the cached MEC (maintained on participant join, update and leave)
+    mec_result, _ = read_event_mec(db, event)
 
-    if len(participants) < 1:
+    if not mec_result:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Need at least one participant to search"
         )
 
-    # Use custom center if provided, otherwise compute MEC
+    # Participant locations (also known-land hints for snapping centers)
+    locations = [
+        (lat, lng) for lat, lng in db.query(Participant.lat, Participant.lng).filter(
+            Participant.event_id == event_id
+        ).all()
+    ]
+
+    # Use custom center if provided, otherwise use the MEC center
     if search_data.custom_center_lat is not None and search_data.custom_center_lng is not None:
         # Use custom center from dragged centroid
         center_lat = search_data.custom_center_lat
         center_lng = search_data.custom_center_lng
 
-        # Still compute MEC to get the radius
-        locations = [(p.lat, p.lng) for p in participants]
-        mec_result = compute_mec(locations)
-
-        if not mec_result:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to compute MEC"
-            )
-
         _, _, radius_km = mec_result  # Use MEC radius but custom center
         print(f"🎯 Using custom center: ({center_lat:.6f}, {center_lng:.6f}) with MEC radius: {radius_km:.2f}km")
+    elif search_data.center_mode != "mec" and search_data.cluster_count == 1:
+        # Solve for the requested meeting center; its radius encloses every participant
+        solution = solve_center(locations, search_data.center_mode, projection_cache.get(event_id, locations))
+        center_lat, center_lng, radius_km = solution.center_lat, solution.center_lng, solution.radius_km
+        print(f"🧭 Using {solution.mode} center: ({center_lat:.6f}, {center_lng:.6f}) with radius: {radius_km:.2f}km "
+              f"({solution.iterations} iterations, {solution.solve_ms:.2f}ms)")
     else:
-        # Compute MEC normally
-        locations = [(p.lat, p.lng) for p in participants]
-        mec_result = compute_mec(locations)
-
-        if not mec_result:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to compute MEC"
-            )
-
         center_lat, center_lng, radius_km = mec_result
         print(f"📍 Using computed MEC center: ({center_lat:.6f}, {center_lng:.6f}) with radius: {radius_km:.2f}km")
 
-    # Store original center before snapping
-    original_center_lat = center_lat
-    original_center_lng = center_lng
-
-    # Snap center point to land (avoid water)
-    # This ensures the search center is always on land
-    land_center = await google_maps_service.snap_to_land(
-        lat=center_lat,
-        lng=center_lng,
-        max_radius=min(radius_km * 2, 10.0)  # Search up to 2x MEC radius or 10km
-    )
-
-    # Use land-based center for search
-    search_center_lat = land_center["lat"]
-    search_center_lng = land_center["lng"]
-    search_radius = radius_km * search_data.radius_multiplier
+    # Split widely spread groups into clusters, each with its own circle
+    # (cluster circles are always MECs, so center_mode applies to single-area searches only)
+    circles = [(center_lat, center_lng, radius_km)]
+    center_mode = search_data.center_mode
+    using_custom_center = search_data.custom_center_lat is not None and search_data.custom_center_lng is not None
+    if search_data.cluster_count > 1 and not using_custom_center:
+        clusters = compute_cluster_mecs(
+            locations, search_data.cluster_count, projection_cache.get(event_id, locations)
+        )
+        circles = [(lat, lng, radius) for lat, lng, radius, _ in clusters]
+        center_mode = "mec"
+        print(f"🧩 Searching {len(circles)} clusters: radii {', '.join(f'{r:.2f}km' for _, _, r in circles)}")
 
-    # Check if center was adjusted (snapped)
-    was_snapped = abs(search_center_lat - center_lat) > 0.0001 or abs(search_center_lng - center_lng) > 0.0001
-
-    # Log if center was adjusted
-    if was_snapped:
-        print(f"🌊 Center adjusted from water ({center_lat:.6f}, {center_lng:.6f}) to land ({search_center_lat:.6f}, {search_center_lng:.6f})")
+    # Snap each search center to land (concurrently for clusters)
+    search_areas = await asyncio.gather(*[
+        _snap_search_area(lat, lng, radius, search_data.radius_multiplier, locations)
+        for lat, lng, radius in circles
+    ])
 
     # Clear previous search results (system-added candidates only)
     # This ensures each search shows only new results, not accumulated ones
@@ -114,77 +123,196 @@ async def search_candidates(
     ).delete(synchronize_session=False)
     db.commit()
 
-    # Search Google Places using land-based center
-    places = await google_maps_service.search_places_nearby(
-        lat=search_center_lat,
-        lng=search_center_lng,
-        radius=search_radius,
-        keyword=search_data.keyword
-    )
+    # Start a new search generation; progressive pages of older searches are dropped
+    generation = next(_search_generations)
+    _active_searches[event_id] = generation
 
-    # Store new candidates in database and track all place IDs
-    place_ids_from_search = []
-    for place in places:
-        place_ids_from_search.append(place["place_id"])
+    # Large circles can be covered by hexagonal tiles instead of one query
+    if search_data.tiled:
+        search_places = google_maps_service.search_places_tiled
+        iter_places = google_maps_service.iter_places_tiled
+    else:
+        search_places = google_maps_service.search_places_nearby
+        iter_places = google_maps_service.iter_places_nearby
+
+    seen_place_ids = set()
+    remaining_pages = []
+    if search_data.progressive:
+        # Only wait for the first page (or tile) of each area; the rest is appended in the background
+        page_iterators = [
+            iter_places(
+                lat=area.center_lat,
+                lng=area.center_lng,
+                radius=area.radius_km,
+                keyword=search_data.keyword
+            )
+            for area in search_areas
+        ]
+        first_pages = await asyncio.gather(*[_first_page(pages) for pages in page_iterators])
+        results = [page for page, _ in first_pages]
+        remaining_pages = [pages for pages, (_, exhausted) in zip(page_iterators, first_pages) if not exhausted]
+    else:
+        # Search Google Places around each land-based center concurrently
+        results = await asyncio.gather(*[
+            search_places(
+                lat=area.center_lat,
+                lng=area.center_lng,
+                radius=area.radius_km,
+                keyword=search_data.keyword
+            )
+            for area in search_areas
+        ])
 
-        # Check if already exists
-        existing = db.query(Candidate).filter(
-            Candidate.event_id == event_id,
-            Candidate.place_id == place["place_id"]
-        ).first()
+    places = _merge_new_places(results, seen_place_ids)
+    place_ids_from_search = _store_candidates(db, event_id, places, search_areas, circles)
+    responses = _search_candidate_responses(db, event_id, place_ids_from_search, search_data.only_in_circle)
+    complete = not remaining_pages
 
-        if existing:
-            continue
+    # Broadcast candidates added
+    await sse_manager.broadcast(event_id, "candidates_added", {
+        "count": len(responses),
+        "keyword": search_data.keyword,
+        "only_in_circle": search_data.only_in_circle,
+        "progressive": search_data.progressive,
+        "complete": complete
+    })
 
-        # Calculate distance from land-based center
-        distance = haversine_distance(
-            search_center_lat, search_center_lng,
-            place["lat"], place["lng"]
+    if complete:
+        _active_searches.pop(event_id, None)
+        # Fetch formatted addresses and opening hours after responding (billable: capped per search)
+        if settings.PLACE_DETAILS_ENRICHMENT:
+            background_tasks.add_task(
+                enrich_candidates, event_id, place_ids_from_search[:settings.PLACE_DETAILS_ENRICHMENT_MAX_PLACES]
+            )
+    else:
+        print(f"⏩ Returning {len(responses)} candidates from the first page, appending the rest in the background")
+        background_tasks.add_task(
+            _append_remaining_pages,
+            event_id, generation, remaining_pages, seen_place_ids, search_areas, circles, search_data,
+            place_ids_from_search
         )
 
-        # Check if in circle (use original MEC radius)
-        in_circle = distance <= radius_km
-
-        # Create candidate
-        candidate = Candidate(
-            id=f"cand_{event_id}_{place['place_id'][:12]}",
-            event_id=event_id,
-            place_id=place["place_id"],
-            name=place["name"],
-            address=place["address"],
-            lat=place["lat"],
-            lng=place["lng"],
-            rating=place.get("rating"),
-            user_ratings_total=place.get("user_ratings_total", 0),
-            distance_from_center=distance,
-            in_circle=in_circle,
-            opening_hours=json.dumps(place.get("opening_hours")) if place.get("opening_hours") else None,
-            added_by="system"
-        )
+    # Search area metadata (per cluster when clustering)
+    for area in search_areas:
+        area.center_mode = center_mode
 
-        db.add(candidate)
+    return CandidateSearchResponse(
+        candidates=responses,
+        search_area=search_areas[0],
+        cluster_areas=search_areas if len(search_areas) > 1 else None,
+        complete=complete
+    )
 
-    db.commit()
+
+def _merge_new_places(results: List[List[Place]], seen_place_ids: Set[str]) -> List[Place]:
+    """Merge place lists, skipping place IDs already seen (seen_place_ids is updated)."""
+    places = []
+    for area_places in results:
+        for place in area_places:
+            if place.place_id not in seen_place_ids:
+                seen_place_ids.add(place.place_id)
+                places.append(place)
+    return places
+
+
+def _candidate_id(event_id: str, place_id: str) -> str:
+    """Candidate primary key for a place (the full place ID, so distinct places never collide)."""
+    return f"cand_{event_id}_{place_id}"
+
+
+def _store_candidates(
+    db: Session,
+    event_id: str,
+    places: List[Place],
+    search_areas: List[SearchAreaInfo],
+    circles: List[Tuple[float, float, float]]
+) -> List[str]:
+    """
+    Store search results as system candidates.
+
+    Args:
+        db: Database session
+        event_id: Event ID
+        places: Places from the search
+        search_areas: Snapped search areas (distances are to the nearest center)
+        circles: Original circles (in_circle uses any of their radii)
+
+    Returns:
+        Place IDs of all places, including ones that already were candidates
+    """
+    if not places:
+        return []
+
+    # Distances from every place to every search center in one vectorized pass
+    distance_matrix = geo_kernels.haversine_matrix(
+        [place.lat for place in places],
+        [place.lng for place in places],
+        [area.center_lat for area in search_areas],
+        [area.center_lng for area in search_areas]
+    )
+    distances = distance_matrix.min(axis=1)
+
+    # Check if in circle (use original MEC radius of any cluster)
+    circle_radii = np.array([radius for _, _, radius in circles])
+    in_circle_flags = (distance_matrix <= circle_radii).any(axis=1)
+
+    # Insert the places that are not candidates yet in one statement
+    place_ids = [place.place_id for place in places]
+    existing = {
+        place_id for (place_id,) in db.query(Candidate.place_id).filter(
+            Candidate.event_id == event_id,
+            Candidate.place_id.in_(place_ids)
+        )
+    }
+
+    rows = {}
+    for place, distance, in_circle in zip(places, distances.tolist(), in_circle_flags.tolist()):
+        candidate_id = _candidate_id(event_id, place.place_id)
+        if place.place_id in existing or candidate_id in rows:
+            continue
+        rows[candidate_id] = {
+            "id": candidate_id,
+            "event_id": event_id,
+            "place_id": place.place_id,
+            "name": place.name,
+            "address": place.address,
+            "lat": place.lat,
+            "lng": place.lng,
+            "rating": place.rating,
+            "user_ratings_total": place.user_ratings_total,
+            "distance_from_center": distance,
+            "in_circle": in_circle,
+            "opening_hours": json.dumps(place.opening_hours) if place.opening_hours else None,
+            "added_by": "system",
+        }
+    if rows:
+        db.execute(insert(Candidate), list(rows.values()))
+        db.commit()
+    return place_ids
+
+
+def _search_candidate_responses(
+    db: Session,
+    event_id: str,
+    place_ids: List[str],
+    only_in_circle: bool
+) -> List[CandidateResponse]:
+    """Load the candidates of a search (optionally in-circle only) with their vote counts."""
+    if not place_ids:
+        return []
 
     # Fetch candidates from this search
     query = db.query(Candidate).filter(
         Candidate.event_id == event_id,
-        Candidate.place_id.in_(place_ids_from_search)
+        Candidate.place_id.in_(place_ids)
     )
 
     # Filter to only in-circle candidates if requested
-    if search_data.only_in_circle:
+    if only_in_circle:
         query = query.filter(Candidate.in_circle == True)
 
     candidates = query.all()
 
-    # Broadcast candidates added
-    await sse_manager.broadcast(event_id, "candidates_added", {
-        "count": len(candidates),
-        "keyword": search_data.keyword,
-        "only_in_circle": search_data.only_in_circle
-    })
-
     # Get vote counts
     candidate_ids = [c.id for c in candidates]
     vote_count_map = {}
@@ -219,32 +347,169 @@ async def search_candidates(
             vote_count=vote_count_map.get(c.id, 0)
         ))
 
-    # Build search area metadata
-    search_area = SearchAreaInfo(
+    return responses
+
+
+async def _first_page(pages: AsyncIterator[Tuple[List[Place], bool]]) -> Tuple[List[Place], bool]:
+    """First batch of a progressive search, and whether the search is already exhausted."""
+    try:
+        return await pages.__anext__()
+    except StopAsyncIteration:
+        return [], True
+
+
+async def _append_remaining_pages(
+    event_id: str,
+    generation: int,
+    remaining_pages: List[AsyncIterator[Tuple[List[Place], bool]]],
+    seen_place_ids: Set[str],
+    search_areas: List[SearchAreaInfo],
+    circles: List[Tuple[float, float, float]],
+    search_data: CandidateSearch,
+    first_place_ids: List[str]
+) -> None:
+    """
+    Store the later pages of a progressive search as they arrive (runs after the response).
+
+    Each batch is broadcast as a candidates_added event carrying its candidates;
+    a final event with complete=True marks the end of the search. Pages of a
+    search that has been superseded by a newer search of the event are dropped.
+    Place Details enrichment runs once after the last page, for the first
+    PLACE_DETAILS_ENRICHMENT_MAX_PLACES places of the search, so clients get
+    a single candidates_enriched event.
+
+    Args:
+        event_id: Event ID
+        generation: Search generation that started these pages
+        remaining_pages: Page iterators of areas with more pages to come
+        seen_place_ids: Place IDs already stored by this search
+        search_areas, circles: As for _store_candidates
+        search_data: The original search request
+        first_place_ids: Place IDs stored from the first page (to enrich)
+    """
+    db = SessionLocal()
+    added = 0
+    to_enrich = first_place_ids[:settings.PLACE_DETAILS_ENRICHMENT_MAX_PLACES]
+
+    async def append_area(pages: AsyncIterator[Tuple[List[Place], bool]]) -> None:
+        nonlocal added
+        async for page, _ in pages:
+            if _active_searches.get(event_id) != generation:
+                return
+
+            places = _merge_new_places([page], seen_place_ids)
+            place_ids = _store_candidates(db, event_id, places, search_areas, circles)
+            to_enrich.extend(place_ids[:settings.PLACE_DETAILS_ENRICHMENT_MAX_PLACES - len(to_enrich)])
+            responses = _search_candidate_responses(db, event_id, place_ids, search_data.only_in_circle)
+            if not responses:
+                continue
+
+            added += len(responses)
+            await sse_manager.broadcast(event_id, "candidates_added", {
+                "count": len(responses),
+                "keyword": search_data.keyword,
+                "only_in_circle": search_data.only_in_circle,
+                "progressive": True,
+                "complete": False,
+                "candidates": [response.model_dump() for response in responses]
+            })
+
+    try:
+        results = await asyncio.gather(*[append_area(pages) for pages in remaining_pages], return_exceptions=True)
+        for error in results:
+            if isinstance(error, Exception):
+                print(f"⚠️  Progressive search page failed for event {event_id}: {error}")
+    finally:
+        db.close()
+
+    if settings.PLACE_DETAILS_ENRICHMENT and to_enrich:
+        try:
+            await enrich_candidates(event_id, to_enrich)
+        except Exception as error:
+            print(f"⚠️  Place details enrichment failed for event {event_id}: {error}")
+
+    if _active_searches.get(event_id) == generation:
+        del _active_searches[event_id]
+        print(f"✅ Progressive search for event {event_id} appended {added} more candidates")
+        await sse_manager.broadcast(event_id, "candidates_added", {
+            "count": 0,
+            "keyword": search_data.keyword,
+            "only_in_circle": search_data.only_in_circle,
+            "progressive": True,
+            "complete": True
+        })
+
+
+async def _snap_search_area(
+    center_lat: float,
+    center_lng: float,
+    radius_km: float,
+    radius_multiplier: float,
+    land_hints: List[Tuple[float, float]]
+) -> SearchAreaInfo:
+    """
+    Snap a search center to land and build its search area metadata.
+
+    Args:
+        center_lat, center_lng: Circle center
+        radius_km: Circle radius
+        radius_multiplier: Factor applied to the radius for searching
+        land_hints: Participant locations (known land; nearby centers skip the geocode)
+
+    Returns:
+        SearchAreaInfo with the land-based center and search radius
+    """
+    # Snap center point to land (avoid water)
+    # This ensures the search center is always on land
+    land_center = await google_maps_service.snap_to_land(
+        lat=center_lat,
+        lng=center_lng,
+        max_radius=min(radius_km * 2, 10.0),  # Search up to 2x MEC radius or 10km
+        land_hints=land_hints
+    )
+
+    # Use land-based center for search
+    search_center_lat = land_center["lat"]
+    search_center_lng = land_center["lng"]
+
+    # Check if center was adjusted (snapped)
+    was_snapped = abs(search_center_lat - center_lat) > 0.0001 or abs(search_center_lng - center_lng) > 0.0001
+
+    # Log if center was adjusted
+    if was_snapped:
+        print(f"🌊 Center adjusted from water ({center_lat:.6f}, {center_lng:.6f}) to land ({search_center_lat:.6f}, {search_center_lng:.6f})")
+
+    return SearchAreaInfo(
         center_lat=search_center_lat,
         center_lng=search_center_lng,
-        radius_km=search_radius,
+        radius_km=radius_km * radius_multiplier,
         was_snapped=was_snapped,
-        original_center_lat=original_center_lat if was_snapped else None,
-        original_center_lng=original_center_lng if was_snapped else None
-    )
-
-    return CandidateSearchResponse(
-        candidates=responses,
-        search_area=search_area
+        original_center_lat=center_lat if was_snapped else None,
+        original_center_lng=center_lng if was_snapped else None
     )
 
 
 @router.get("/events/{event_id}/candidates", response_model=List[CandidateResponse])
 async def get_candidates(
     event_id: str,
-    sort_by: Optional[str] = "rating",  # rating or distance
+    sort_by: Optional[str] = "rating",  # rating, distance, fairness or score
+    fairness: bool = False,  # Include travel fairness stats without sorting by them
+    limit: Optional[int] = Query(None, ge=1, le=200),  # Return only the top N
     db: Session = Depends(get_db)
 ):
     """
     Get all candidates for an event with sorting.
 
     M2-05: Candidate Ranking API
+
+    sort_by=fairness orders candidates by the longest trip any participant
+    must make (then by mean trip), computed from the full participants x
+    candidates distance matrix.
+
+    sort_by=score orders candidates by a weighted composite of rating,
+    number of ratings, distance, in-circle and live votes. Scores are
+    computed from a few columns of every candidate, and only the top
+    `limit` candidates are loaded and returned.
     """
     # Check if event exists
     event = db.query(Event).filter(
@@ -258,34 +523,101 @@ async def get_candidates(
             detail="Event not found"
         )
 
-    # Get candidates
-    query = db.query(Candidate).filter(Candidate.event_id == event_id)
+    score_map = {}
+    vote_count_map = None
+
+    if sort_by == "score":
+        rows = db.query(
+            Candidate.id,
+            Candidate.rating,
+            Candidate.user_ratings_total,
+            Candidate.distance_from_center,
+            Candidate.in_circle
+        ).filter(Candidate.event_id == event_id).all()
+
+        # Live votes for the whole pool feed the score
+        vote_count_map = dict(
+            db.query(Vote.candidate_id, func.count(Vote.id)).filter(
+                Vote.event_id == event_id
+            ).group_by(Vote.candidate_id).all()
+        )
+
+        scores = compute_scores(
+            [row.rating for row in rows],
+            [row.user_ratings_total for row in rows],
+            [row.distance_from_center for row in rows],
+            [bool(row.in_circle) for row in rows],
+            [vote_count_map.get(row.id, 0) for row in rows]
+        )
+        order = top_k(scores, limit)
+        score_map = {rows[i].id: float(scores[i]) for i in order}
+
+        # Load full rows for the selected candidates only, in rank order
+        by_id = {
+            c.id: c for c in db.query(Candidate).filter(Candidate.id.in_(list(score_map))).all()
+        } if score_map else {}
+        candidates = [by_id[cid] for cid in score_map if cid in by_id]
+    else:
+        # Get candidates
+        query = db.query(Candidate).filter(Candidate.event_id == event_id)
+
+        # Apply sorting
+        if sort_by == "distance":
+            query = query.order_by(Candidate.distance_from_center.asc())
+        elif sort_by != "fairness":  # rating
+            query = query.order_by(Candidate.rating.desc())
+
+        if limit and sort_by != "fairness":
+            query = query.limit(limit)
+
+        candidates = query.all()
+
+    # Compute travel fairness per candidate
+    fairness_map = {}
+    if (fairness or sort_by == "fairness") and candidates:
+        participant_locations = db.query(Participant.lat, Participant.lng).filter(
+            Participant.event_id == event_id
+        ).all()
+
+        max_km, mean_km, stddev_km = compute_travel_fairness(
+            [(lat, lng) for lat, lng in participant_locations],
+            [(c.lat, c.lng) for c in candidates]
+        )
 
-    # Apply sorting
-    if sort_by == "distance":
-        query = query.order_by(Candidate.distance_from_center.asc())
-    else:  # rating
-        query = query.order_by(Candidate.rating.desc())
+        if participant_locations:
+            if sort_by == "fairness":
+                # Smallest worst-case trip first, ties broken by mean trip
+                order = np.lexsort((mean_km, max_km))[:limit]
+                candidates = [candidates[i] for i in order]
+                max_km, mean_km, stddev_km = max_km[order], mean_km[order], stddev_km[order]
 
-    candidates = query.all()
+            fairness_map = {
+                c.id: stats
+                for c, stats in zip(candidates, zip(max_km.tolist(), mean_km.tolist(), stddev_km.tolist()))
+            }
+
+    if sort_by == "fairness" and limit:
+        candidates = candidates[:limit]
 
     # Get vote counts
     candidate_ids = [c.id for c in candidates]
-    vote_count_map = {}
 
-    if candidate_ids:
-        vote_counts = db.query(
-            Vote.candidate_id,
-            func.count(Vote.id).label("vote_count")
-        ).filter(
-            Vote.candidate_id.in_(candidate_ids)
-        ).group_by(Vote.candidate_id).all()
+    if vote_count_map is None:
+        vote_count_map = {}
+        if candidate_ids:
+            vote_counts = db.query(
+                Vote.candidate_id,
+                func.count(Vote.id).label("vote_count")
+            ).filter(
+                Vote.candidate_id.in_(candidate_ids)
+            ).group_by(Vote.candidate_id).all()
 
-        vote_count_map = {cid: count for cid, count in vote_counts}
+            vote_count_map = {cid: count for cid, count in vote_counts}
 
     # Build responses
     responses = []
     for c in candidates:
+        max_distance, mean_distance, stddev_distance = fairness_map.get(c.id, (None, None, None))
         responses.append(CandidateResponse(
             id=c.id,
             event_id=c.event_id,
@@ -300,7 +632,11 @@ async def get_candidates(
             in_circle=c.in_circle,
             opening_hours=c.opening_hours,
             added_by=c.added_by,
-            vote_count=vote_count_map.get(c.id, 0)
+            vote_count=vote_count_map.get(c.id, 0),
+            max_distance_km=max_distance,
+            mean_distance_km=mean_distance,
+            stddev_distance_km=stddev_distance,
+            score=score_map.get(c.id)
         ))
 
     return responses
@@ -343,7 +679,7 @@ async def add_candidate_manually(
 
     # Create candidate
     candidate = Candidate(
-        id=f"cand_{event_id}_{candidate_data.place_id[:12]}",
+        id=_candidate_id(event_id, candidate_data.place_id),
         event_id=event_id,
         place_id=candidate_data.place_id,
         name=candidate_data.name,
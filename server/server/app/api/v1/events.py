@@ -1,6 +1,6 @@
 """API endpoints for event management."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import List, Optional
@@ -9,12 +9,15 @@ from app.db.base import get_db
 from app.models.event import Event, Participant, Candidate, Vote
 from app.models.user import User
 from app.schemas.event import (
-    EventCreate, EventResponse, EventJoinResponse, EventUpdate, EventPublish, EventAnalysis, CircleInfo
+    EventCreate, EventResponse, EventJoinResponse, EventUpdate, EventPublish, EventAnalysis, CircleInfo, ClusterInfo
 )
 from app.core.security import create_event_token, create_event_id
 from app.core.config import settings
 from app.services.sse import sse_manager
-from app.services.algorithms import compute_centroid, compute_mec
+from app.services.mec_state import mec_state_values, read_event_mec
+from app.services.center_solvers import solve_center
+from app.services.algorithms import compute_cluster_mecs
+from app.services.projection import projection_cache
 from app.api.v1.auth import get_current_user
 
 router = APIRouter()
@@ -49,7 +52,8 @@ async def create_event(
         visibility=event_data.visibility,
         allow_vote=event_data.allow_vote,
         expires_at=expires_at,
-        created_by=current_user.id if current_user else None  # Link to user if authenticated
+        created_by=current_user.id if current_user else None,  # Link to user if authenticated
+        **mec_state_values([], [])  # No participants yet
     )
 
     db.add(event)
@@ -212,10 +216,17 @@ async def delete_event(
 @router.get("/events/{event_id}/analysis", response_model=EventAnalysis)
 async def get_event_analysis(
     event_id: str,
+    center_mode: str = Query("mec", pattern="^(mec|centroid|median|minimax)$"),
+    clusters: int = Query(1, ge=1, le=5),
     db: Session = Depends(get_db)
 ):
     """
     Get event analysis including MEC calculations.
+
+    center_mode selects the meeting-center solver (see app.services.center_solvers).
+    The default MEC is read from the cached state; other modes are solved on demand.
+    clusters > 1 also partitions participants into up to that many groups,
+    each with its own enclosing circle.
     """
     event = db.query(Event).filter(
         Event.id == event_id,
@@ -228,21 +239,23 @@ async def get_event_analysis(
             detail="Event not found"
         )
 
-    # Get participants
-    participants = db.query(Participant).filter(
-        Participant.event_id == event_id
-    ).all()
+    # Read the cached MEC (maintained on participant join, update and leave)
+    mec_result, participant_count = read_event_mec(db, event)
 
-    # Get candidates
-    candidates = db.query(Candidate).filter(
+    candidate_count = db.query(Candidate).filter(
         Candidate.event_id == event_id
-    ).all()
+    ).count()
+
+    locations = []
+    if center_mode != "mec" or clusters > 1:
+        locations = [
+            (lat, lng) for lat, lng in db.query(Participant.lat, Participant.lng).filter(
+                Participant.event_id == event_id
+            ).all()
+        ]
 
-    # Compute MEC if we have participants
     circle = None
-    if len(participants) >= 1:
-        locations = [(p.lat, p.lng) for p in participants]
-        mec_result = compute_mec(locations)
+    if center_mode == "mec":
         if mec_result:
             center_lat, center_lng, radius_km = mec_result
             circle = CircleInfo(
@@ -250,10 +263,36 @@ async def get_event_analysis(
                 center_lng=center_lng,
                 radius_km=radius_km
             )
+    else:
+        solution = solve_center(locations, center_mode, projection_cache.get(event_id, locations))
+        if solution:
+            circle = CircleInfo(
+                center_lat=solution.center_lat,
+                center_lng=solution.center_lng,
+                radius_km=solution.radius_km,
+                mode=solution.mode,
+                iterations=solution.iterations,
+                solve_ms=solution.solve_ms
+            )
+
+    cluster_infos = None
+    if clusters > 1 and locations:
+        cluster_infos = [
+            ClusterInfo(
+                center_lat=center_lat,
+                center_lng=center_lng,
+                radius_km=radius_km,
+                participant_count=len(members)
+            )
+            for center_lat, center_lng, radius_km, members in compute_cluster_mecs(
+                locations, clusters, projection_cache.get(event_id, locations)
+            )
+        ]
 
     return EventAnalysis(
         event_id=event_id,
-        participant_count=len(participants),
-        candidate_count=len(candidates),
-        circle=circle
+        participant_count=participant_count,
+        candidate_count=candidate_count,
+        circle=circle,
+        clusters=cluster_infos
     )
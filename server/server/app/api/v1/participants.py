@@ -10,6 +10,7 @@ from app.schemas.event import ParticipantCreate, ParticipantUpdate, ParticipantR
 from app.core.security import generate_participant_id
 from app.services.sse import sse_manager
 from app.services.algorithms import apply_fuzzing
+from app.services.mec_state import on_participant_added, on_participant_moved, on_participant_removed
 
 router = APIRouter()
 
@@ -25,11 +26,12 @@ async def add_participant(
 
     M2-02: Participant Location Submission
     """
-    # Check if event exists and is not deleted
+    # Check if event exists and is not deleted; lock its row so concurrent
+    # participant changes update the cached MEC one at a time
     event = db.query(Event).filter(
         Event.id == event_id,
         Event.deleted_at.is_(None)
-    ).first()
+    ).with_for_update().first()
 
     if not event:
         raise HTTPException(
@@ -65,6 +67,10 @@ async def add_participant(
     )
 
     db.add(participant)
+
+    # Keep the cached MEC in step with the participant set
+    on_participant_added(db, event, participant)
+
     db.commit()
     db.refresh(participant)
 
@@ -139,11 +145,11 @@ async def update_participant(
     """
     Update participant location or name.
     """
-    # Check if event exists
+    # Check if event exists; lock its row (the cached MEC may be rebuilt below)
     event = db.query(Event).filter(
         Event.id == event_id,
         Event.deleted_at.is_(None)
-    ).first()
+    ).with_for_update().first()
 
     if not event:
         raise HTTPException(
@@ -177,6 +183,9 @@ async def update_participant(
             participant.fuzzy_lat = update_data.lat
             participant.fuzzy_lng = update_data.lng
 
+        # Keep the cached MEC in step with the participant set
+        on_participant_moved(db, event, participant)
+
     if update_data.name is not None:
         participant.name = update_data.name
 
@@ -210,6 +219,19 @@ async def remove_participant(
     """
     Remove a participant from an event.
     """
+    # Lock the event row before touching participants, so the cached MEC
+    # update below does not race with concurrent joins or moves
+    event = db.query(Event).filter(
+        Event.id == event_id,
+        Event.deleted_at.is_(None)
+    ).with_for_update().first()
+
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+
     participant = db.query(Participant).filter(
         Participant.id == participant_id,
         Participant.event_id == event_id
@@ -222,6 +244,10 @@ async def remove_participant(
         )
 
     db.delete(participant)
+
+    # Keep the cached MEC in step with the participant set
+    on_participant_removed(db, event, participant_id)
+
     db.commit()
 
     # Broadcast participant left
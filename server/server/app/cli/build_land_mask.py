@@ -0,0 +1,40 @@
+"""Build the offline land/water mask from land polygons.
+
+Input is a GeoJSON file of land polygons (e.g. Natural Earth
+ne_10m_land.geojson, or OSM land polygons converted to GeoJSON). Point
+LAND_MASK_PATH at the output file to use it.
+
+Usage:
+    python -m app.cli.build_land_mask land.geojson land_mask.bin [--pixels-per-degree N] [--tile-size N] [--bbox W,S,E,N]
+"""
+
+import argparse
+import os
+import time
+
+from app.services.land_mask import build_land_mask
+
+
+def main() -> None:
+    """Parse arguments and build the mask."""
+    parser = argparse.ArgumentParser(description="Rasterize land polygons into a tiled land/water mask.")
+    parser.add_argument("geojson", help="Land polygons (GeoJSON)")
+    parser.add_argument("output", help="Output mask file")
+    parser.add_argument("--pixels-per-degree", type=int, default=120, help="Resolution (120 = ~0.93 km pixels)")
+    parser.add_argument("--tile-size", type=int, default=256, help="Tile edge in pixels (multiple of 4)")
+    parser.add_argument("--bbox", help="Only build min_lng,min_lat,max_lng,max_lat (elsewhere falls back to geocoding)")
+    args = parser.parse_args()
+
+    bbox = tuple(float(v) for v in args.bbox.split(",")) if args.bbox else None
+
+    started = time.perf_counter()
+    stats = build_land_mask(args.geojson, args.output, args.pixels_per_degree, args.tile_size, bbox)
+    elapsed = time.perf_counter() - started
+
+    size_mb = os.path.getsize(args.output) / 1024 / 1024
+    print(f"✅ Built {args.output} ({size_mb:.1f} MB) in {elapsed:.2f}s: "
+          f"{stats['stored_tiles']} stored tiles of {stats['built_tiles']} built, {stats['total_tiles']} total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Recompute the cached MEC state of all live events.
+
+Usage:
+    python -m app.cli.reprocess_events [--workers N] [--chunk-size N] [--event-id ID ...]
+"""
+
+import argparse
+import os
+import time
+
+from app.services.batch_analysis import DEFAULT_CHUNK_SIZE, reprocess_events
+
+
+def main() -> None:
+    """Parse arguments and run the batch reprocess."""
+    parser = argparse.ArgumentParser(description="Recompute cached MEC state for live events.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Events per worker task")
+    parser.add_argument("--event-id", action="append", dest="event_ids", help="Only reprocess this event (repeatable)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    updated = reprocess_events(
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        event_ids=args.event_ids
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ Reprocessed {updated} events in {elapsed:.2f}s with {args.workers} workers")
+
+
+if __name__ == "__main__":
+    main()
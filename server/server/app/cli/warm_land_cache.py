@@ -0,0 +1,66 @@
+"""Pre-classify land/water cells around live events' meeting centers.
+
+Only useful with a shared cache (LAND_CACHE_BACKEND=redis): the in-process
+memory cache does not outlive this command.
+
+Usage:
+    python -m app.cli.warm_land_cache [--with-rings] [--concurrency N] [--event-id ID ...]
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.event import Event
+from app.services.google_maps import google_maps_service, land_probe_rings
+
+
+async def warm(points, concurrency: int) -> int:
+    """Warm the cache and close the shared client."""
+    try:
+        return await google_maps_service.warm_land_cache(points, concurrency)
+    finally:
+        await google_maps_service.close()
+
+
+def main() -> None:
+    """Parse arguments and warm the land/water cache."""
+    parser = argparse.ArgumentParser(description="Warm the land/water verdict cache around live events.")
+    parser.add_argument("--with-rings", action="store_true", help="Also classify the snap-to-land probe rings")
+    parser.add_argument("--concurrency", type=int, default=4, help="Geocoding requests in flight")
+    parser.add_argument("--event-id", action="append", dest="event_ids", help="Only warm this event (repeatable)")
+    args = parser.parse_args()
+
+    if settings.LAND_CACHE_BACKEND != "redis":
+        print(f"⚠️  LAND_CACHE_BACKEND is '{settings.LAND_CACHE_BACKEND}'; warmed cells will not be shared")
+
+    db = SessionLocal()
+    try:
+        query = db.query(Event.mec_center_lat, Event.mec_center_lng).filter(
+            Event.deleted_at.is_(None),
+            Event.mec_center_lat.isnot(None)
+        )
+        if args.event_ids:
+            query = query.filter(Event.id.in_(args.event_ids))
+        centers = query.all()
+    finally:
+        db.close()
+
+    points = []
+    for lat, lng in centers:
+        points.append((lat, lng))
+        if args.with_rings:
+            for ring in land_probe_rings(lat, lng):
+                points.extend(ring)
+
+    started = time.perf_counter()
+    geocoded = asyncio.run(warm(points, args.concurrency))
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ Warmed {geocoded} cells ({len(points)} points, {len(centers)} events) in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,9 +19,74 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
     ALGORITHM: str = "HS256"
     EVENT_LINK_EXPIRY_HOURS: int = 720  # 30 days
+    METRICS_TOKEN: str = ""  # Bearer token for /metrics (empty = metrics disabled)
 
     # Google Maps API
     GOOGLE_MAPS_API_KEY: str = ""
+    GOOGLE_MAPS_BASE_URL: str = "https://maps.googleapis.com/maps/api"  # Point at a stand-in for load tests
+    GOOGLE_MAPS_PAGE_TOKEN_DELAY_SECONDS: float = 2.0  # Wait before using a next_page_token
+    GOOGLE_MAPS_HTTP2: bool = True
+    GOOGLE_MAPS_TIMEOUT_SECONDS: float = 4.0  # Per attempt
+    GOOGLE_MAPS_MAX_CONNECTIONS: int = 50
+    GOOGLE_MAPS_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    GOOGLE_MAPS_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+
+    # Google Maps resilience (retries, circuit breaker, hedging)
+    GOOGLE_MAPS_MAX_RETRIES: int = 2
+    GOOGLE_MAPS_CALL_DEADLINE_SECONDS: float = 10.0  # All attempts and backoff of one call
+    GOOGLE_MAPS_RETRY_BASE_SECONDS: float = 0.2
+    GOOGLE_MAPS_RETRY_MAX_SECONDS: float = 2.0
+    GOOGLE_MAPS_BREAKER_FAILURES: int = 5  # Consecutive failures before failing fast
+    GOOGLE_MAPS_BREAKER_RESET_SECONDS: float = 30.0
+    GOOGLE_MAPS_HEDGE_ENABLED: bool = False
+    GOOGLE_MAPS_HEDGE_DELAY_MS: float = 1000.0  # Until there are enough samples for a p95
+    GOOGLE_MAPS_HEDGE_MIN_DELAY_MS: float = 100.0
+
+    # Google Maps outbound quota (token bucket per endpoint)
+    GOOGLE_MAPS_QUOTA_BACKEND: str = "memory"  # memory (per process), redis (shared) or none
+    GOOGLE_MAPS_QUOTA_QPS: float = 50.0
+    GOOGLE_MAPS_QUOTA_BURST: int = 100
+    GOOGLE_MAPS_QUOTA_BACKGROUND_RESERVE: float = 0.5  # Share of the bucket kept for interactive calls
+    GOOGLE_MAPS_QUOTA_MAX_WAIT_SECONDS: float = 5.0
+    GOOGLE_MAPS_QUOTA_BACKGROUND_MAX_WAIT_SECONDS: float = 60.0
+
+    # Places search cache
+    PLACES_CACHE_BACKEND: str = "memory"  # memory, redis or none
+    PLACES_CACHE_MAX_ENTRIES: int = 5000
+    PLACES_CACHE_TTL_SECONDS: int = 3600  # Served fresh
+    PLACES_CACHE_STALE_SECONDS: int = 86400  # Then served stale while refreshing
+    PLACES_CACHE_NEGATIVE_TTL_SECONDS: int = 600  # ZERO_RESULTS
+    PLACES_CACHE_CELL_METERS: float = 250.0
+    PLACES_CACHE_RADIUS_STEP_KM: float = 0.25
+
+    # Tiled venue search for large circles
+    PLACES_TILE_RADIUS_KM: float = 1.5  # Preferred tile radius (grown to respect the tile cap)
+    PLACES_TILE_MAX_TILES: int = 19
+    PLACES_TILE_CONCURRENCY: int = 6
+    PLACES_TILE_TARGET_DENSITY: float = 4.0  # Venues per km2 of search circle before tiling stops
+    PLACES_TILE_MAX_RESULTS: int = 200
+
+    # Place Details enrichment of search results
+    PLACE_DETAILS_ENRICHMENT: bool = False  # Billable Place Details call per enriched candidate
+    PLACE_DETAILS_ENRICHMENT_MAX_PLACES: int = 20  # Per search
+    PLACE_DETAILS_CONCURRENCY: int = 8
+    PLACE_DETAILS_CACHE_BACKEND: str = "memory"  # memory, redis or none
+    PLACE_DETAILS_CACHE_MAX_ENTRIES: int = 10000
+    PLACE_DETAILS_CACHE_TTL_SECONDS: int = 86400
+
+    # Land/water verdict cache
+    LAND_CACHE_BACKEND: str = "memory"  # memory, redis or none
+    LAND_CACHE_MAX_ENTRIES: int = 100000
+    LAND_CACHE_CELL_METERS: float = 100.0
+    LAND_CACHE_TTL_SECONDS: int = 2592000  # 30 days
+
+    # Offline land/water mask (built with app.cli.build_land_mask; empty = disabled)
+    LAND_MASK_PATH: str = ""
+
+    # Snap-to-land probing
+    LAND_PROBE_CONCURRENCY: int = 4  # Reverse geocodes in flight per ring
+    LAND_PROBE_BUDGET_SECONDS: float = 8.0  # Give up (keep the original point) after this
+    LAND_HINT_RADIUS_KM: float = 0.5  # Points this close to a participant are taken to be on land
 
     # Application
     ENVIRONMENT: str = "development"
@@ -48,6 +113,13 @@ class Settings(BaseSettings):
     EVENT_TTL_DAYS: int = 30
     SOFT_DELETE_RETENTION_DAYS: int = 7
 
+    # Candidate Ranking (weights of the composite score, sort_by=score)
+    RANKING_WEIGHT_RATING: float = 0.35
+    RANKING_WEIGHT_POPULARITY: float = 0.15
+    RANKING_WEIGHT_PROXIMITY: float = 0.2
+    RANKING_WEIGHT_IN_CIRCLE: float = 0.1
+    RANKING_WEIGHT_VOTES: float = 0.2
+
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW_SECONDS: int = 60
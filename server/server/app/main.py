@@ -1,9 +1,20 @@
 """Main FastAPI application."""
 
-from fastapi import FastAPI
+import math
+import re
+import secrets
+import uuid
+from typing import Optional
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.core.config import settings
 from app.api.v1 import events, participants, candidates, votes, sse, auth
+from app.services.google_maps import google_maps_service
+from app.services.instrumentation import call_context, outbound_metrics
+from app.services.quota import QuotaExceededError
+from app.services.resilience import CircuitOpenError, UpstreamUnavailableError
 
 # Create FastAPI app
 app = FastAPI(
@@ -22,6 +33,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+EVENT_PATH = re.compile(r"^/api/v1/events/([^/]+)")
+
+
+@app.middleware("http")
+async def attribute_maps_calls(request: Request, call_next):
+    """Attribute Google Maps calls (including background tasks) to the event and request."""
+    match = EVENT_PATH.match(request.url.path)
+    event_id = match.group(1) if match else None
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex[:16]
+
+    with call_context(event_id, request_id):
+        response = await call_next(request)
+
+    response.headers["X-Request-ID"] = request_id
+    if event_id is not None:
+        summary = outbound_metrics.request_summary(event_id, request_id)
+        if summary is not None:
+            log.info(
+                "maps_request_cost", event_id=event_id, request_id=request_id, path=request.url.path,
+                calls=summary["calls"], upstream_ms=summary["upstream_ms"],
+                estimated_cost_usd=summary["estimated_cost_usd"], cache=summary["cache"]
+            )
+    return response
+
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
 app.include_router(events.router, prefix="/api/v1", tags=["events"])
@@ -31,6 +67,19 @@ app.include_router(votes.router, prefix="/api/v1", tags=["votes"])
 app.include_router(sse.router, prefix="/api/v1", tags=["sse"])
 
 
+@app.exception_handler(UpstreamUnavailableError)
+async def upstream_unavailable_handler(request: Request, exc: UpstreamUnavailableError):
+    """Google Maps is failing, over quota or its circuit breaker is open: fail fast with 503."""
+    headers = {}
+    if isinstance(exc, (CircuitOpenError, QuotaExceededError)):
+        headers["Retry-After"] = str(max(1, math.ceil(exc.retry_after)))
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Google Maps is temporarily unavailable, please retry shortly"},
+        headers=headers
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -47,6 +96,61 @@ async def health_check():
     return {"status": "healthy"}
 
 
+async def require_metrics_token(authorization: Optional[str] = Header(None)) -> None:
+    """
+    Guard the monitoring endpoints with METRICS_TOKEN.
+
+    Per-event summaries list event IDs, and an event ID is enough to edit
+    or delete an event, so these endpoints must never be public. Without a
+    configured token they do not exist (404).
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token.strip(), settings.METRICS_TOKEN):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+@app.get("/metrics", dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    """Runtime metrics for monitoring."""
+    return {
+        "google_maps": {
+            "pool": google_maps_service.pool_stats(),
+            "places_cache": google_maps_service.cache_stats(),
+            "details_cache": google_maps_service.details_cache_stats(),
+            "land_cache": google_maps_service.land_cache_stats(),
+            "coalescing": google_maps_service.coalescing_stats(),
+            "endpoints": google_maps_service.resilience_stats(),
+            "quota": google_maps_service.quota_stats(),
+            "outbound": google_maps_service.outbound_stats(),
+        }
+    }
+
+
+@app.get("/metrics/events", dependencies=[Depends(require_metrics_token)])
+async def event_costs(
+    limit: int = Query(20, ge=1, le=200),
+    sort_by: str = Query("calls", pattern="^(calls|upstream_ms|estimated_cost_usd)$")
+):
+    """Events with the most Google Maps calls, upstream time or estimated cost."""
+    return outbound_metrics.top_events(limit, sort_by)
+
+
+@app.get("/metrics/events/{event_id}", dependencies=[Depends(require_metrics_token)])
+async def event_cost(event_id: str):
+    """Google Maps cost summary of one event, with its most recent requests."""
+    summary = outbound_metrics.event_summary(event_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="No Google Maps calls recorded for this event")
+    return summary
+
+
 # M2-10: Structured logging setup
 import structlog
 import logging
@@ -77,9 +181,11 @@ log = structlog.get_logger()
 async def startup_event():
     """Startup event handler."""
     log.info("where2meet_api_startup", environment=settings.ENVIRONMENT)
+    await google_maps_service.open()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event handler."""
+    await google_maps_service.close()
     log.info("where2meet_api_shutdown")
@@ -20,6 +20,12 @@ class Event(Base):
     final_decision = Column(Text, nullable=True)
     custom_center_lat = Column(Float, nullable=True)  # Custom center point (dragged by host)
     custom_center_lng = Column(Float, nullable=True)
+    # Cached minimum enclosing circle of participant locations (see app.services.mec_state)
+    mec_center_lat = Column(Float, nullable=True)
+    mec_center_lng = Column(Float, nullable=True)
+    mec_radius_km = Column(Float, nullable=True)  # Exact radius, before the visibility minimum
+    mec_support = Column(Text, nullable=True)  # JSON list of boundary participant IDs
+    mec_participant_count = Column(Integer, nullable=True)  # NULL until first computed
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=True)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
@@ -85,6 +85,12 @@ class CandidateResponse(BaseModel):
     opening_hours: Optional[str]
     added_by: str
     vote_count: int = 0
+    # Travel fairness across participants (only set when requested)
+    max_distance_km: Optional[float] = None
+    mean_distance_km: Optional[float] = None
+    stddev_distance_km: Optional[float] = None
+    # Composite ranking score (only set for sort_by=score)
+    score: Optional[float] = None
 
     class Config:
         from_attributes = True
@@ -97,6 +103,10 @@ class CandidateSearch(BaseModel):
     custom_center_lat: Optional[float] = Field(None, ge=-90, le=90)  # Optional custom center point
     custom_center_lng: Optional[float] = Field(None, ge=-180, le=180)
     only_in_circle: bool = Field(default=True)  # Filter to only show venues within MEC circle
+    center_mode: str = Field(default="mec", pattern="^(mec|centroid|median|minimax)$")  # Meeting-center solver
+    cluster_count: int = Field(default=1, ge=1, le=5)  # Split spread-out groups into up to N search areas
+    progressive: bool = Field(default=False)  # Return the first page now, stream later pages over SSE
+    tiled: bool = Field(default=False)  # Cover large circles with concurrent sub-circle searches
 
 
 class CandidateAdd(BaseModel):
@@ -149,6 +159,17 @@ class CircleInfo(BaseModel):
     center_lat: float
     center_lng: float
     radius_km: float
+    mode: str = "mec"  # Solver that produced the center
+    iterations: int = 0  # Solver iterations (0 when read from the cached MEC)
+    solve_ms: float = 0.0  # Solver wall time
+
+
+class ClusterInfo(BaseModel):
+    """Schema for one participant cluster and its enclosing circle."""
+    center_lat: float
+    center_lng: float
+    radius_km: float
+    participant_count: int
 
 
 class EventAnalysis(BaseModel):
@@ -157,6 +178,7 @@ class EventAnalysis(BaseModel):
     participant_count: int
     candidate_count: int
     circle: Optional[CircleInfo]
+    clusters: Optional[List[ClusterInfo]] = None  # Set when clusters > 1 is requested
 
 
 class SearchAreaInfo(BaseModel):
@@ -165,6 +187,7 @@ class SearchAreaInfo(BaseModel):
     center_lng: float
     radius_km: float
     was_snapped: bool = False  # Whether the center was adjusted from water to land
+    center_mode: str = "mec"  # Solver that produced the center
     original_center_lat: Optional[float] = None
     original_center_lng: Optional[float] = None
 
@@ -173,3 +196,5 @@ class CandidateSearchResponse(BaseModel):
     """Schema for candidate search response with search area metadata."""
     candidates: List[CandidateResponse]
     search_area: SearchAreaInfo
+    cluster_areas: Optional[List[SearchAreaInfo]] = None  # One area per cluster when cluster_count > 1
+    complete: bool = True  # False while a progressive search is still appending pages
@@ -1,7 +1,13 @@
 """Server-side algorithm implementations for geometric calculations."""
 
 import math
-from typing import List, Tuple, Optional
+import random
+from typing import List, Tuple, Optional, Union
+
+import numpy as np
+
+from app.services import geo_kernels
+from app.services.projection import LocalProjection
 
 
 def compute_centroid(locations: List[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
@@ -20,45 +26,32 @@ def compute_centroid(locations: List[Tuple[float, float]]) -> Optional[Tuple[flo
     if len(locations) == 1:
         return locations[0]
 
-    # Convert to unit vectors
-    x_sum = 0.0
-    y_sum = 0.0
-    z_sum = 0.0
-
-    for lat, lng in locations:
-        lat_rad = math.radians(lat)
-        lng_rad = math.radians(lng)
-
-        x_sum += math.cos(lat_rad) * math.cos(lng_rad)
-        y_sum += math.cos(lat_rad) * math.sin(lng_rad)
-        z_sum += math.sin(lat_rad)
-
-    # Average
-    n = len(locations)
-    x_avg = x_sum / n
-    y_avg = y_sum / n
-    z_avg = z_sum / n
+    lats, lngs = split_locations(locations)
+    return geo_kernels.centroid(lats, lngs)
 
-    # Normalize and convert back
-    lng_rad = math.atan2(y_avg, x_avg)
-    hyp = math.sqrt(x_avg * x_avg + y_avg * y_avg)
-    lat_rad = math.atan2(z_avg, hyp)
 
-    return (math.degrees(lat_rad), math.degrees(lng_rad))
-
-
-def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+def haversine_distance(
+    lat1: float,
+    lng1: float,
+    lat2: Union[float, geo_kernels.ArrayLike],
+    lng2: Union[float, geo_kernels.ArrayLike]
+) -> Union[float, np.ndarray]:
     """
     Calculate the great circle distance between two points on Earth.
 
+    Scalar inputs take a plain math path (a NumPy round trip costs ~20x
+    more for a single pair); arrays for lat2/lng2 go to the vectorized
+    kernel and return one distance per point.
+
     Args:
         lat1, lng1: First point coordinates
-        lat2, lng2: Second point coordinates
+        lat2, lng2: Second point coordinates (scalars or arrays)
 
     Returns:
-        Distance in kilometers
+        Distance in kilometers (an array for array inputs)
     """
-    R = 6371.0  # Earth radius in km
+    if not isinstance(lat2, (int, float)) or not isinstance(lng2, (int, float)):
+        return geo_kernels.haversine((lat1, lng1), lat2, lng2)
 
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
@@ -67,93 +60,182 @@ def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
 
     a = (math.sin(dlat / 2) ** 2 +
          math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    return 2 * geo_kernels.EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
 
-    return R * c
+
+def split_locations(locations: List[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a list of (lat, lng) tuples into contiguous lat and lng arrays.
+
+    Args:
+        locations: List of (lat, lng) tuples
+
+    Returns:
+        (lats, lngs) float64 arrays
+    """
+    coords = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+    return np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1])
+
+
+# Minimum radius reported for a circle, so a single point (or a tight cluster)
+# still yields something visible on the map and usable as a search radius.
+MIN_RADIUS_KM = 1.0
+
+
+def compute_mec_with_support(
+    locations: List[Tuple[float, float]]
+) -> Optional[Tuple[float, float, float, List[int]]]:
+    """
+    Compute the exact Minimum Enclosing Circle and the points that define it.
+
+    Same algorithm as compute_mec, but the radius is not padded to
+    MIN_RADIUS_KM and the indices of the boundary (support) points are
+    returned. Removing or moving any other point cannot change the circle,
+    which is what lets callers maintain it incrementally.
+
+    Args:
+        locations: List of (lat, lng) tuples
+
+    Returns:
+        (center_lat, center_lng, radius_km, support_indices) tuple, or None if empty
+    """
+    if not locations:
+        return None
+
+    if len(locations) == 1:
+        return (locations[0][0], locations[0][1], 0.0, [0])
+
+    lats, lngs = split_locations(locations)
+    return LocalProjection(lats, lngs).mec()
 
 
 def compute_mec(locations: List[Tuple[float, float]]) -> Optional[Tuple[float, float, float]]:
     """
     Compute the Minimum Enclosing Circle using Welzl's algorithm.
 
+    Runs the iterative move-to-front form of Welzl on arrays in a local
+    planar frame (see projection.LocalProjection), so there is no recursion
+    and no per-level list copying, and containment is tested in vectorized
+    chunks.
+    Expected running time is linear in the number of points. The reported
+    radius is the largest great-circle distance from the center to any point,
+    so every location is guaranteed to be inside.
+
     Args:
         locations: List of (lat, lng) tuples
 
     Returns:
         (center_lat, center_lng, radius_km) tuple, or None if empty
     """
-    if not locations:
+    result = compute_mec_with_support(locations)
+    if result is None:
         return None
 
-    if len(locations) == 1:
-        return (locations[0][0], locations[0][1], 1.0)  # 1km minimum for visibility and search purposes
-
-    # Welzl's algorithm implementation
-    def welzl_helper(points: List[Tuple[float, float]], boundary: List[Tuple[float, float]]) -> Tuple[float, float, float]:
-        # Base cases
-        if not points or len(boundary) == 3:
-            return make_circle_from_boundary(boundary)
-
-        # Pick a random point
-        p = points[0]
-        remaining = points[1:]
-
-        # Recursively compute MEC without p
-        circle = welzl_helper(remaining, boundary)
-
-        # If p is inside the circle, return it
-        if is_inside_circle(p, circle):
-            return circle
-
-        # Otherwise, p must be on the boundary
-        return welzl_helper(remaining, boundary + [p])
-
-    def make_circle_from_boundary(boundary: List[Tuple[float, float]]) -> Tuple[float, float, float]:
-        """Create minimum circle from boundary points."""
-        if len(boundary) == 0:
-            return (0.0, 0.0, 0.0)
-        elif len(boundary) == 1:
-            return (boundary[0][0], boundary[0][1], 1.0)  # 1km minimum for visibility
-        elif len(boundary) == 2:
-            # Circle with two points as diameter
-            lat1, lng1 = boundary[0]
-            lat2, lng2 = boundary[1]
-            center_lat = (lat1 + lat2) / 2
-            center_lng = (lng1 + lng2) / 2
-            radius = haversine_distance(lat1, lng1, lat2, lng2) / 2
-            return (center_lat, center_lng, max(radius, 1.0))  # 1km minimum for visibility
-        else:
-            # Circle with three points
-            return make_circle_from_three_points(boundary[0], boundary[1], boundary[2])
-
-    def make_circle_from_three_points(
-        p1: Tuple[float, float],
-        p2: Tuple[float, float],
-        p3: Tuple[float, float]
-    ) -> Tuple[float, float, float]:
-        """Create circle from three points using circumcircle."""
-        # Simplified: use centroid and max distance
-        center_lat = (p1[0] + p2[0] + p3[0]) / 3
-        center_lng = (p1[1] + p2[1] + p3[1]) / 3
-
-        r1 = haversine_distance(center_lat, center_lng, p1[0], p1[1])
-        r2 = haversine_distance(center_lat, center_lng, p2[0], p2[1])
-        r3 = haversine_distance(center_lat, center_lng, p3[0], p3[1])
-
-        radius = max(r1, r2, r3)
-        return (center_lat, center_lng, max(radius, 1.0))  # 1km minimum for visibility
-
-    def is_inside_circle(point: Tuple[float, float], circle: Tuple[float, float, float]) -> bool:
-        """Check if point is inside circle."""
-        center_lat, center_lng, radius = circle
-        distance = haversine_distance(point[0], point[1], center_lat, center_lng)
-        return distance <= radius * 1.001  # Small tolerance for floating point
-
-    # Run Welzl's algorithm
-    import random
-    shuffled = locations.copy()
-    random.shuffle(shuffled)
-    return welzl_helper(shuffled, [])
+    center_lat, center_lng, radius, _ = result
+    return (center_lat, center_lng, max(radius, MIN_RADIUS_KM))
+
+
+def cluster_locations(
+    locations: List[Tuple[float, float]],
+    k: int,
+    projection: Optional[LocalProjection] = None
+) -> np.ndarray:
+    """
+    Partition locations into at most k groups (spherical k-center).
+
+    Uses farthest-first traversal (Gonzalez): each new cluster seed is the
+    point farthest from all existing seeds, then every point joins its
+    nearest seed. This is a 2-approximation of the smallest possible
+    largest-cluster radius. Fewer than k groups are returned when there are
+    fewer distinct locations than k. Distances are planar in the local frame.
+
+    Args:
+        locations: List of (lat, lng) tuples
+        k: Maximum number of clusters
+        projection: Cached projection of the same locations, if available
+
+    Returns:
+        Array of cluster labels (0..k-1), one per location
+    """
+    if not locations:
+        return np.zeros(0, dtype=np.int64)
+
+    if projection is None:
+        projection = LocalProjection(*split_locations(locations))
+    xs, ys = projection.xs, projection.ys
+
+    # Start from the point farthest from the centroid (the frame origin), so results are deterministic
+    seeds = [int(np.argmax(projection.distances_from(0.0, 0.0)))]
+    nearest = projection.distances_from(xs[seeds[0]], ys[seeds[0]])
+    labels = np.zeros(len(xs), dtype=np.int64)
+
+    while len(seeds) < k:
+        candidate = int(np.argmax(nearest))
+        if nearest[candidate] <= 0.0:
+            break  # Every remaining point coincides with a seed
+
+        seeds.append(candidate)
+        distances = projection.distances_from(xs[candidate], ys[candidate])
+        closer = distances < nearest
+        labels[closer] = len(seeds) - 1
+        nearest = np.minimum(nearest, distances)
+
+    return labels
+
+
+def compute_cluster_mecs(
+    locations: List[Tuple[float, float]],
+    k: int,
+    projection: Optional[LocalProjection] = None
+) -> List[Tuple[float, float, float, List[int]]]:
+    """
+    Cluster locations and compute one Minimum Enclosing Circle per cluster.
+
+    Args:
+        locations: List of (lat, lng) tuples
+        k: Maximum number of clusters
+        projection: Cached projection of the same locations, if available
+
+    Returns:
+        List of (center_lat, center_lng, radius_km, member_indices) tuples,
+        largest cluster first
+    """
+    labels = cluster_locations(locations, k, projection)
+    clusters = []
+    for label in np.unique(labels):
+        members = np.flatnonzero(labels == label).tolist()
+        center_lat, center_lng, radius_km = compute_mec([locations[i] for i in members])
+        clusters.append((center_lat, center_lng, radius_km, members))
+
+    clusters.sort(key=lambda cluster: len(cluster[3]), reverse=True)
+    return clusters
+
+
+def compute_travel_fairness(
+    participant_locations: List[Tuple[float, float]],
+    candidate_locations: List[Tuple[float, float]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Summarize how far participants must travel to each candidate.
+
+    Builds the full participants x candidates haversine matrix in one
+    vectorized pass and reduces it per candidate.
+
+    Args:
+        participant_locations: List of (lat, lng) tuples for participants
+        candidate_locations: List of (lat, lng) tuples for candidates
+
+    Returns:
+        (max_km, mean_km, stddev_km) arrays, one value per candidate
+    """
+    if not participant_locations or not candidate_locations:
+        empty = np.zeros(len(candidate_locations))
+        return empty, empty.copy(), empty.copy()
+
+    p_lats, p_lngs = split_locations(participant_locations)
+    c_lats, c_lngs = split_locations(candidate_locations)
+    matrix = geo_kernels.haversine_matrix(p_lats, p_lngs, c_lats, c_lngs)
+    return matrix.max(axis=0), matrix.mean(axis=0), matrix.std(axis=0)
 
 
 def apply_fuzzing(lat: float, lng: float, radius_km: float = 0.5) -> Tuple[float, float]:
@@ -168,8 +250,6 @@ def apply_fuzzing(lat: float, lng: float, radius_km: float = 0.5) -> Tuple[float
     Returns:
         (fuzzy_lat, fuzzy_lng) tuple
     """
-    import random
-
     # Convert km to degrees (approximate)
     lat_offset = (random.random() - 0.5) * 2 * (radius_km / 111.0)
     lng_offset = (random.random() - 0.5) * 2 * (radius_km / (111.0 * math.cos(math.radians(lat))))
@@ -0,0 +1,150 @@
+"""Batch event analysis across a process pool.
+
+Recomputing circles for many events (dashboards, backfills after an
+algorithm change) streams participants out of the database in chunks of
+events, shards the chunks across a ProcessPoolExecutor and writes the
+results back with one bulk UPDATE per chunk.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.models.event import Event, Participant
+from app.services.mec_state import mec_state_values
+
+# One event's participants: (event_id, participant_ids, locations)
+EventPoints = Tuple[str, List[str], List[Tuple[float, float]]]
+
+DEFAULT_CHUNK_SIZE = 200  # Events per worker task
+
+
+def iter_event_chunks(
+    db: Session,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    event_ids: Optional[Sequence[str]] = None
+) -> Iterator[List[EventPoints]]:
+    """
+    Stream live events with their participants, chunk_size events at a time.
+
+    Rows are read with a server-side cursor ordered by event, so memory stays
+    bounded by the chunk rather than the whole table. Events without
+    participants are included so their state is reset too.
+
+    Args:
+        db: Database session
+        chunk_size: Number of events per chunk
+        event_ids: Restrict to these events (all live events if None)
+
+    Yields:
+        Lists of (event_id, participant_ids, locations)
+    """
+    query = db.query(Event.id, Participant.id, Participant.lat, Participant.lng).outerjoin(
+        Participant, Participant.event_id == Event.id
+    ).filter(
+        Event.deleted_at.is_(None)
+    )
+
+    if event_ids is not None:
+        query = query.filter(Event.id.in_(list(event_ids)))
+
+    chunk: List[EventPoints] = []
+    current: Optional[EventPoints] = None
+
+    for event_id, participant_id, lat, lng in query.order_by(Event.id).yield_per(chunk_size * 50):
+        if current is None or current[0] != event_id:
+            if current is not None:
+                chunk.append(current)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            current = (event_id, [], [])
+
+        if participant_id is not None:
+            current[1].append(participant_id)
+            current[2].append((lat, lng))
+
+    if current is not None:
+        chunk.append(current)
+    if chunk:
+        yield chunk
+
+
+def analyze_chunk(chunk: List[EventPoints]) -> List[Dict]:
+    """
+    Compute the MEC state for a chunk of events.
+
+    Runs in worker processes, so it only touches plain data.
+
+    Returns:
+        List of Event column dicts (including "id") for a bulk UPDATE
+    """
+    results = []
+    for event_id, participant_ids, locations in chunk:
+        values = mec_state_values(participant_ids, locations)
+        values["id"] = event_id
+        results.append(values)
+    return results
+
+
+def write_results(db: Session, results: List[Dict]) -> None:
+    """Write MEC state for many events with one bulk UPDATE by primary key."""
+    if results:
+        db.execute(update(Event), results)
+        db.commit()
+
+
+def reprocess_events(
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    event_ids: Optional[Sequence[str]] = None,
+    session_factory: Callable[[], Session] = SessionLocal
+) -> int:
+    """
+    Recompute and persist the MEC state of many events in parallel.
+
+    Reads and writes use separate sessions, so committing a chunk does not
+    close the streaming cursor. At most two chunks per worker are in flight,
+    so the reader stays just ahead of the pool without buffering the table.
+
+    Args:
+        workers: Worker processes (defaults to the CPU count)
+        chunk_size: Events per worker task
+        event_ids: Restrict to these events (all live events if None)
+        session_factory: Creates database sessions
+
+    Returns:
+        Number of events updated
+    """
+    workers = workers or os.cpu_count() or 1
+    updated = 0
+
+    read_db = session_factory()
+    write_db = session_factory()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            for chunk in iter_event_chunks(read_db, chunk_size, event_ids):
+                pending.add(pool.submit(analyze_chunk, chunk))
+
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results = future.result()
+                        write_results(write_db, results)
+                        updated += len(results)
+
+            for future in pending:
+                results = future.result()
+                write_results(write_db, results)
+                updated += len(results)
+    finally:
+        read_db.close()
+        write_db.close()
+
+    return updated
+
@@ -0,0 +1,175 @@
+"""Pluggable async key/value cache with freshness windows.
+
+Entries carry two deadlines: until `fresh_until` they are served as-is;
+between `fresh_until` and `expires_at` they are stale, still served, but
+callers should refresh them in the background (stale-while-revalidate).
+Values must be JSON-serializable so the same data can live in process or
+in Redis.
+
+Backends:
+- memory: per-process LRU (OrderedDict) bounded by max_entries
+- redis: shared across workers at REDIS_URL; eviction is left to the
+  server's maxmemory-policy (allkeys-lru recommended)
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+import structlog
+
+log = structlog.get_logger()
+
+
+class CacheEntry(NamedTuple):
+    """A cached value with its freshness deadlines (epoch seconds)."""
+    value: Any
+    fresh_until: float
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+class CacheBackend:
+    """Interface of cache backends."""
+
+    name = "none"
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for key, or None if missing or expired."""
+        return None
+
+    async def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0.0) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Seconds the value is fresh
+            stale_ttl: Additional seconds the value may be served stale
+        """
+
+    async def delete(self, key: str) -> None:
+        """Remove a key."""
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend statistics for monitoring."""
+        return {"backend": self.name}
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry.expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0.0) -> None:
+        now = time.time()
+        self._entries[key] = CacheEntry(value, now + ttl, now + ttl + stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class RedisCache(CacheBackend):
+    """Redis-backed cache shared across workers."""
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "w2m:"):
+        import redis.asyncio as redis
+
+        self.prefix = prefix
+        self._redis = redis.from_url(url)
+        self.errors = 0
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            raw = await self._redis.get(self.prefix + key)
+        except Exception as e:
+            # A cache outage degrades to misses, never to failed requests
+            self.errors += 1
+            log.warning("cache_backend_error", backend=self.name, op="get", error=str(e))
+            return None
+
+        if raw is None:
+            return None
+        value, fresh_until, expires_at = json.loads(raw)
+        return CacheEntry(value, fresh_until, expires_at)
+
+    async def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0.0) -> None:
+        now = time.time()
+        payload = json.dumps([value, now + ttl, now + ttl + stale_ttl])
+        try:
+            await self._redis.set(self.prefix + key, payload, ex=max(1, int(ttl + stale_ttl)))
+        except Exception as e:
+            self.errors += 1
+            log.warning("cache_backend_error", backend=self.name, op="set", error=str(e))
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._redis.delete(self.prefix + key)
+        except Exception as e:
+            self.errors += 1
+            log.warning("cache_backend_error", backend=self.name, op="delete", error=str(e))
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "errors": self.errors}
+
+
+def create_cache(backend: str, redis_url: str, max_entries: int = 10000, prefix: str = "w2m:") -> CacheBackend:
+    """
+    Create a cache backend by name.
+
+    Args:
+        backend: "memory", "redis" or "none"
+        redis_url: Redis URL (redis backend only)
+        max_entries: LRU bound (memory backend only)
+        prefix: Key prefix (redis backend only)
+
+    Returns:
+        CacheBackend instance
+    """
+    if backend == "memory":
+        return MemoryCache(max_entries)
+    if backend == "redis":
+        return RedisCache(redis_url, prefix)
+    if backend == "none":
+        return CacheBackend()
+    raise ValueError(f"Unknown cache backend: {backend}")
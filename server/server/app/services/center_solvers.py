@@ -0,0 +1,181 @@
+"""Meeting-center solvers.
+
+Each solver takes a LocalProjection of the participants (NumPy arrays of
+coordinates plus their local frame) and returns a center plus the number
+of iterations it used. solve_center wraps any of them into the same
+(center, enclosing radius, iterations, solve time) shape.
+
+Modes:
+- mec: center of the minimum enclosing circle (Welzl)
+- centroid: spherical centroid
+- median: geometric median, minimizing total travel (Weiszfeld)
+- minimax: minimizes the longest trip, measured on the sphere
+"""
+
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import structlog
+
+from app.services import geo_kernels
+from app.services.algorithms import MIN_RADIUS_KM, split_locations
+from app.services.projection import LocalProjection
+
+log = structlog.get_logger()
+
+CENTER_MODES = ("mec", "centroid", "median", "minimax")
+
+# Convergence limits
+MAX_ITERATIONS = 200
+TOLERANCE_KM = 1e-3  # Stop once a step moves the center less than 1 m
+
+
+class CenterSolution(NamedTuple):
+    """Result of a center solver."""
+    center_lat: float
+    center_lng: float
+    radius_km: float  # Smallest radius around the center enclosing every participant
+    mode: str
+    iterations: int
+    solve_ms: float
+
+
+def _solve_mec(projection: LocalProjection) -> Tuple[float, float, int]:
+    """Center of the minimum enclosing circle."""
+    center_lat, center_lng, _, _ = projection.mec()
+    return center_lat, center_lng, 1
+
+
+def _solve_centroid(projection: LocalProjection) -> Tuple[float, float, int]:
+    """Spherical centroid (the origin of the projection frame)."""
+    return projection.ref_lat, projection.ref_lng, 1
+
+
+def _solve_median(projection: LocalProjection) -> Tuple[float, float, int]:
+    """
+    Geometric median by Weiszfeld's algorithm on ECEF vectors.
+
+    Minimizes the sum of chord distances (equal to great-circle distances to
+    well under a meter at city scale), starting from the centroid. The
+    result is projected back onto the sphere.
+    """
+    points = geo_kernels.to_ecef(projection.lats, projection.lngs)
+    center = points.mean(axis=0)
+    tolerance = TOLERANCE_KM / geo_kernels.EARTH_RADIUS_KM
+
+    iterations = 0
+    while iterations < MAX_ITERATIONS:
+        iterations += 1
+        distances = np.linalg.norm(points - center, axis=1)
+        # Guard against the center landing exactly on a participant
+        weights = 1.0 / np.maximum(distances, 1e-12)
+        updated = weights @ points / weights.sum()
+        step = np.linalg.norm(updated - center)
+        center = updated
+        if step < tolerance:
+            break
+
+    center_lats, center_lngs = geo_kernels.from_ecef(center)
+    return float(center_lats[0]), float(center_lngs[0]), iterations
+
+
+def _solve_minimax(projection: LocalProjection) -> Tuple[float, float, int]:
+    """
+    Point minimizing the longest great-circle trip.
+
+    Descends from the centroid in the local tangent plane toward the
+    participants currently farthest away, halving the step whenever it
+    fails to shrink the longest trip.
+    """
+    lats, lngs = projection.lats, projection.lngs
+    center_lat, center_lng = projection.ref_lat, projection.ref_lng
+    distances = geo_kernels.haversine((center_lat, center_lng), lats, lngs)
+    worst = float(distances.max())
+    step = worst / 2
+
+    iterations = 0
+    while iterations < MAX_ITERATIONS and step > TOLERANCE_KM:
+        iterations += 1
+
+        # Direction toward the participants that are (nearly) the farthest away
+        xs, ys = geo_kernels.project_local(lats, lngs, center_lat, center_lng)
+        active = distances >= worst - step
+        norms = np.maximum(np.hypot(xs[active], ys[active]), 1e-12)
+        dx = float(np.mean(xs[active] / norms))
+        dy = float(np.mean(ys[active] / norms))
+        length = np.hypot(dx, dy)
+        if length < 1e-9:
+            # Farthest participants surround the center: no descent direction
+            step /= 2
+            continue
+
+        trial_lats, trial_lngs = geo_kernels.unproject_local(
+            (dx / length * step,), (dy / length * step,), center_lat, center_lng
+        )
+        trial_lat, trial_lng = float(trial_lats[0]), float(trial_lngs[0])
+        trial_distances = geo_kernels.haversine((trial_lat, trial_lng), lats, lngs)
+        trial_worst = float(trial_distances.max())
+
+        if trial_worst < worst:
+            center_lat, center_lng = trial_lat, trial_lng
+            distances, worst = trial_distances, trial_worst
+        else:
+            step /= 2
+
+    return center_lat, center_lng, iterations
+
+
+SOLVERS: Dict[str, Callable[[LocalProjection], Tuple[float, float, int]]] = {
+    "mec": _solve_mec,
+    "centroid": _solve_centroid,
+    "median": _solve_median,
+    "minimax": _solve_minimax,
+}
+
+
+def solve_center(
+    locations: List[Tuple[float, float]],
+    mode: str = "mec",
+    projection: Optional[LocalProjection] = None
+) -> Optional[CenterSolution]:
+    """
+    Compute a meeting center with the selected solver.
+
+    Args:
+        locations: List of (lat, lng) tuples
+        mode: One of CENTER_MODES
+        projection: Cached projection of the same locations, if available
+
+    Returns:
+        CenterSolution, or None if there are no locations
+    """
+    if mode not in SOLVERS:
+        raise ValueError(f"Unknown center mode: {mode}")
+
+    if not locations:
+        return None
+
+    started = time.perf_counter()
+    if projection is None:
+        projection = LocalProjection(*split_locations(locations))
+    center_lat, center_lng, iterations = SOLVERS[mode](projection)
+    radius = float(geo_kernels.haversine((center_lat, center_lng), projection.lats, projection.lngs).max())
+    solve_ms = (time.perf_counter() - started) * 1000
+
+    log.info(
+        "center_solved",
+        mode=mode,
+        participants=len(locations),
+        iterations=iterations,
+        solve_ms=round(solve_ms, 3),
+    )
+
+    return CenterSolution(
+        center_lat=center_lat,
+        center_lng=center_lng,
+        radius_km=max(radius, MIN_RADIUS_KM),
+        mode=mode,
+        iterations=iterations,
+        solve_ms=solve_ms,
+    )
@@ -0,0 +1,99 @@
+"""Place Details enrichment of search results.
+
+Nearby Search only returns a short vicinity address and a bare open_now
+flag. After a search has stored its candidates, enrich_candidates fetches
+Place Details for them concurrently, writes formatted addresses and full
+opening hours back with one bulk UPDATE and pushes a single
+candidates_enriched event to the event's SSE clients.
+"""
+
+import json
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.models.event import Candidate
+from app.services.google_maps import google_maps_service
+from app.services.quota import BACKGROUND, request_priority
+from app.services.sse import sse_manager
+
+
+def candidate_updates(candidates: List[Candidate], details: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Column values to update for candidates with fetched details.
+
+    Args:
+        candidates: Candidates to enrich
+        details: Place details by place ID
+
+    Returns:
+        One dict per changed candidate, keyed by column name (including the primary key)
+    """
+    updates = []
+    for candidate in candidates:
+        place = details.get(candidate.place_id)
+        if place is None:
+            continue
+
+        values = {"id": candidate.id}
+        if place.get("address"):
+            values["address"] = place["address"]
+        if place.get("opening_hours"):
+            values["opening_hours"] = json.dumps(place["opening_hours"])
+
+        if len(values) > 1:
+            updates.append(values)
+    return updates
+
+
+async def enrich_candidates(
+    event_id: str,
+    place_ids: List[str],
+    session_factory: Callable[[], Session] = SessionLocal
+) -> int:
+    """
+    Fetch Place Details for a batch of an event's candidates and store them.
+
+    Runs after the search response (BackgroundTasks), at background quota
+    priority so it never delays interactive searches.
+
+    Args:
+        event_id: Event ID
+        place_ids: Place IDs of the candidates to enrich
+        session_factory: Creates database sessions
+
+    Returns:
+        Number of candidates updated
+    """
+    if not place_ids:
+        return 0
+
+    with request_priority(BACKGROUND):
+        details = await google_maps_service.get_places_details(place_ids)
+    if not details:
+        return 0
+
+    db = session_factory()
+    try:
+        candidates = db.query(Candidate).filter(
+            Candidate.event_id == event_id,
+            Candidate.place_id.in_(list(details))
+        ).all()
+
+        updates = candidate_updates(candidates, details)
+        if updates:
+            db.execute(update(Candidate), updates)
+            db.commit()
+    finally:
+        db.close()
+
+    if updates:
+        await sse_manager.broadcast(event_id, "candidates_enriched", {
+            "count": len(updates),
+            "candidates": updates
+        })
+        print(f"✨ Enriched {len(updates)} candidates of event {event_id} with place details")
+
+    return len(updates)
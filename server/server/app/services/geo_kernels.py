@@ -0,0 +1,154 @@
+"""Vectorized geodesy kernels on contiguous float64 arrays.
+
+All functions accept sequences or NumPy arrays of degrees and return NumPy
+arrays, so distances for thousands of points are a single call. The scalar
+helpers in app.services.algorithms are thin wrappers over these kernels.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+# Kilometers per degree of latitude on the mean-radius sphere
+KM_PER_DEGREE = np.pi * EARTH_RADIUS_KM / 180.0
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+
+def as_array(values: ArrayLike) -> np.ndarray:
+    """Return values as a contiguous 1-D float64 array (no copy if already one)."""
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+
+def wrap_longitude(lngs: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Wrap longitudes (or longitude deltas) into [-180, 180)."""
+    return (lngs + 180.0) % 360.0 - 180.0
+
+
+def haversine(center: Tuple[float, float], lats: ArrayLike, lngs: ArrayLike) -> np.ndarray:
+    """
+    Great circle distance from one point to many points.
+
+    Args:
+        center: (lat, lng) of the reference point
+        lats, lngs: Coordinates of the other points
+
+    Returns:
+        Array of distances in kilometers
+    """
+    lat0 = np.radians(center[0])
+    lng0 = np.radians(center[1])
+    lat = np.radians(as_array(lats))
+    lng = np.radians(as_array(lngs))
+
+    a = (np.sin((lat - lat0) / 2) ** 2 +
+         np.cos(lat0) * np.cos(lat) * np.sin((lng - lng0) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_matrix(
+    lats_a: ArrayLike,
+    lngs_a: ArrayLike,
+    lats_b: ArrayLike,
+    lngs_b: ArrayLike
+) -> np.ndarray:
+    """
+    Many-to-many great circle distances.
+
+    Args:
+        lats_a, lngs_a: Coordinates of the row points (n)
+        lats_b, lngs_b: Coordinates of the column points (m)
+
+    Returns:
+        (n, m) array of distances in kilometers
+    """
+    lat_a = np.radians(as_array(lats_a))[:, None]
+    lng_a = np.radians(as_array(lngs_a))[:, None]
+    lat_b = np.radians(as_array(lats_b))[None, :]
+    lng_b = np.radians(as_array(lngs_b))[None, :]
+
+    a = (np.sin((lat_b - lat_a) / 2) ** 2 +
+         np.cos(lat_a) * np.cos(lat_b) * np.sin((lng_b - lng_a) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def to_ecef(lats: ArrayLike, lngs: ArrayLike) -> np.ndarray:
+    """
+    Convert coordinates to unit-sphere ECEF vectors.
+
+    Returns:
+        (n, 3) array of x, y, z
+    """
+    lat = np.radians(as_array(lats))
+    lng = np.radians(as_array(lngs))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)))
+
+
+def from_ecef(xyz: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert ECEF vectors (any length) back to coordinates.
+
+    Returns:
+        (lats, lngs) arrays in degrees
+    """
+    xyz = np.atleast_2d(xyz)
+    x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+    lng = np.arctan2(y, x)
+    lat = np.arctan2(z, np.hypot(x, y))
+    return np.degrees(lat), np.degrees(lng)
+
+
+def centroid(lats: ArrayLike, lngs: ArrayLike) -> Optional[Tuple[float, float]]:
+    """
+    Spherical centroid (normalized mean of ECEF vectors).
+
+    Returns:
+        (lat, lng) tuple, or None if there are no points
+    """
+    xyz = to_ecef(lats, lngs)
+    if xyz.shape[0] == 0:
+        return None
+    lat, lng = from_ecef(xyz.mean(axis=0))
+    return (float(lat[0]), float(lng[0]))
+
+
+def project_local(
+    lats: ArrayLike,
+    lngs: ArrayLike,
+    ref_lat: float,
+    ref_lng: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project coordinates into a local equirectangular frame in kilometers.
+
+    Longitude deltas are wrapped so points straddling the antimeridian stay
+    contiguous around the reference point.
+
+    Returns:
+        (xs, ys) arrays in kilometers east/north of the reference point
+    """
+    kx = KM_PER_DEGREE * np.cos(np.radians(ref_lat))
+    xs = wrap_longitude(as_array(lngs) - ref_lng) * kx
+    ys = (as_array(lats) - ref_lat) * KM_PER_DEGREE
+    return xs, ys
+
+
+def unproject_local(
+    xs: ArrayLike,
+    ys: ArrayLike,
+    ref_lat: float,
+    ref_lng: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Inverse of project_local.
+
+    Returns:
+        (lats, lngs) arrays in degrees
+    """
+    kx = KM_PER_DEGREE * np.cos(np.radians(ref_lat))
+    lats = ref_lat + as_array(ys) / KM_PER_DEGREE
+    lngs = ref_lng + (as_array(xs) / kx if kx > 0 else 0.0)
+    return lats, wrap_longitude(lngs)
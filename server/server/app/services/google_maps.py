@@ -1,8 +1,61 @@
 """Google Maps API integration service."""
 
+import asyncio
+import importlib.util
+import math
+import time
+
 import httpx
-from typing import List, Dict, Any, Optional
+import orjson
+import structlog
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Optional, Sequence, Tuple
 from app.core.config import settings
+from app.services.cache import CacheBackend, create_cache
+from app.services.land_mask import AMBIGUOUS, WATER, LandMask, load_land_mask
+from app.services.resilience import (
+    CircuitOpenError,
+    EndpointHealth,
+    UpstreamUnavailableError,
+    backoff_delay,
+    hedged,
+)
+from app.services.instrumentation import outbound_metrics
+from app.services.places import Place
+from app.services.quota import BACKGROUND, INTERACTIVE, QuotaExceededError, QuotaGovernor, request_priority
+from app.services.singleflight import SingleFlight
+from app.services import geo_kernels, tiling
+
+log = structlog.get_logger()
+
+# Spiral probes around a water point: 8 directions at increasing distances
+LAND_PROBE_DIRECTIONS = [
+    (0, 1),    # North
+    (1, 1),    # NE
+    (1, 0),    # East
+    (1, -1),   # SE
+    (0, -1),   # South
+    (-1, -1),  # SW
+    (-1, 0),   # West
+    (-1, 1),   # NW
+]
+LAND_PROBE_DISTANCES_KM = [0.5, 1.0, 2.0, 3.0, 5.0]
+
+
+def land_probe_rings(lat: float, lng: float) -> List[List[Tuple[float, float]]]:
+    """
+    Probe points around a location, one ring of 8 points per distance.
+
+    Returns:
+        List of rings (nearest first), each a list of (lat, lng) tuples
+    """
+    rings = []
+    for distance_km in LAND_PROBE_DISTANCES_KM:
+        # ~111 km per degree of latitude
+        lat_offset = distance_km / 111.0
+        # Adjust longitude offset by latitude (cosine correction)
+        lng_offset = distance_km / (111.0 * math.cos(math.radians(lat)))
+        rings.append([(lat + dy * lat_offset, lng + dx * lng_offset) for dx, dy in LAND_PROBE_DIRECTIONS])
+    return rings
 
 
 class GoogleMapsService:
@@ -10,7 +63,377 @@ class GoogleMapsService:
 
     def __init__(self):
         self.api_key = settings.GOOGLE_MAPS_API_KEY
-        self.base_url = "https://maps.googleapis.com/maps/api"
+        self.base_url = settings.GOOGLE_MAPS_BASE_URL.rstrip("/")
+
+        # Shared connection pool (opened on app startup, lazily otherwise)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._requests = 0
+        self._errors = 0
+
+        # Per-endpoint circuit breakers and latency (see _get)
+        self._health: Dict[str, EndpointHealth] = {}
+
+        # Outbound rate limit per endpoint, shared across workers with the redis backend
+        self.quota = QuotaGovernor(
+            settings.GOOGLE_MAPS_QUOTA_BACKEND,
+            settings.REDIS_URL,
+            rate=settings.GOOGLE_MAPS_QUOTA_QPS,
+            burst=settings.GOOGLE_MAPS_QUOTA_BURST,
+            background_reserve=settings.GOOGLE_MAPS_QUOTA_BACKGROUND_RESERVE,
+            max_wait={
+                INTERACTIVE: settings.GOOGLE_MAPS_QUOTA_MAX_WAIT_SECONDS,
+                BACKGROUND: settings.GOOGLE_MAPS_QUOTA_BACKGROUND_MAX_WAIT_SECONDS,
+            },
+        )
+
+        # Identical concurrent upstream calls share one request
+        self._flights = {
+            "nearby_search": SingleFlight(),
+            "reverse_geocode": SingleFlight(),
+            "place_details": SingleFlight(),
+        }
+
+        # Nearby Search results cache (see search_places_nearby)
+        self.places_cache: CacheBackend = create_cache(
+            settings.PLACES_CACHE_BACKEND,
+            settings.REDIS_URL,
+            max_entries=settings.PLACES_CACHE_MAX_ENTRIES,
+            prefix="w2m:places:v2:",  # v2: rows are Place records
+        )
+        self._places_stats = {"hits": 0, "stale_hits": 0, "negative_hits": 0, "misses": 0, "refreshes": 0}
+        self._refreshing = set()
+        self._background_tasks = set()
+
+        # Place Details results by place ID (see get_place_details)
+        self.details_cache: CacheBackend = create_cache(
+            settings.PLACE_DETAILS_CACHE_BACKEND,
+            settings.REDIS_URL,
+            max_entries=settings.PLACE_DETAILS_CACHE_MAX_ENTRIES,
+            prefix="w2m:details:",
+        )
+        self._details_stats = {"hits": 0, "misses": 0}
+
+        # Land/water verdicts per grid cell (see is_water)
+        self.land_cache: CacheBackend = create_cache(
+            settings.LAND_CACHE_BACKEND,
+            settings.REDIS_URL,
+            max_entries=settings.LAND_CACHE_MAX_ENTRIES,
+            prefix="w2m:land:",
+        )
+        self._land_stats = {"hint_hits": 0, "mask_hits": 0, "hits": 0, "misses": 0}
+
+        # Offline land/water raster (memory-mapped on open)
+        self.land_mask: Optional[LandMask] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled keep-alive client from settings."""
+        # HTTP/2 needs the optional h2 package (httpx[http2])
+        http2 = settings.GOOGLE_MAPS_HTTP2 and importlib.util.find_spec("h2") is not None
+
+        return httpx.AsyncClient(
+            http2=http2,
+            timeout=settings.GOOGLE_MAPS_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.GOOGLE_MAPS_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.GOOGLE_MAPS_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.GOOGLE_MAPS_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+
+    async def open(self) -> None:
+        """Open the shared HTTP client (called on app startup)."""
+        if self.land_mask is None:
+            self.land_mask = load_land_mask(settings.LAND_MASK_PATH)
+
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+            log.info(
+                "google_maps_client_opened",
+                http2=settings.GOOGLE_MAPS_HTTP2,
+                max_connections=settings.GOOGLE_MAPS_MAX_CONNECTIONS,
+            )
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and its connections (called on app shutdown)."""
+        for task in list(self._background_tasks):
+            task.cancel()
+        await self.places_cache.close()
+        await self.details_cache.close()
+        await self.land_cache.close()
+        await self.quota.close()
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            log.info("google_maps_client_closed", requests=self._requests, errors=self._errors)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client, created on first use outside the app lifespan (scripts, tests)."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    def _endpoint_health(self, endpoint: str) -> EndpointHealth:
+        health = self._health.get(endpoint)
+        if health is None:
+            health = self._health[endpoint] = EndpointHealth(
+                settings.GOOGLE_MAPS_BREAKER_FAILURES,
+                settings.GOOGLE_MAPS_BREAKER_RESET_SECONDS,
+            )
+        return health
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GET a Maps API endpoint over the shared connection pool.
+
+        All Maps calls are idempotent GETs, so transport errors, 429/5xx and
+        UNKNOWN_ERROR responses are retried with jittered backoff. Attempts
+        and backoff share GOOGLE_MAPS_CALL_DEADLINE_SECONDS (counted from the
+        first send): each attempt's timeout is capped by the time left, and
+        no retry is made unless a full attempt still fits. Each
+        endpoint has a circuit breaker that fails fast after repeated
+        failures. With hedging enabled, a duplicate request is sent once the
+        first has taken longer than the endpoint's recent p95. Bodies are
+        decoded with orjson.
+
+        Args:
+            url: Endpoint URL
+            params: Query parameters (including the API key)
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            CircuitOpenError: The endpoint's breaker is open
+            UpstreamUnavailableError: Retries exhausted
+            httpx.HTTPStatusError: Non-retryable 4xx response
+        """
+        endpoint = url.split("/api/", 1)[-1].rsplit("/", 1)[0]
+        health = self._endpoint_health(endpoint)
+        attempts = settings.GOOGLE_MAPS_MAX_RETRIES + 1
+        failure = ""
+        deadline: Optional[float] = None
+
+        for attempt in range(attempts):
+            if not health.breaker.allow():
+                outbound_metrics.record_call(endpoint, "CIRCUIT_OPEN", 0.0, billable=False)
+                raise CircuitOpenError(endpoint, health.breaker.retry_after())
+
+            try:
+                await self.quota.acquire(endpoint)
+            except BaseException as e:
+                if isinstance(e, QuotaExceededError):
+                    outbound_metrics.record_call(endpoint, "QUOTA_REJECTED", 0.0, billable=False)
+                health.breaker.release_trial()
+                raise
+
+            if deadline is None:
+                deadline = time.monotonic() + settings.GOOGLE_MAPS_CALL_DEADLINE_SECONDS
+            timeout = max(0.001, min(settings.GOOGLE_MAPS_TIMEOUT_SECONDS, deadline - time.monotonic()))
+
+            self._requests += 1
+            started = time.perf_counter()
+            try:
+                response = await self._send(endpoint, health, url, params, timeout)
+            except httpx.TransportError as e:
+                failure = type(e).__name__
+                # Requests that never connected are not billed
+                billable = not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+                outbound_metrics.record_call(endpoint, failure, time.perf_counter() - started, billable)
+            except BaseException:
+                # Cancelled or unexpected: no verdict on upstream health
+                health.breaker.release_trial()
+                raise
+            else:
+                elapsed = time.perf_counter() - started
+                if response.status_code == 429 or response.status_code >= 500:
+                    failure = f"HTTP {response.status_code}"
+                    outbound_metrics.record_call(endpoint, failure, elapsed)
+                elif response.status_code >= 400:
+                    # The request itself is wrong: not retried, upstream is healthy
+                    outbound_metrics.record_call(endpoint, f"HTTP {response.status_code}", elapsed)
+                    health.breaker.record_success()
+                    self._errors += 1
+                    response.raise_for_status()
+                else:
+                    data = orjson.loads(response.content)
+                    status = data.get("status")
+                    outbound_metrics.record_call(endpoint, status or "UNKNOWN", elapsed)
+                    # Google documents UNKNOWN_ERROR as "may succeed if you try again"
+                    if status not in ("UNKNOWN_ERROR", "OVER_QUERY_LIMIT"):
+                        health.breaker.record_success()
+                        return data
+                    failure = status
+
+            self._errors += 1
+            if failure == "OVER_QUERY_LIMIT":
+                # Our quota, not upstream health: back off but leave the breaker alone
+                health.counters["over_query_limit"] += 1
+                health.breaker.record_success()
+            else:
+                health.counters["failures"] += 1
+                health.breaker.record_failure()
+
+            if attempt + 1 < attempts:
+                delay = backoff_delay(
+                    attempt, settings.GOOGLE_MAPS_RETRY_BASE_SECONDS, settings.GOOGLE_MAPS_RETRY_MAX_SECONDS
+                )
+                # Only retry if a full attempt still fits in the call's deadline
+                if deadline - time.monotonic() - delay < settings.GOOGLE_MAPS_TIMEOUT_SECONDS:
+                    health.counters["deadline_exceeded"] += 1
+                    break
+                health.counters["retries"] += 1
+                await asyncio.sleep(delay)
+
+        log.warning("google_maps_upstream_failed", endpoint=endpoint, failure=failure, attempts=attempt + 1)
+        if failure == "OVER_QUERY_LIMIT":
+            raise QuotaExceededError(endpoint, settings.GOOGLE_MAPS_RETRY_MAX_SECONDS)
+        raise UpstreamUnavailableError(endpoint, failure)
+
+    async def _send(
+        self,
+        endpoint: str,
+        health: EndpointHealth,
+        url: str,
+        params: Dict[str, Any],
+        timeout: float
+    ) -> httpx.Response:
+        """
+        Send one GET (hedged if enabled) with a timeout in seconds and record its latency.
+
+        A hedge is a second billable request: it needs a quota token that is
+        available right away (otherwise it is skipped), is bounded by the
+        same timeout as the first request and is recorded as its own
+        outbound call with status "HEDGE". The caller records the other one.
+        """
+        started = time.perf_counter()
+        if not settings.GOOGLE_MAPS_HEDGE_ENABLED:
+            response = await self.client.get(url, params=params, timeout=timeout)
+            health.latency.record(time.perf_counter() - started)
+            return response
+
+        # Hedge after the recent p95, once there are enough samples
+        p95 = health.latency.percentile(0.95) if len(health.latency) >= 20 else None
+        delay = max(p95, settings.GOOGLE_MAPS_HEDGE_MIN_DELAY_MS / 1000) if p95 is not None \
+            else settings.GOOGLE_MAPS_HEDGE_DELAY_MS / 1000
+        delay = min(delay, timeout)
+        deadline = time.monotonic() + timeout
+        hedge_started: Optional[float] = None
+
+        def send() -> Awaitable[httpx.Response]:
+            return self.client.get(url, params=params, timeout=max(0.001, deadline - time.monotonic()))
+
+        async def may_hedge() -> bool:
+            nonlocal hedge_started
+            if not await self.quota.try_acquire(endpoint):
+                return False
+            self._requests += 1
+            hedge_started = time.perf_counter()
+            return True
+
+        try:
+            response = await hedged(send, delay, health.counters, may_hedge)
+        finally:
+            if hedge_started is not None:
+                outbound_metrics.record_call(endpoint, "HEDGE", time.perf_counter() - hedge_started)
+
+        health.latency.record(time.perf_counter() - started)
+        return response
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Per-endpoint breaker state, retries, hedges and latency for monitoring."""
+        return {endpoint: health.stats() for endpoint, health in self._health.items()}
+
+    def outbound_stats(self) -> Dict[str, Any]:
+        """Upstream call counters, latency histograms and cache lookups for monitoring."""
+        return outbound_metrics.stats()
+
+    def quota_stats(self) -> Dict[str, Any]:
+        """Outbound quota queueing per endpoint and priority class for monitoring."""
+        return self.quota.stats()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool statistics for monitoring."""
+        stats = {
+            "open": self._client is not None and not self._client.is_closed,
+            "requests": self._requests,
+            "errors": self._errors,
+            "max_connections": settings.GOOGLE_MAPS_MAX_CONNECTIONS,
+            "max_keepalive_connections": settings.GOOGLE_MAPS_MAX_KEEPALIVE_CONNECTIONS,
+            "connections": 0,
+            "active": 0,
+            "idle": 0,
+            "http2_connections": 0,
+        }
+
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        for connection in getattr(pool, "connections", []):
+            stats["connections"] += 1
+            if connection.is_idle():
+                stats["idle"] += 1
+            else:
+                stats["active"] += 1
+            if "HTTP/2" in connection.info():
+                stats["http2_connections"] += 1
+
+        return stats
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """Per-endpoint singleflight counters for monitoring."""
+        return {name: flight.stats() for name, flight in self._flights.items()}
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Places cache statistics for monitoring."""
+        return {**self.places_cache.stats(), **self._places_stats, "refreshing": len(self._refreshing)}
+
+    def details_cache_stats(self) -> Dict[str, Any]:
+        """Place Details cache statistics for monitoring."""
+        return {**self.details_cache.stats(), **self._details_stats}
+
+    def land_cache_stats(self) -> Dict[str, Any]:
+        """Land/water verdict cache statistics for monitoring."""
+        lookups = sum(self._land_stats.values())
+        return {
+            **self.land_cache.stats(),
+            **self._land_stats,
+            "hit_rate": round((lookups - self._land_stats["misses"]) / lookups, 4) if lookups else None,
+            "mask": self.land_mask.stats() if self.land_mask else None,
+        }
+
+    @staticmethod
+    def _places_query(
+        lat: float,
+        lng: float,
+        radius: float,
+        keyword: str,
+        min_rating: float,
+        max_results: int
+    ) -> Tuple[str, Tuple[float, float, float, str, float, int]]:
+        """
+        Quantize a Nearby Search into a cache key and the query actually sent.
+
+        The center snaps to a grid cell center, and the radius is grown by half
+        the cell diagonal and rounded up to the bucket step, so the cached
+        search always covers the requested circle. Nearby searches from the
+        same neighbourhood therefore share one entry.
+
+        Returns:
+            (cache key, (lat, lng, radius_km, keyword, min_rating, max_results))
+        """
+        cell_km = settings.PLACES_CACHE_CELL_METERS / 1000
+        lat_step = cell_km / 111.195
+        cell_lat = (math.floor(lat / lat_step) + 0.5) * lat_step
+        lng_step = lat_step / max(math.cos(math.radians(cell_lat)), 0.01)
+        cell_lng = (math.floor(lng / lng_step) + 0.5) * lng_step
+
+        step = settings.PLACES_CACHE_RADIUS_STEP_KM
+        radius_km = math.ceil((radius + cell_km * math.sqrt(2) / 2) / step) * step
+
+        keyword = " ".join(keyword.lower().split())
+
+        key = f"{cell_lat:.5f}:{cell_lng:.5f}:{radius_km:g}:{min_rating:g}:{max_results}:{keyword}"
+        return key, (round(cell_lat, 6), round(cell_lng, 6), radius_km, keyword, min_rating, max_results)
 
     async def search_places_nearby(
         self,
@@ -20,21 +443,308 @@ class GoogleMapsService:
         keyword: str,
         min_rating: float = 2.5,  # Lowered from 3.0 to include more venues
         max_results: int = 60  # Fetch up to 60 results (3 pages)
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Place]:
         """
         Search for places near a location using Google Places API.
         Supports pagination to fetch more results.
 
+        Results are cached by quantized center cell, bucketed radius and
+        normalized keyword. Fresh entries are returned directly; stale
+        entries are returned and refreshed in the background; ZERO_RESULTS
+        is cached for a shorter time; failed searches are not cached.
+        Concurrent misses for the same key share one upstream search.
+
         Args:
             lat: Center latitude
             lng: Center longitude
-            radius: Search radius in meters
+            radius: Search radius in kilometers
             keyword: Search keyword
             min_rating: Minimum rating filter (default 2.5)
             max_results: Maximum number of results to fetch (default 60)
 
         Returns:
-            List of place dictionaries
+            List of places
+        """
+        key, query = self._places_query(lat, lng, radius, keyword, min_rating, max_results)
+
+        cached = await self._cached_places(key, query)
+        if cached is not None:
+            return cached
+
+        self._places_stats["misses"] += 1
+        return await self._flights["nearby_search"].do(key, lambda: self._fetch_and_store_places(key, query))
+
+    async def iter_places_nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius: float,
+        keyword: str,
+        min_rating: float = 2.5,
+        max_results: int = 60
+    ) -> AsyncIterator[Tuple[List[Place], bool]]:
+        """
+        Progressive variant of search_places_nearby: yields places page by page.
+
+        A cached search is yielded in one final batch. On a miss each page is
+        yielded as soon as it arrives (the first after a single round trip),
+        and the complete search is cached before the last page is yielded. If
+        a search for the same key is already in flight, its result is awaited
+        and yielded in one final batch instead of starting a second one.
+
+        Args:
+            Same as search_places_nearby
+
+        Yields:
+            (new places in API order, whether this is the last batch); only the
+            last batch may be empty
+        """
+        key, query = self._places_query(lat, lng, radius, keyword, min_rating, max_results)
+
+        cached = await self._cached_places(key, query)
+        if cached is not None:
+            yield cached, True
+            return
+
+        self._places_stats["misses"] += 1
+        if self._flights["nearby_search"].in_flight(key):
+            places = await self._flights["nearby_search"].do(key, lambda: self._fetch_and_store_places(key, query))
+            yield places, True
+            return
+
+        places = []
+        async for page, status, last in self._iter_places_pages(*query):
+            places.extend(page)
+            if last:
+                # Consumers may stop at the last batch: cache before yielding it
+                await self._store_places(key, places, status)
+            if page or last:
+                yield page, last
+
+    async def search_places_tiled(
+        self,
+        lat: float,
+        lng: float,
+        radius: float,
+        keyword: str,
+        min_rating: float = 2.5
+    ) -> List[Place]:
+        """
+        Search a large circle by covering it with smaller hexagonal tiles.
+
+        Returns:
+            List of places inside the circle, de-duplicated by place ID
+        """
+        places = []
+        async for batch, _ in self.iter_places_tiled(lat, lng, radius, keyword, min_rating):
+            places.extend(batch)
+        return places
+
+    async def iter_places_tiled(
+        self,
+        lat: float,
+        lng: float,
+        radius: float,
+        keyword: str,
+        min_rating: float = 2.5
+    ) -> AsyncIterator[Tuple[List[Place], bool]]:
+        """
+        Tiled variant of iter_places_nearby for circles larger than one query covers well.
+
+        The circle is covered with hexagonally packed tiles (at most
+        PLACES_TILE_MAX_TILES), and tiles are queried center first with up to
+        PLACES_TILE_CONCURRENCY in flight, one result page each. A circle that
+        fits in a single tile is searched like iter_places_nearby. Every tile
+        search goes through the places cache, singleflight and the quota
+        governor. No new tiles are started once the target density of unique
+        venues inside the circle is reached. A failing tile is skipped; the
+        search only fails if every queried tile failed.
+
+        Args:
+            lat, lng: Circle center
+            radius: Circle radius in kilometers
+            keyword: Search keyword
+            min_rating: Minimum rating filter
+
+        Yields:
+            (new places inside the circle, whether this is the last batch), one
+            batch per finished tile; only the last batch may be empty
+        """
+        tile_radius_km = tiling.tile_radius(radius, settings.PLACES_TILE_RADIUS_KM, settings.PLACES_TILE_MAX_TILES)
+        tiles = tiling.hex_tiles(lat, lng, radius, tile_radius_km)
+        if len(tiles) == 1:
+            # Small circle: a plain search with its full page budget (up to 60 results)
+            async for page, last in self.iter_places_nearby(lat, lng, radius, keyword, min_rating):
+                yield page, last
+            return
+
+        target = tiling.target_results(radius, settings.PLACES_TILE_TARGET_DENSITY, settings.PLACES_TILE_MAX_RESULTS)
+
+        seen_place_ids = set()
+        found = 0
+        queried = 0
+        failed = 0
+        error: Optional[Exception] = None
+        pending = set()
+        batch: List[Place] = []
+
+        def start_tiles() -> None:
+            nonlocal queried
+            while queried < len(tiles) and len(pending) < settings.PLACES_TILE_CONCURRENCY:
+                tile_lat, tile_lng = tiles[queried]
+                pending.add(asyncio.ensure_future(self.search_places_nearby(
+                    lat=tile_lat,
+                    lng=tile_lng,
+                    radius=tile_radius_km,
+                    keyword=keyword,
+                    min_rating=min_rating,
+                    max_results=20
+                )))
+                queried += 1
+
+        try:
+            start_tiles()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                batch = []
+                while done:
+                    candidates = []
+                    for task in done:
+                        if task.exception() is not None:
+                            failed += 1
+                            error = task.exception()
+                            log.warning("places_tile_failed", error=str(error))
+                            continue
+                        for place in task.result():
+                            if place.place_id not in seen_place_ids:
+                                seen_place_ids.add(place.place_id)
+                                candidates.append(place)
+
+                    # Tiles overhang the circle: keep places inside it
+                    if candidates:
+                        distances = geo_kernels.haversine(
+                            (lat, lng), [p.lat for p in candidates], [p.lng for p in candidates]
+                        )
+                        inside = [place for place, d in zip(candidates, distances.tolist()) if d <= radius]
+                        found += len(inside)
+                        batch.extend(inside)
+
+                    if found < target:
+                        start_tiles()
+
+                    # Tiles answered from the cache finish within one loop iteration:
+                    # merge them into this batch, so a cached search is a single batch
+                    await asyncio.sleep(0)
+                    done = {task for task in pending if task.done()}
+                    pending -= done
+
+                if not pending:
+                    # Yielded as the last batch below
+                    break
+                if batch:
+                    yield batch, False
+        finally:
+            for task in pending:
+                task.cancel()
+
+        log.info(
+            "places_tiled_search", tiles=len(tiles), queried=queried, failed=failed,
+            tile_radius_km=round(tile_radius_km, 2), found=found, target=target
+        )
+        if queried and failed == queried:
+            raise error
+        yield batch, True
+
+    async def _cached_places(self, key: str, query: Tuple) -> Optional[List[Place]]:
+        """Cached places for key (refreshing stale entries in the background), or None on a miss."""
+        entry = await self.places_cache.get(key)
+        outbound_metrics.record_cache("places", entry is not None)
+        if entry is None:
+            return None
+
+        if not entry.value:
+            self._places_stats["negative_hits"] += 1
+        if entry.is_fresh:
+            self._places_stats["hits"] += 1
+        else:
+            self._places_stats["stale_hits"] += 1
+            self._schedule_places_refresh(key, query)
+        return [Place.from_row(row) for row in entry.value]
+
+    async def _fetch_and_store_places(self, key: str, query: Tuple) -> List[Place]:
+        """Fetch a search from the API and cache it."""
+        places, status = await self._fetch_places_nearby(*query)
+        await self._store_places(key, places, status)
+        return places
+
+    async def _store_places(self, key: str, places: List[Place], status: str) -> None:
+        """Cache a search result; only complete OK / ZERO_RESULTS searches are cached."""
+        if status == "OK" and places:
+            await self.places_cache.set(
+                key, places, settings.PLACES_CACHE_TTL_SECONDS, settings.PLACES_CACHE_STALE_SECONDS
+            )
+        elif status in ("OK", "ZERO_RESULTS"):
+            await self.places_cache.set(key, [], settings.PLACES_CACHE_NEGATIVE_TTL_SECONDS)
+
+    def _schedule_places_refresh(self, key: str, query: Tuple) -> None:
+        """Refresh a stale entry in the background (once per key at a time)."""
+        if key in self._refreshing:
+            return
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh_places(key, query))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh_places(self, key: str, query: Tuple) -> None:
+        try:
+            # Refreshes must not take quota from interactive searches
+            with request_priority(BACKGROUND):
+                places, status = await self._fetch_places_nearby(*query)
+            await self._store_places(key, places, status)
+            self._places_stats["refreshes"] += 1
+        except Exception as e:
+            log.warning("places_cache_refresh_failed", key=key, error=str(e))
+        finally:
+            self._refreshing.discard(key)
+
+    async def _fetch_places_nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius: float,
+        keyword: str,
+        min_rating: float,
+        max_results: int
+    ) -> Tuple[List[Place], str]:
+        """
+        Run a paginated Nearby Search against the API.
+
+        Returns:
+            (places, status) where status is the API status of the last page
+            fetched ("OK", "ZERO_RESULTS" or an error status)
+        """
+        places = []
+        status = "OK"
+        async for page, status, _ in self._iter_places_pages(lat, lng, radius, keyword, min_rating, max_results):
+            places.extend(page)
+        return places, status
+
+    async def _iter_places_pages(
+        self,
+        lat: float,
+        lng: float,
+        radius: float,
+        keyword: str,
+        min_rating: float,
+        max_results: int
+    ) -> AsyncIterator[Tuple[List[Place], str, bool]]:
+        """
+        Run a paginated Nearby Search, yielding each page as it arrives.
+
+        Yields:
+            (new places of the page, API status of the page, whether it is the last page)
         """
         url = f"{self.base_url}/place/nearbysearch/json"
         params = {
@@ -44,23 +754,28 @@ class GoogleMapsService:
             "key": self.api_key
         }
 
-        places = []
+        found = 0
         seen_place_ids = set()
         page_count = 0
-        max_pages = 3  # Google allows up to 3 pages (60 results total)
+        # Google allows up to 3 pages of 20 results (60 total)
+        max_pages = min(3, math.ceil(max_results / 20))
 
-        async with httpx.AsyncClient() as client:
-            while page_count < max_pages and len(places) < max_results:
-                response = await client.get(url, params=params, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
+        pages = 0
+        try:
+            while page_count < max_pages and found < max_results:
+                data = await self._get(url, params)
+                pages += 1
+                status = data.get("status")
 
-                if data.get("status") not in ["OK", "ZERO_RESULTS"]:
-                    break
+                if status not in ["OK", "ZERO_RESULTS"]:
+                    log.warning("nearby_search_failed", status=status, error=data.get("error_message"), page=page_count)
+                    yield [], status, True
+                    return
 
                 # Process results from this page
+                page = []
                 for result in data.get("results", []):
-                    if len(places) >= max_results:
+                    if found >= max_results:
                         break
 
                     place_id = result.get("place_id")
@@ -75,25 +790,18 @@ class GoogleMapsService:
                         continue
 
                     seen_place_ids.add(place_id)
-                    places.append({
-                        "place_id": place_id,
-                        "name": result.get("name", ""),
-                        "address": result.get("vicinity", ""),
-                        "lat": result["geometry"]["location"]["lat"],
-                        "lng": result["geometry"]["location"]["lng"],
-                        "rating": rating if rating > 0 else None,
-                        "user_ratings_total": result.get("user_ratings_total", 0),
-                        "opening_hours": result.get("opening_hours"),
-                    })
+                    found += 1
+                    page.append(Place.from_result(result))
 
                 # Check for next page
                 next_page_token = data.get("next_page_token")
-                if not next_page_token:
+                last = not next_page_token or page_count + 1 >= max_pages or found >= max_results
+                yield page, status, last
+                if last:
                     break
 
                 # Google requires a short delay before using next_page_token
-                import asyncio
-                await asyncio.sleep(2)
+                await asyncio.sleep(settings.GOOGLE_MAPS_PAGE_TOKEN_DELAY_SECONDS)
 
                 # Update params for next page
                 params = {
@@ -101,45 +809,90 @@ class GoogleMapsService:
                     "key": self.api_key
                 }
                 page_count += 1
-
-            return places
+        finally:
+            if pages:
+                outbound_metrics.record_pages(pages)
 
     async def get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a place.
 
+        Found places are cached by place ID for PLACE_DETAILS_CACHE_TTL_SECONDS.
+
         Args:
             place_id: Google Place ID
 
         Returns:
-            Place details dictionary or None
+            Dict with place_id, formatted address and opening hours, or None
+        """
+        entry = await self.details_cache.get(place_id)
+        outbound_metrics.record_cache("details", entry is not None)
+        if entry is not None:
+            self._details_stats["hits"] += 1
+            return entry.value
+
+        self._details_stats["misses"] += 1
+        return await self._flights["place_details"].do(place_id, lambda: self._fetch_and_store_details(place_id))
+
+    async def get_places_details(
+        self,
+        place_ids: List[str],
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get details for many places concurrently.
+
+        Args:
+            place_ids: Google Place IDs
+            concurrency: Maximum requests in flight (default PLACE_DETAILS_CONCURRENCY)
+
+        Returns:
+            Details by place ID; places that were not found or failed are left out
         """
+        semaphore = asyncio.Semaphore(concurrency or settings.PLACE_DETAILS_CONCURRENCY)
+        unique_ids = list(dict.fromkeys(place_ids))
+
+        async def fetch(place_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_place_details(place_id)
+
+        results = await asyncio.gather(*(fetch(place_id) for place_id in unique_ids), return_exceptions=True)
+
+        details = {}
+        for place_id, result in zip(unique_ids, results):
+            if isinstance(result, Exception):
+                log.warning("place_details_failed", place_id=place_id, error=str(result))
+            elif result is not None:
+                details[place_id] = result
+        return details
+
+    async def _fetch_and_store_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch place details from the API and cache them if found."""
+        details = await self._fetch_place_details(place_id)
+        if details is not None:
+            await self.details_cache.set(place_id, details, settings.PLACE_DETAILS_CACHE_TTL_SECONDS)
+        return details
+
+    async def _fetch_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch place details from the API (only the fields Nearby Search lacks, to keep the SKU cheap)."""
         url = f"{self.base_url}/place/details/json"
         params = {
             "place_id": place_id,
-            "fields": "place_id,name,formatted_address,geometry,rating,user_ratings_total,opening_hours",
+            "fields": "formatted_address,opening_hours",
             "key": self.api_key
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
+        data = await self._get(url, params)
 
-            if data.get("status") != "OK":
-                return None
+        if data.get("status") != "OK":
+            return None
 
-            result = data.get("result", {})
-            return {
-                "place_id": result.get("place_id"),
-                "name": result.get("name", ""),
-                "address": result.get("formatted_address", ""),
-                "lat": result["geometry"]["location"]["lat"],
-                "lng": result["geometry"]["location"]["lng"],
-                "rating": result.get("rating"),
-                "user_ratings_total": result.get("user_ratings_total", 0),
-                "opening_hours": result.get("opening_hours"),
-            }
+        result = data.get("result", {})
+        return {
+            "place_id": place_id,
+            "address": result.get("formatted_address", ""),
+            "opening_hours": result.get("opening_hours"),
+        }
 
     async def reverse_geocode(self, lat: float, lng: float) -> Optional[Dict[str, Any]]:
         """
@@ -153,32 +906,128 @@ class GoogleMapsService:
         Returns:
             Geocoding result with address components, or None
         """
+        result, _ = await self._reverse_geocode(lat, lng)
+        return result
+
+    async def _reverse_geocode(self, lat: float, lng: float) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Reverse geocode a location, also returning the API status.
+
+        Returns:
+            (geocoding result or None, API status)
+        """
+        # ~0.1 m precision; identical points share one request
+        latlng = f"{lat:.6f},{lng:.6f}"
+        return await self._flights["reverse_geocode"].do(latlng, lambda: self._fetch_reverse_geocode(latlng))
+
+    async def _fetch_reverse_geocode(self, latlng: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Reverse geocode a "lat,lng" string via the API."""
         url = f"{self.base_url}/geocode/json"
         params = {
-            "latlng": f"{lat},{lng}",
+            "latlng": latlng,
             "key": self.api_key
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
+        data = await self._get(url, params)
+        status = data.get("status")
+
+        if status != "OK":
+            return None, status
+
+        results = data.get("results", [])
+        if not results:
+            return None, status
+
+        # Return the first (most specific) result
+        result = results[0]
+        return {
+            "formatted_address": result.get("formatted_address"),
+            "address_components": result.get("address_components", []),
+            "types": result.get("types", []),
+            "geometry": result.get("geometry", {}),
+        }, status
+
+    @staticmethod
+    def _land_cell_key(lat: float, lng: float) -> str:
+        """Grid cell of a point at LAND_CACHE_CELL_METERS resolution."""
+        lat_step = settings.LAND_CACHE_CELL_METERS / 1000 / 111.195
+        row = math.floor(lat / lat_step)
+        # Keep cells roughly square by widening longitude steps toward the poles
+        row_lat = (row + 0.5) * lat_step
+        lng_step = lat_step / max(math.cos(math.radians(row_lat)), 0.01)
+        col = math.floor(lng / lng_step)
+        return f"{settings.LAND_CACHE_CELL_METERS:g}:{row}:{col}"
+
+    async def is_water(self, lat: float, lng: float) -> bool:
+        """
+        Classify a point as water or land.
 
-            if data.get("status") != "OK":
-                return None
+        The offline land mask answers directly unless the pixel is ambiguous
+        (coastline) or the mask is not loaded. Otherwise the point is reverse
+        geocoded and the verdict cached per grid cell for
+        LAND_CACHE_TTL_SECONDS; failed lookups (API errors other than
+        ZERO_RESULTS) are not cached.
 
-            results = data.get("results", [])
-            if not results:
-                return None
+        Args:
+            lat: Latitude
+            lng: Longitude
 
-            # Return the first (most specific) result
-            result = results[0]
-            return {
-                "formatted_address": result.get("formatted_address"),
-                "address_components": result.get("address_components", []),
-                "types": result.get("types", []),
-                "geometry": result.get("geometry", {}),
-            }
+        Returns:
+            True if the point is on water (or unaddressable)
+        """
+        if self.land_mask is not None:
+            verdict = self.land_mask.value(lat, lng)
+            outbound_metrics.record_cache("land_mask", verdict != AMBIGUOUS)
+            if verdict != AMBIGUOUS:
+                self._land_stats["mask_hits"] += 1
+                return verdict == WATER
+
+        key = self._land_cell_key(lat, lng)
+        entry = await self.land_cache.get(key)
+        outbound_metrics.record_cache("land", entry is not None)
+        if entry is not None:
+            self._land_stats["hits"] += 1
+            return entry.value
+
+        self._land_stats["misses"] += 1
+        geocode, status = await self._reverse_geocode(lat, lng)
+        water = self.is_water_location(geocode)
+
+        if status in ("OK", "ZERO_RESULTS"):
+            await self.land_cache.set(key, water, settings.LAND_CACHE_TTL_SECONDS)
+
+        return water
+
+    async def warm_land_cache(self, points: List[Tuple[float, float]], concurrency: int = 4) -> int:
+        """
+        Classify the grid cells of many points ahead of time.
+
+        Cells already cached, answered by the land mask, or repeated in
+        points are skipped.
+
+        Args:
+            points: List of (lat, lng) tuples
+            concurrency: Maximum geocoding requests in flight
+
+        Returns:
+            Number of cells geocoded
+        """
+        cells = {}
+        for lat, lng in points:
+            if self.land_mask is not None and self.land_mask.value(lat, lng) != AMBIGUOUS:
+                continue
+            cells.setdefault(self._land_cell_key(lat, lng), (lat, lng))
+
+        missing = [point for key, point in cells.items() if await self.land_cache.get(key) is None]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def classify(point: Tuple[float, float]) -> None:
+            async with semaphore:
+                with request_priority(BACKGROUND):
+                    await self.is_water(*point)
+
+        await asyncio.gather(*(classify(point) for point in missing))
+        return len(missing)
 
     def is_water_location(self, geocode_result: Optional[Dict[str, Any]]) -> bool:
         """
@@ -278,20 +1127,63 @@ class GoogleMapsService:
         self,
         lat: float,
         lng: float,
-        max_radius: float = 5.0
+        max_radius: float = 5.0,
+        land_hint: Optional[Tuple[float, float]] = None
     ) -> Optional[Dict[str, float]]:
         """
         Find the nearest land-based location to a given point.
         Uses a spiral search pattern to find the closest addressable location.
 
+        With an offline land mask loaded, the nearest land pixel is used
+        without any API calls. Otherwise a land hint (a point known to be on
+        land, e.g. the nearest participant) is used if given. Otherwise the
+        probes of each ring run
+        concurrently (at most LAND_PROBE_CONCURRENCY at a time); the first
+        land hit in the nearest ring wins and the remaining probes are
+        cancelled. The whole search is bounded by LAND_PROBE_BUDGET_SECONDS.
+
         Args:
             lat: Center latitude
             lng: Center longitude
             max_radius: Maximum search radius in kilometers (default 5km)
+            land_hint: (lat, lng) known to be on land within max_radius
 
         Returns:
             Dict with 'lat' and 'lng' of nearest land point, or None
         """
+        try:
+            return await asyncio.wait_for(
+                self._find_nearest_land_point(lat, lng, max_radius, land_hint),
+                timeout=settings.LAND_PROBE_BUDGET_SECONDS
+            )
+        except asyncio.TimeoutError:
+            log.warning("land_probe_budget_exceeded", lat=lat, lng=lng, budget_s=settings.LAND_PROBE_BUDGET_SECONDS)
+            return None
+
+    async def _find_nearest_land_point(
+        self,
+        lat: float,
+        lng: float,
+        max_radius: float,
+        land_hint: Optional[Tuple[float, float]] = None
+    ) -> Optional[Dict[str, float]]:
+        """Land mask, then the land hint, then establishment search, then the ring-by-ring spiral (no time budget)."""
+        # Nearest definite land pixel of the offline mask
+        if self.land_mask is not None:
+            land = self.land_mask.nearest_land(lat, lng, max_radius)
+            if land:
+                return {
+                    "lat": land[0],
+                    "lng": land[1]
+                }
+
+        # A known land point (participant location) costs no API calls
+        if land_hint is not None:
+            return {
+                "lat": land_hint[0],
+                "lng": land_hint[1]
+            }
+
         # Try to find any nearby place (establishments are always on land)
         url = f"{self.base_url}/place/nearbysearch/json"
         params = {
@@ -301,84 +1193,129 @@ class GoogleMapsService:
             "key": self.api_key
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
+        data = await self._get(url, params)
 
-            if data.get("status") == "OK" and data.get("results"):
-                # Return the closest result (first in list)
-                first_result = data["results"][0]
-                location = first_result["geometry"]["location"]
+        if data.get("status") == "OK" and data.get("results"):
+            # Return the closest result (first in list)
+            first_result = data["results"][0]
+            location = first_result["geometry"]["location"]
+            return {
+                "lat": location["lat"],
+                "lng": location["lng"]
+            }
+
+        # If no establishments found, try geocoding nearby points
+        # in 8 directions at increasing distances
+        semaphore = asyncio.Semaphore(settings.LAND_PROBE_CONCURRENCY)
+        for ring in land_probe_rings(lat, lng):
+            land = await self._probe_ring(ring, semaphore)
+            if land:
                 return {
-                    "lat": location["lat"],
-                    "lng": location["lng"]
+                    "lat": land[0],
+                    "lng": land[1]
                 }
 
-            # If no establishments found, try geocoding nearby points
-            # Try points in 8 directions at increasing distances
-            directions = [
-                (0, 1),    # North
-                (1, 1),    # NE
-                (1, 0),    # East
-                (1, -1),   # SE
-                (0, -1),   # South
-                (-1, -1),  # SW
-                (-1, 0),   # West
-                (-1, 1),   # NW
-            ]
-
-            # Try increasing distances
-            for distance_km in [0.5, 1.0, 2.0, 3.0, 5.0]:
-                # ~111 km per degree of latitude
-                lat_offset = distance_km / 111.0
-
-                for dx, dy in directions:
-                    # Adjust longitude offset by latitude (cosine correction)
-                    import math
-                    lng_offset = distance_km / (111.0 * math.cos(math.radians(lat)))
-
-                    test_lat = lat + (dy * lat_offset)
-                    test_lng = lng + (dx * lng_offset)
-
-                    # Check if this point is on land
-                    geocode = await self.reverse_geocode(test_lat, test_lng)
-                    if geocode and not self.is_water_location(geocode):
-                        return {
-                            "lat": test_lat,
-                            "lng": test_lng
-                        }
-
-            # Could not find land within max_radius
+        # Could not find land within max_radius
+        return None
+
+    async def _probe_ring(
+        self,
+        ring: List[Tuple[float, float]],
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Probe one ring of points concurrently.
+
+        Returns:
+            The first point found on land (remaining probes are cancelled), or None
+        """
+        async def probe(point: Tuple[float, float]) -> Tuple[Tuple[float, float], bool]:
+            async with semaphore:
+                return point, await self.is_water(*point)
+
+        tasks = [asyncio.create_task(probe(point)) for point in ring]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    point, water = await next_done
+                except Exception as e:
+                    # One failed probe should not abort the ring
+                    log.warning("land_probe_failed", error=str(e))
+                    continue
+
+                if not water:
+                    return point
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _nearest_land_hint(
+        lat: float,
+        lng: float,
+        land_hints: Optional[Sequence[Tuple[float, float]]]
+    ) -> Optional[Tuple[Tuple[float, float], float]]:
+        """Nearest land hint to a point and its distance in kilometers, or None without hints."""
+        if not land_hints:
             return None
 
+        distances = geo_kernels.haversine(
+            (lat, lng), [hint[0] for hint in land_hints], [hint[1] for hint in land_hints]
+        )
+        nearest = int(distances.argmin())
+        return (land_hints[nearest][0], land_hints[nearest][1]), float(distances[nearest])
+
     async def snap_to_land(
         self,
         lat: float,
         lng: float,
-        max_radius: float = 5.0
+        max_radius: float = 5.0,
+        land_hints: Optional[Sequence[Tuple[float, float]]] = None
     ) -> Dict[str, float]:
         """
         Ensure a coordinate is on land, not water.
         If the point is on water, find the nearest land location.
 
+        Participants submit locations from where they are, so their points
+        can be passed as land hints: a point within LAND_HINT_RADIUS_KM of a
+        hint is taken to be on land without any lookup, and a point on water
+        snaps to the nearest hint within max_radius before any land search
+        that costs API calls.
+
         Args:
             lat: Latitude
             lng: Longitude
             max_radius: Maximum search radius for land (km)
+            land_hints: (lat, lng) points known to be on land, e.g. participant locations
 
         Returns:
             Dict with 'lat' and 'lng' (on land)
         """
-        # Check if current location is on land
-        geocode = await self.reverse_geocode(lat, lng)
-
-        if geocode and not self.is_water_location(geocode):
-            # Already on land
-            return {"lat": lat, "lng": lng}
-
-        # Point is on water, find nearest land
-        land_point = await self.find_nearest_land_point(lat, lng, max_radius)
+        nearest_hint = self._nearest_land_hint(lat, lng, land_hints)
+        if nearest_hint is not None:
+            hint, distance_km = nearest_hint
+            near_hint = distance_km <= settings.LAND_HINT_RADIUS_KM
+            outbound_metrics.record_cache("land_hint", near_hint)
+            if near_hint:
+                self._land_stats["hint_hits"] += 1
+                return {"lat": lat, "lng": lng}
+
+        land_hint = nearest_hint[0] if nearest_hint is not None and nearest_hint[1] <= max_radius else None
+
+        try:
+            # Check if current location is on land
+            if not await self.is_water(lat, lng):
+                # Already on land
+                return {"lat": lat, "lng": lng}
+
+            # Point is on water, find nearest land
+            land_point = await self.find_nearest_land_point(lat, lng, max_radius, land_hint)
+        except UpstreamUnavailableError as e:
+            # Snapping is best-effort: keep the point while Maps is down
+            log.warning("snap_to_land_skipped", lat=lat, lng=lng, error=str(e))
+            land_point = None
 
         if land_point:
             return land_point
@@ -0,0 +1,271 @@
+"""Instrumentation of outbound Google Maps calls.
+
+Every upstream attempt is recorded with its endpoint, status and latency;
+cache lookups and Nearby Search page walks are recorded as well. Records are
+attributed to the event and API request in the current context (set by the
+request middleware in app.main, inherited by background tasks), so the cost
+of a single search - including snap-to-land probes and details enrichment -
+can be looked up afterwards. A call shared by several callers through
+singleflight is attributed to every one of them, so per-event totals count
+it once per event that used it.
+
+Aggregates are exposed as counters and latency histograms; per-event cost
+summaries keep the most recent requests of the most recently active events.
+"""
+
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds (ms) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Approximate list price per billed request (USD), for relative cost only
+ENDPOINT_COST_USD = {
+    "place/nearbysearch": 0.032,
+    "place/details": 0.017,
+    "geocode": 0.005,
+}
+
+MAX_TRACKED_EVENTS = 2000
+MAX_REQUESTS_PER_EVENT = 20
+
+# (event_id, request_id) of the API request that triggered the call
+_call_context: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar(
+    "maps_call_context", default=(None, None)
+)
+
+# Contexts of every caller waiting on a shared (coalesced) call, see shared_call_contexts
+_shared_contexts: ContextVar[Optional[List[Tuple[Optional[str], Optional[str]]]]] = ContextVar(
+    "maps_shared_call_contexts", default=None
+)
+
+
+@contextmanager
+def call_context(event_id: Optional[str], request_id: Optional[str]) -> Iterator[None]:
+    """Attribute Maps calls made in the enclosed block (and tasks it creates) to an event and request."""
+    token = _call_context.set((event_id, request_id))
+    try:
+        yield
+    finally:
+        _call_context.reset(token)
+
+
+def current_call_context() -> Tuple[Optional[str], Optional[str]]:
+    return _call_context.get()
+
+
+def current_call_contexts() -> List[Tuple[Optional[str], Optional[str]]]:
+    """Every context Maps calls made here are attributed to (more than one inside a shared call)."""
+    return list(_shared_contexts.get() or [current_call_context()])
+
+
+@contextmanager
+def shared_call_contexts(contexts: List[Tuple[Optional[str], Optional[str]]]) -> Iterator[None]:
+    """
+    Attribute Maps calls made in the enclosed block to every context in contexts.
+
+    The list is read at record time, so contexts appended by callers joining
+    the shared call later are attributed the calls recorded after they joined.
+    """
+    token = _shared_contexts.set(contexts)
+    try:
+        yield
+    finally:
+        _shared_contexts.reset(token)
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket upper bounds (Prometheus style)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip([f"{b:g}" for b in self.buckets] + ["+Inf"], self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"buckets": buckets, "count": self.count, "sum": round(self.sum, 1)}
+
+
+class CostSummary:
+    """Upstream calls, latency and cache use attributed to one event or request."""
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.errors = 0
+        self.upstream_ms = 0.0
+        self.cost_usd = 0.0
+        self.pages = 0
+        self.cache: Counter = Counter()
+        self.first_seen = time.time()
+        self.last_seen = self.first_seen
+
+    def add_call(self, endpoint: str, ok: bool, ms: float, billable: bool) -> None:
+        self.calls[endpoint] += 1
+        self.errors += 0 if ok else 1
+        self.upstream_ms += ms
+        if billable:
+            self.cost_usd += ENDPOINT_COST_USD.get(endpoint, 0.0)
+        self.last_seen = time.time()
+
+    def add_cache(self, cache: str, hit: bool) -> None:
+        self.cache[f"{cache}_{'hits' if hit else 'misses'}"] += 1
+        self.last_seen = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": sum(self.calls.values()),
+            "calls_by_endpoint": dict(self.calls),
+            "errors": self.errors,
+            "upstream_ms": round(self.upstream_ms, 1),
+            "estimated_cost_usd": round(self.cost_usd, 4),
+            "pages": self.pages,
+            "cache": dict(self.cache),
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+        }
+
+
+class OutboundMetrics:
+    """Counters, histograms and per-event cost summaries of Maps calls."""
+
+    def __init__(self, max_events: int = MAX_TRACKED_EVENTS, max_requests: int = MAX_REQUESTS_PER_EVENT):
+        self.max_events = max_events
+        self.max_requests = max_requests
+        self.calls: Counter = Counter()  # (endpoint, status)
+        self.latency: Dict[str, Histogram] = {}
+        self.cache: Counter = Counter()  # (cache, "hits" | "misses")
+        self.pages = Histogram(buckets=(1, 2, 3))
+        self._events: "OrderedDict[str, CostSummary]" = OrderedDict()
+        self._requests: "OrderedDict[str, OrderedDict[str, CostSummary]]" = OrderedDict()
+        self._unattributed = CostSummary()
+
+    def _summaries(self) -> List[CostSummary]:
+        """Summaries the current call is attributed to (events and requests, or unattributed)."""
+        summaries: Dict[int, CostSummary] = {}
+        for event_id, request_id in current_call_contexts():
+            for summary in self._context_summaries(event_id, request_id):
+                summaries[id(summary)] = summary
+        return list(summaries.values())
+
+    def _context_summaries(self, event_id: Optional[str], request_id: Optional[str]) -> List[CostSummary]:
+        """Summaries of one (event_id, request_id) context."""
+        if event_id is None:
+            return [self._unattributed]
+
+        event = self._events.get(event_id)
+        if event is None:
+            event = self._events[event_id] = CostSummary()
+            self._requests[event_id] = OrderedDict()
+            if len(self._events) > self.max_events:
+                evicted, _ = self._events.popitem(last=False)
+                self._requests.pop(evicted, None)
+        self._events.move_to_end(event_id)
+
+        summaries = [event]
+        if request_id is not None:
+            requests = self._requests[event_id]
+            request = requests.get(request_id)
+            if request is None:
+                request = requests[request_id] = CostSummary()
+                if len(requests) > self.max_requests:
+                    requests.popitem(last=False)
+            summaries.append(request)
+        return summaries
+
+    def record_call(self, endpoint: str, status: str, seconds: float, billable: bool = True) -> None:
+        """
+        Record one upstream attempt.
+
+        Args:
+            endpoint: API path, e.g. "place/nearbysearch"
+            status: API status ("OK", "ZERO_RESULTS", ...), "HTTP 503", a transport error name,
+                "HEDGE" for the duplicate request of a hedged attempt, or
+                "CIRCUIT_OPEN" / "QUOTA_REJECTED" for calls that were not sent
+            seconds: Latency of the attempt
+            billable: Whether the request reached Google (and counts against quota)
+        """
+        ms = seconds * 1000
+        self.calls[(endpoint, status)] += 1
+        if billable:
+            histogram = self.latency.get(endpoint)
+            if histogram is None:
+                histogram = self.latency[endpoint] = Histogram()
+            histogram.observe(ms)
+
+        ok = status in ("OK", "ZERO_RESULTS", "HEDGE")
+        for summary in self._summaries():
+            summary.add_call(endpoint, ok, ms, billable)
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """Record a cache lookup ("places", "details", "land", "land_mask", "land_hint")."""
+        self.cache[(cache, "hits" if hit else "misses")] += 1
+        for summary in self._summaries():
+            summary.add_cache(cache, hit)
+
+    def record_pages(self, pages: int) -> None:
+        """Record the number of pages one Nearby Search walked."""
+        self.pages.observe(pages)
+        for summary in self._summaries():
+            summary.pages += pages
+
+    def event_summary(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """Cost summary of an event with its most recent requests, or None if not tracked."""
+        event = self._events.get(event_id)
+        if event is None:
+            return None
+        return {
+            "event_id": event_id,
+            **event.to_dict(),
+            "requests": {request_id: summary.to_dict() for request_id, summary in self._requests[event_id].items()},
+        }
+
+    def request_summary(self, event_id: str, request_id: str) -> Optional[Dict[str, Any]]:
+        summary = self._requests.get(event_id, {}).get(request_id)
+        return summary.to_dict() if summary is not None else None
+
+    def top_events(self, limit: int = 20, sort_by: str = "calls") -> List[Dict[str, Any]]:
+        """Most expensive tracked events by "calls", "upstream_ms" or "estimated_cost_usd"."""
+        summaries = [{"event_id": event_id, **event.to_dict()} for event_id, event in self._events.items()]
+        summaries.sort(key=lambda s: s[sort_by], reverse=True)
+        return summaries[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate counters and histograms for /metrics."""
+        calls: Dict[str, Dict[str, int]] = {}
+        for (endpoint, status), count in self.calls.items():
+            calls.setdefault(endpoint, {})[status] = count
+
+        cache: Dict[str, Dict[str, int]] = {}
+        for (name, outcome), count in self.cache.items():
+            cache.setdefault(name, {})[outcome] = count
+
+        return {
+            "calls": calls,
+            "latency_ms": {endpoint: histogram.to_dict() for endpoint, histogram in self.latency.items()},
+            "nearby_search_pages": self.pages.to_dict(),
+            "cache": cache,
+            "tracked_events": len(self._events),
+            "unattributed": self._unattributed.to_dict(),
+        }
+
+
+outbound_metrics = OutboundMetrics()
@@ -0,0 +1,406 @@
+"""Offline land/water raster mask.
+
+A global equirectangular raster at `pixels_per_degree` resolution, split
+into square tiles. Each pixel holds 2 bits:
+
+- 0: water
+- 1: land
+- 2: ambiguous (on the coastline, or outside the area the mask was built for)
+
+Tiles whose pixels all share one value are stored only in the tile index,
+so oceans and continental interiors cost 4 bytes per tile. The file is
+memory-mapped, so only the coastline tiles actually touched are paged in.
+
+File layout (little-endian):
+- header (64 bytes): magic, version, pixels_per_degree, tile_size,
+  tile_rows, tile_cols, tile_count
+- index: int32[tile_rows, tile_cols]; >= 0 is a tile number, < 0 is a
+  uniform tile with value -1 - index
+- tiles: uint8[tile_count, tile_size, tile_size / 4], 4 pixels per byte
+
+Masks are built from land polygons (GeoJSON) with build_land_mask, see
+app.cli.build_land_mask.
+"""
+
+import json
+import math
+import os
+import shutil
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import structlog
+
+from app.services import geo_kernels
+
+log = structlog.get_logger()
+
+WATER = 0
+LAND = 1
+AMBIGUOUS = 2
+
+MAGIC = b"W2MLAND1"
+VERSION = 1
+HEADER_FORMAT = "<8sIIIIII"
+HEADER_SIZE = 64
+
+
+class LandMask:
+    """Read-only, memory-mapped land/water mask."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        magic, version, ppd, tile_size, tile_rows, tile_cols, tile_count = struct.unpack_from(HEADER_FORMAT, header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a land mask file (or unsupported version): {path}")
+
+        self.path = path
+        self.pixels_per_degree = ppd
+        self.tile_size = tile_size
+        self.rows = 180 * ppd
+        self.cols = 360 * ppd
+        self.tile_count = tile_count
+
+        self.index = np.memmap(path, dtype=np.int32, mode="r", offset=HEADER_SIZE, shape=(tile_rows, tile_cols))
+        data_offset = HEADER_SIZE + self.index.nbytes
+        # A mask without coastline tiles has no tile data at all
+        self.tiles = np.memmap(
+            path, dtype=np.uint8, mode="r", offset=data_offset,
+            shape=(tile_count, tile_size, tile_size // 4)
+        ) if tile_count else None
+
+    @property
+    def km_per_pixel(self) -> float:
+        """Pixel height in kilometers."""
+        return geo_kernels.KM_PER_DEGREE / self.pixels_per_degree
+
+    def pixel(self, lat: float, lng: float) -> Tuple[int, int]:
+        """Row and column of the pixel containing a point."""
+        row = min(max(int((90.0 - lat) * self.pixels_per_degree), 0), self.rows - 1)
+        col = int(((lng + 180.0) % 360.0) * self.pixels_per_degree) % self.cols
+        return row, col
+
+    def pixel_center(self, rows: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Coordinates of pixel centers."""
+        lats = 90.0 - (rows + 0.5) / self.pixels_per_degree
+        lngs = geo_kernels.wrap_longitude(-180.0 + (cols + 0.5) / self.pixels_per_degree)
+        return lats, lngs
+
+    def value(self, lat: float, lng: float) -> int:
+        """
+        Classify a point in O(1).
+
+        Returns:
+            WATER, LAND or AMBIGUOUS
+        """
+        row, col = self.pixel(lat, lng)
+        tile_row, r = divmod(row, self.tile_size)
+        tile_col, c = divmod(col, self.tile_size)
+
+        tile = int(self.index[tile_row, tile_col])
+        if tile < 0:
+            return -1 - tile
+        return (int(self.tiles[tile, r, c >> 2]) >> ((c & 3) * 2)) & 3
+
+    def _tile(self, tile_row: int, tile_col: int) -> np.ndarray:
+        """Unpacked (tile_size, tile_size) pixel values of one tile."""
+        tile = int(self.index[tile_row, tile_col])
+        if tile < 0:
+            return np.full((self.tile_size, self.tile_size), -1 - tile, dtype=np.uint8)
+        return unpack_tile(np.asarray(self.tiles[tile]))
+
+    def window(self, row0: int, row1: int, cols: np.ndarray) -> np.ndarray:
+        """
+        Pixel values for rows row0..row1 (inclusive) and the given columns.
+
+        Columns may wrap around the antimeridian.
+        """
+        out = np.empty((row1 - row0 + 1, len(cols)), dtype=np.uint8)
+        tile_cols = cols // self.tile_size
+
+        for tile_row in range(row0 // self.tile_size, row1 // self.tile_size + 1):
+            start = max(row0, tile_row * self.tile_size)
+            end = min(row1, tile_row * self.tile_size + self.tile_size - 1)
+            local_rows = slice(start - tile_row * self.tile_size, end - tile_row * self.tile_size + 1)
+
+            for tile_col in np.unique(tile_cols):
+                selected = tile_cols == tile_col
+                tile = self._tile(tile_row, int(tile_col))
+                out[start - row0:end - row0 + 1, selected] = tile[local_rows][:, cols[selected] - tile_col * self.tile_size]
+
+        return out
+
+    def nearest_land(self, lat: float, lng: float, max_radius_km: float) -> Optional[Tuple[float, float]]:
+        """
+        Center of the nearest land pixel within max_radius_km.
+
+        Searches the pixel window around the point; ambiguous pixels are
+        not considered land.
+
+        Returns:
+            (lat, lng) tuple, or None if there is no land pixel in range
+        """
+        row, col = self.pixel(lat, lng)
+        row_span = math.ceil(max_radius_km / self.km_per_pixel)
+        col_span = min(math.ceil(row_span / max(math.cos(math.radians(lat)), 0.01)), self.cols // 2)
+
+        row0, row1 = max(row - row_span, 0), min(row + row_span, self.rows - 1)
+        cols = np.arange(col - col_span, col + col_span + 1) % self.cols
+
+        land_rows, land_cols = np.nonzero(self.window(row0, row1, cols) == LAND)
+        if len(land_rows) == 0:
+            return None
+
+        lats, lngs = self.pixel_center(land_rows + row0, cols[land_cols])
+        distances = geo_kernels.haversine((lat, lng), lats, lngs)
+        nearest = int(np.argmin(distances))
+        if distances[nearest] > max_radius_km:
+            return None
+        return float(lats[nearest]), float(lngs[nearest])
+
+    def stats(self) -> Dict[str, Any]:
+        """Mask metadata for monitoring."""
+        return {
+            "path": self.path,
+            "pixels_per_degree": self.pixels_per_degree,
+            "km_per_pixel": round(self.km_per_pixel, 3),
+            "tile_size": self.tile_size,
+            "stored_tiles": self.tile_count,
+            "total_tiles": int(self.index.size),
+        }
+
+
+def pack_tile(tile: np.ndarray) -> np.ndarray:
+    """Pack a (n, n) array of 2-bit values into (n, n / 4) bytes."""
+    quads = tile.reshape(tile.shape[0], -1, 4).astype(np.uint8)
+    return quads[..., 0] | (quads[..., 1] << 2) | (quads[..., 2] << 4) | (quads[..., 3] << 6)
+
+
+def unpack_tile(packed: np.ndarray) -> np.ndarray:
+    """Inverse of pack_tile."""
+    return np.stack([(packed >> shift) & 3 for shift in (0, 2, 4, 6)], axis=-1).reshape(packed.shape[0], -1)
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+def _iter_rings(geometry: Dict[str, Any]) -> Iterator[List[List[float]]]:
+    """Yield the rings (outer and holes) of a GeoJSON geometry."""
+    kind = geometry.get("type")
+    if kind == "Polygon":
+        yield from geometry["coordinates"]
+    elif kind == "MultiPolygon":
+        for polygon in geometry["coordinates"]:
+            yield from polygon
+    elif kind == "GeometryCollection":
+        for child in geometry.get("geometries", []):
+            yield from _iter_rings(child)
+
+
+def load_polygon_edges(geojson_path: str, pixels_per_degree: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read land polygons and convert their rings to edges in pixel space.
+
+    Args:
+        geojson_path: FeatureCollection, Feature or geometry of land polygons
+        pixels_per_degree: Raster resolution
+
+    Returns:
+        (edges, vertices): edges is an (n, 4) array of x0, y0, x1, y1;
+        vertices is an (m, 2) array of x, y
+    """
+    with open(geojson_path) as f:
+        document = json.load(f)
+
+    if document.get("type") == "FeatureCollection":
+        geometries = [feature["geometry"] for feature in document["features"] if feature.get("geometry")]
+    elif document.get("type") == "Feature":
+        geometries = [document["geometry"]]
+    else:
+        geometries = [document]
+
+    edges = []
+    vertices = []
+    for geometry in geometries:
+        for ring in _iter_rings(geometry):
+            points = np.asarray(ring, dtype=np.float64)[:, :2]
+            xs = (points[:, 0] + 180.0) * pixels_per_degree
+            ys = (90.0 - points[:, 1]) * pixels_per_degree
+            # Close the ring if the file did not
+            if xs[0] != xs[-1] or ys[0] != ys[-1]:
+                xs, ys = np.append(xs, xs[0]), np.append(ys, ys[0])
+            edges.append(np.column_stack((xs[:-1], ys[:-1], xs[1:], ys[1:])))
+            vertices.append(np.column_stack((xs, ys)))
+
+    if not edges:
+        return np.zeros((0, 4)), np.zeros((0, 2))
+
+    edges = np.concatenate(edges)
+    # Horizontal edges never cross a scanline
+    edges = edges[edges[:, 1] != edges[:, 3]]
+    return edges, np.concatenate(vertices)
+
+
+def rasterize_rows(edges: np.ndarray, row0: int, row1: int, width: int) -> np.ndarray:
+    """
+    Scanline-fill polygon edges for pixel rows row0..row1 (exclusive).
+
+    Pixels whose centers are inside (even-odd rule) are LAND, the rest WATER.
+
+    Returns:
+        (row1 - row0, width) uint8 array
+    """
+    out = np.zeros((row1 - row0, width), dtype=np.uint8)
+    if len(edges) == 0:
+        return out
+
+    x0, y0, x1, y1 = edges.T
+    for row in range(row0, row1):
+        yc = row + 0.5
+        crossing = ((y0 <= yc) & (yc < y1)) | ((y1 <= yc) & (yc < y0))
+        if not crossing.any():
+            continue
+
+        a0, b0, a1, b1 = x0[crossing], y0[crossing], x1[crossing], y1[crossing]
+        xs = np.sort(a0 + (yc - b0) * (a1 - a0) / (b1 - b0))
+
+        # Fill pixel centers between pairs of crossings
+        starts = np.clip(np.ceil(xs[0::2] - 0.5), 0, width).astype(np.int64)
+        ends = np.clip(np.ceil(xs[1::2] - 0.5), 0, width).astype(np.int64)
+        diff = np.zeros(width + 1, dtype=np.int32)
+        np.add.at(diff, starts, 1)
+        np.add.at(diff, ends, -1)
+        out[row - row0] = np.cumsum(diff[:-1]) > 0
+
+    return out
+
+
+def mark_ambiguous(band: np.ndarray) -> np.ndarray:
+    """
+    Mark pixels on the land/water boundary as AMBIGUOUS.
+
+    band includes one context row above and below; the returned array
+    drops them. Columns wrap around the antimeridian.
+    """
+    core = band[1:-1]
+    boundary = (
+        (core != band[:-2]) | (core != band[2:]) |
+        (core != np.roll(core, 1, axis=1)) | (core != np.roll(core, -1, axis=1))
+    )
+    return np.where(boundary, AMBIGUOUS, core).astype(np.uint8)
+
+
+def build_land_mask(
+    geojson_path: str,
+    out_path: str,
+    pixels_per_degree: int = 120,
+    tile_size: int = 256,
+    bbox: Optional[Tuple[float, float, float, float]] = None
+) -> Dict[str, int]:
+    """
+    Rasterize land polygons into a tiled mask file.
+
+    Args:
+        geojson_path: Land polygons (GeoJSON)
+        out_path: Output mask file
+        pixels_per_degree: Resolution (120 = ~0.93 km pixels)
+        tile_size: Tile edge in pixels (multiple of 4)
+        bbox: (min_lng, min_lat, max_lng, max_lat) to build; tiles outside are AMBIGUOUS
+
+    Returns:
+        Dict with tile counts
+    """
+    if tile_size % 4:
+        raise ValueError("tile_size must be a multiple of 4")
+
+    rows, cols = 180 * pixels_per_degree, 360 * pixels_per_degree
+    tile_rows, tile_cols = math.ceil(rows / tile_size), math.ceil(cols / tile_size)
+    width = tile_cols * tile_size
+
+    if bbox:
+        min_lng, min_lat, max_lng, max_lat = bbox
+        first_tile_row = int((90.0 - max_lat) * pixels_per_degree) // tile_size
+        last_tile_row = min(int((90.0 - min_lat) * pixels_per_degree) // tile_size, tile_rows - 1)
+        first_tile_col = int((min_lng + 180.0) * pixels_per_degree) // tile_size
+        last_tile_col = min(int((max_lng + 180.0) * pixels_per_degree) // tile_size, tile_cols - 1)
+    else:
+        first_tile_row, last_tile_row, first_tile_col, last_tile_col = 0, tile_rows - 1, 0, tile_cols - 1
+
+    edges, vertices = load_polygon_edges(geojson_path, pixels_per_degree)
+    edge_min_y = np.minimum(edges[:, 1], edges[:, 3])
+    edge_max_y = np.maximum(edges[:, 1], edges[:, 3])
+    vertex_rows = np.floor(vertices[:, 1]).astype(np.int64)
+    vertex_cols = np.floor(vertices[:, 0]).astype(np.int64) % cols
+
+    index = np.full((tile_rows, tile_cols), -1 - AMBIGUOUS, dtype=np.int32)
+    tile_count = 0
+    data_path = out_path + ".tiles"
+
+    with open(data_path, "wb") as data:
+        for tile_row in range(first_tile_row, last_tile_row + 1):
+            row0 = tile_row * tile_size
+            row1 = row0 + tile_size
+
+            # One context row above and below for boundary detection
+            band_row0, band_row1 = max(row0 - 1, 0), min(row1 + 1, rows)
+            in_band = (edge_max_y >= band_row0) & (edge_min_y <= band_row1)
+            filled = rasterize_rows(edges[in_band], band_row0, band_row1, cols)
+            if band_row0 == row0:
+                filled = np.vstack((filled[:1], filled))
+            if band_row1 <= row1:
+                filled = np.vstack((filled, filled[-1:]))
+            band = mark_ambiguous(filled)
+
+            # Polygon vertices: small islands and sharp features
+            near = (vertex_rows >= row0) & (vertex_rows < min(row1, rows))
+            band[vertex_rows[near] - row0, vertex_cols[near]] = AMBIGUOUS
+
+            # Pad past the south pole and the last column by repeating the
+            # edge pixels (never looked up, but keeps edge tiles uniform)
+            band = np.pad(band, ((0, tile_size - band.shape[0]), (0, width - cols)), mode="edge")
+
+            for tile_col in range(first_tile_col, last_tile_col + 1):
+                tile = band[:, tile_col * tile_size:(tile_col + 1) * tile_size]
+                first = tile[0, 0]
+                if (tile == first).all():
+                    index[tile_row, tile_col] = -1 - int(first)
+                else:
+                    data.write(pack_tile(tile).tobytes())
+                    index[tile_row, tile_col] = tile_count
+                    tile_count += 1
+
+    with open(out_path, "wb") as out:
+        header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, pixels_per_degree, tile_size, tile_rows, tile_cols, tile_count)
+        out.write(header.ljust(HEADER_SIZE, b"\0"))
+        out.write(index.tobytes())
+        with open(data_path, "rb") as data:
+            shutil.copyfileobj(data, out)
+    os.remove(data_path)
+
+    return {
+        "total_tiles": int(index.size),
+        "stored_tiles": tile_count,
+        "built_tiles": (last_tile_row - first_tile_row + 1) * (last_tile_col - first_tile_col + 1),
+    }
+
+
+def load_land_mask(path: str) -> Optional[LandMask]:
+    """
+    Open a land mask if configured.
+
+    Returns:
+        LandMask, or None if path is empty or the file is missing/invalid
+    """
+    if not path:
+        return None
+    try:
+        mask = LandMask(path)
+    except (OSError, ValueError) as e:
+        log.warning("land_mask_unavailable", path=path, error=str(e))
+        return None
+
+    log.info("land_mask_loaded", **mask.stats())
+    return mask
@@ -0,0 +1,157 @@
+"""Incremental per-event Minimum Enclosing Circle state.
+
+The MEC of an event's participants is persisted on the Event row and kept
+up to date as participants join, move and leave, so reads never reload
+participants. Only the boundary (support) points determine the circle:
+
+- a point added inside the circle leaves it unchanged (O(1))
+- a non-boundary point moving to somewhere inside leaves it unchanged (O(1))
+- a non-boundary point leaving leaves it unchanged (O(1))
+
+Anything else triggers a full rebuild from the participant rows. All
+functions only mutate the event; the caller commits in the same transaction
+as the participant change, and must have loaded the event with
+with_for_update() so concurrent joins, moves and leaves serialize on the
+event row instead of overwriting each other's circle and count.
+
+Events created before the state existed are backfilled by
+app.cli.reprocess_events; until then read_event_mec computes their circle
+on the fly without storing it, so reads never lock or write the event.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.event import Event, Participant
+from app.services.algorithms import MIN_RADIUS_KM, compute_mec, compute_mec_with_support, haversine_distance
+
+# Slack for the containment test, so points on the boundary count as inside
+_INSIDE_TOLERANCE_KM = 1e-6
+
+
+def mec_state_values(participant_ids: List[str], locations: List[Tuple[float, float]]) -> Dict[str, Any]:
+    """
+    Compute the Event column values for a participant set.
+
+    Args:
+        participant_ids: Participant IDs, parallel to locations
+        locations: List of (lat, lng) tuples
+
+    Returns:
+        Dict of mec_* column values
+    """
+    result = compute_mec_with_support(locations)
+    if result is None:
+        return {
+            "mec_center_lat": None,
+            "mec_center_lng": None,
+            "mec_radius_km": None,
+            "mec_support": json.dumps([]),
+            "mec_participant_count": 0,
+        }
+
+    center_lat, center_lng, radius_km, support = result
+    return {
+        "mec_center_lat": center_lat,
+        "mec_center_lng": center_lng,
+        "mec_radius_km": radius_km,
+        "mec_support": json.dumps([participant_ids[i] for i in support]),
+        "mec_participant_count": len(locations),
+    }
+
+
+def rebuild_event_mec(db: Session, event: Event) -> None:
+    """
+    Recompute the event's MEC from all of its participants.
+
+    Args:
+        db: Database session
+        event: Event to update
+    """
+    # Make pending participant changes visible to the query below
+    db.flush()
+
+    rows = db.query(Participant.id, Participant.lat, Participant.lng).filter(
+        Participant.event_id == event.id
+    ).all()
+
+    values = mec_state_values([row[0] for row in rows], [(lat, lng) for _, lat, lng in rows])
+    for column, value in values.items():
+        setattr(event, column, value)
+
+
+def get_event_circle(event: Event) -> Optional[Tuple[float, float, float]]:
+    """
+    Read the cached MEC in the same shape as compute_mec.
+
+    Returns:
+        (center_lat, center_lng, radius_km) tuple, or None if no participants
+    """
+    if not event.mec_participant_count or event.mec_center_lat is None:
+        return None
+
+    return (event.mec_center_lat, event.mec_center_lng, max(event.mec_radius_km, MIN_RADIUS_KM))
+
+
+def read_event_mec(db: Session, event: Event) -> Tuple[Optional[Tuple[float, float, float]], int]:
+    """
+    Read the event's circle and participant count.
+
+    Uses the cached state; events that were never backfilled get both
+    computed from their participants, without writing them back.
+
+    Args:
+        db: Database session
+        event: Event to read
+
+    Returns:
+        (circle, participant_count), with circle as for get_event_circle
+    """
+    if event.mec_participant_count is not None:
+        return get_event_circle(event), event.mec_participant_count
+
+    locations = db.query(Participant.lat, Participant.lng).filter(Participant.event_id == event.id).all()
+    return compute_mec([(lat, lng) for lat, lng in locations]), len(locations)
+
+
+def _is_inside(event: Event, lat: float, lng: float) -> bool:
+    """Check if a point is inside the cached (exact) circle."""
+    distance = haversine_distance(event.mec_center_lat, event.mec_center_lng, lat, lng)
+    return distance <= event.mec_radius_km + _INSIDE_TOLERANCE_KM
+
+
+def _is_support(event: Event, participant_id: str) -> bool:
+    """Check if a participant is one of the circle's boundary points."""
+    return participant_id in json.loads(event.mec_support or "[]")
+
+
+def on_participant_added(db: Session, event: Event, participant: Participant) -> None:
+    """Update the event's MEC after a participant joins."""
+    if event.mec_participant_count and _is_inside(event, participant.lat, participant.lng):
+        event.mec_participant_count += 1
+        return
+
+    rebuild_event_mec(db, event)
+
+
+def on_participant_moved(db: Session, event: Event, participant: Participant) -> None:
+    """Update the event's MEC after a participant's location changes."""
+    if (
+        event.mec_participant_count
+        and not _is_support(event, participant.id)
+        and _is_inside(event, participant.lat, participant.lng)
+    ):
+        return
+
+    rebuild_event_mec(db, event)
+
+
+def on_participant_removed(db: Session, event: Event, participant_id: str) -> None:
+    """Update the event's MEC after a participant leaves."""
+    if event.mec_participant_count and not _is_support(event, participant_id):
+        event.mec_participant_count -= 1
+        return
+
+    rebuild_event_mec(db, event)
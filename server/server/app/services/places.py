@@ -0,0 +1,43 @@
+"""Compact place records parsed from Nearby Search results.
+
+A Nearby Search result carries photos, icons, plus codes, types and more;
+the search only needs a handful of fields. Place keeps just those in a
+tuple (no per-instance __dict__), and the same record flows unchanged
+through de-duplication, distance computation, the places cache and the
+bulk insert of candidates.
+"""
+
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Union
+
+
+class Place(NamedTuple):
+    """A venue from Nearby Search."""
+    place_id: str
+    name: str
+    address: str
+    lat: float
+    lng: float
+    rating: Optional[float]
+    user_ratings_total: int
+    opening_hours: Optional[Dict[str, Any]]
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "Place":
+        """Extract the used fields of one decoded Nearby Search result (unrated venues get rating None)."""
+        location = result["geometry"]["location"]
+        rating = result.get("rating", 0)
+        return cls(
+            result.get("place_id"),
+            result.get("name", ""),
+            result.get("vicinity", ""),
+            location["lat"],
+            location["lng"],
+            rating if rating > 0 else None,
+            result.get("user_ratings_total", 0),
+            result.get("opening_hours"),
+        )
+
+    @classmethod
+    def from_row(cls, row: Union["Place", Sequence[Any]]) -> "Place":
+        """Rebuild a place from a cached row (JSON-serialized records come back as lists)."""
+        return row if isinstance(row, cls) else cls(*row)
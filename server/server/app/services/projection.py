@@ -0,0 +1,242 @@
+"""Local tangent-plane projection of a participant set.
+
+Geometry on one event's participants (MEC, containment, distances) is done
+in a local equirectangular frame in kilometers: points are projected once,
+operations are plain planar arithmetic on NumPy arrays, and results are
+converted back to lat/lng only when leaving this module. Projections are
+cached per event, keyed by a hash of the participant set, so repeated
+searches and center drags on an unchanged event reuse the same frame.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.services import geo_kernels
+
+# Relative tolerance used by the planar containment test
+_MEC_EPSILON = 1e-9
+
+# Number of points tested per vectorized containment scan
+_MEC_SCAN_CHUNK = 4096
+
+
+def _circle_from_two(ax: float, ay: float, bx: float, by: float) -> Tuple[float, float, float]:
+    """Smallest circle through two points (they form a diameter). Returns (cx, cy, r²)."""
+    cx = (ax + bx) / 2
+    cy = (ay + by) / 2
+    return (cx, cy, (ax - cx) ** 2 + (ay - cy) ** 2)
+
+
+def _circle_from_three(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+) -> Tuple[float, float, float]:
+    """
+    Circumcircle of three points. Returns (cx, cy, r²).
+
+    Collinear triples have no circumcircle; their minimum circle is the one
+    spanning the farthest pair.
+    """
+    # Translate to a for numerical stability
+    bx -= ax
+    by -= ay
+    cx -= ax
+    cy -= ay
+    d = 2 * (bx * cy - by * cx)
+    if abs(d) < 1e-12:
+        candidates = [
+            _circle_from_two(0.0, 0.0, bx, by),
+            _circle_from_two(0.0, 0.0, cx, cy),
+            _circle_from_two(bx, by, cx, cy),
+        ]
+        ux, uy, r2 = max(candidates, key=lambda c: c[2])
+        return (ux + ax, uy + ay, r2)
+
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    ux = (cy * b2 - by * c2) / d
+    uy = (bx * c2 - cx * b2) / d
+    return (ux + ax, uy + ay, ux * ux + uy * uy)
+
+
+def _first_outside(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    start: int,
+    stop: int,
+    circle: Tuple[float, float, float]
+) -> int:
+    """
+    Index of the first point in xs/ys[start:stop] outside the circle, or -1.
+
+    Scans in fixed-size chunks so finding an early violator does not pay for
+    testing the whole array.
+    """
+    cx, cy, r2 = circle
+    limit = r2 * (1 + _MEC_EPSILON) + _MEC_EPSILON
+    for lo in range(start, stop, _MEC_SCAN_CHUNK):
+        hi = min(lo + _MEC_SCAN_CHUNK, stop)
+        dx = xs[lo:hi] - cx
+        dy = ys[lo:hi] - cy
+        hits = np.flatnonzero(dx * dx + dy * dy > limit)
+        if hits.size:
+            return lo + int(hits[0])
+    return -1
+
+
+def planar_mec(xs: np.ndarray, ys: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Minimum enclosing circle of planar points. Returns (cx, cy, r²).
+
+    Iterative move-to-front form of Welzl's algorithm. Points must already be
+    in random order; xs and ys are reordered in place as boundary points are
+    moved to the front.
+    """
+    circle = (float(xs[0]), float(ys[0]), 0.0)
+    n = _first_outside(xs, ys, 1, len(xs), circle)
+    while n != -1:
+        px, py = float(xs[n]), float(ys[n])
+
+        # p lies on the boundary of the MEC of the first n + 1 points
+        circle = (px, py, 0.0)
+        m = _first_outside(xs, ys, 0, n, circle)
+        while m != -1:
+            qx, qy = float(xs[m]), float(ys[m])
+
+            # p and q both lie on the boundary
+            circle = _circle_from_two(px, py, qx, qy)
+            k = _first_outside(xs, ys, 0, m, circle)
+            while k != -1:
+                circle = _circle_from_three(px, py, qx, qy, float(xs[k]), float(ys[k]))
+                k = _first_outside(xs, ys, k + 1, m, circle)
+
+            m = _first_outside(xs, ys, m + 1, n, circle)
+
+        # Move-to-front: boundary points are tested first by later passes
+        xs[1:n + 1] = xs[:n].copy()
+        ys[1:n + 1] = ys[:n].copy()
+        xs[0], ys[0] = px, py
+
+        n = _first_outside(xs, ys, n + 1, len(xs), circle)
+
+    return circle
+
+
+class LocalProjection:
+    """
+    A set of points projected into a local equirectangular frame.
+
+    The frame is centered on the spherical centroid, and longitude deltas are
+    wrapped so groups straddling the antimeridian stay contiguous.
+    """
+
+    def __init__(self, lats: np.ndarray, lngs: np.ndarray):
+        self.lats = geo_kernels.as_array(lats)
+        self.lngs = geo_kernels.as_array(lngs)
+        self.ref_lat, self.ref_lng = geo_kernels.centroid(self.lats, self.lngs)
+        self.xs, self.ys = geo_kernels.project_local(self.lats, self.lngs, self.ref_lat, self.ref_lng)
+        self._mec: Optional[Tuple[float, float, float, List[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def project(self, lats, lngs) -> Tuple[np.ndarray, np.ndarray]:
+        """Project other coordinates into this frame (km)."""
+        return geo_kernels.project_local(lats, lngs, self.ref_lat, self.ref_lng)
+
+    def unproject(self, xs, ys) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert frame coordinates back to (lats, lngs)."""
+        return geo_kernels.unproject_local(xs, ys, self.ref_lat, self.ref_lng)
+
+    def distances_from(self, x: float, y: float) -> np.ndarray:
+        """Planar distances (km) from a frame point to every projected point."""
+        return np.hypot(self.xs - x, self.ys - y)
+
+    def contains(self, lats, lngs, circle: Tuple[float, float, float]) -> np.ndarray:
+        """
+        Check which coordinates lie inside a circle.
+
+        Args:
+            lats, lngs: Coordinates to test
+            circle: (center_lat, center_lng, radius_km)
+
+        Returns:
+            Boolean array, one value per coordinate
+        """
+        center_x, center_y = self.project((circle[0],), (circle[1],))
+        xs, ys = self.project(lats, lngs)
+        return np.hypot(xs - center_x[0], ys - center_y[0]) <= circle[2] * (1 + _MEC_EPSILON)
+
+    def mec(self) -> Tuple[float, float, float, List[int]]:
+        """
+        Minimum Enclosing Circle of the projected points (computed once).
+
+        Returns:
+            (center_lat, center_lng, radius_km, support_indices). The radius is
+            the largest great-circle distance from the center, so every point
+            is inside; support lists the points on the planar boundary.
+        """
+        if self._mec is None:
+            # Random order gives the expected linear running time
+            order = np.random.permutation(len(self.xs))
+            cx, cy, r2 = planar_mec(self.xs[order], self.ys[order])
+
+            # Boundary points, with a small tolerance so co-circular points all count
+            d2 = (self.xs - cx) ** 2 + (self.ys - cy) ** 2
+            support = np.flatnonzero(d2 >= r2 * (1 - 1e-6) - _MEC_EPSILON).tolist()
+
+            center_lats, center_lngs = self.unproject((cx,), (cy,))
+            center_lat, center_lng = float(center_lats[0]), float(center_lngs[0])
+            radius = float(geo_kernels.haversine((center_lat, center_lng), self.lats, self.lngs).max())
+            self._mec = (center_lat, center_lng, radius, support)
+
+        return self._mec
+
+
+def participant_set_key(lats: np.ndarray, lngs: np.ndarray) -> str:
+    """Order-independent hash of a set of coordinates."""
+    coords = np.column_stack((geo_kernels.as_array(lats), geo_kernels.as_array(lngs)))
+    coords = coords[np.lexsort((coords[:, 1], coords[:, 0]))]
+    return hashlib.blake2b(coords.tobytes(), digest_size=16).hexdigest()
+
+
+class ProjectionCache:
+    """LRU cache of LocalProjection objects keyed by event and participant set."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, LocalProjection]]" = OrderedDict()
+
+    def get(self, event_id: str, locations: List[Tuple[float, float]]) -> Optional[LocalProjection]:
+        """
+        Get the projection for an event's current participant locations.
+
+        Reuses the cached projection if the participant set is unchanged,
+        otherwise projects the new set and replaces it.
+
+        Returns:
+            LocalProjection, or None if there are no locations
+        """
+        if not locations:
+            return None
+
+        coords = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+        key = participant_set_key(coords[:, 0], coords[:, 1])
+
+        entry = self._entries.get(event_id)
+        if entry is not None and entry[0] == key:
+            self._entries.move_to_end(event_id)
+            return entry[1]
+
+        projection = LocalProjection(coords[:, 0], coords[:, 1])
+        self._entries[event_id] = (key, projection)
+        self._entries.move_to_end(event_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return projection
+
+
+# Singleton instance
+projection_cache = ProjectionCache()
@@ -0,0 +1,251 @@
+"""Outbound quota governor for Google Maps calls.
+
+One token bucket per upstream endpoint (rate GOOGLE_MAPS_QUOTA_QPS, burst
+GOOGLE_MAPS_QUOTA_BURST). With the redis backend the buckets are shared by
+all uvicorn workers through an atomic Lua script; if Redis is unreachable
+each worker falls back to its own in-process bucket.
+
+Requests carry a priority class in a context variable. Interactive
+requests (the default) may drain the whole bucket; background requests
+(cache refreshes, warm-ups) leave a reserve of tokens untouched, so they
+queue behind interactive traffic instead of competing with it.
+"""
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Tuple
+
+import structlog
+
+from app.services.resilience import LatencyWindow, UpstreamUnavailableError
+
+log = structlog.get_logger()
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+_priority: ContextVar[str] = ContextVar("maps_request_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """Run the enclosed Maps calls (and tasks created inside) at a priority class."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+class QuotaExceededError(UpstreamUnavailableError):
+    """The outbound quota would not allow the call within its maximum wait."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(endpoint, "over query limit")
+        self.retry_after = retry_after
+
+
+# KEYS[1] bucket; ARGV rate, burst, now, reserve. Returns seconds to wait ("0" = granted).
+_TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local reserve = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= reserve + 1 then
+    tokens = tokens - 1
+else
+    wait = (reserve + 1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class LocalTokenBucket:
+    """In-process token bucket with the same semantics as the Lua script."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self, reserve: float = 0.0) -> float:
+        """Take one token if more than reserve remain; otherwise return seconds to wait."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= reserve + 1:
+            self.tokens -= 1
+            return 0.0
+        return (reserve + 1 - self.tokens) / self.rate
+
+
+class QuotaGovernor:
+    """Per-endpoint token buckets with priority classes and queueing metrics."""
+
+    def __init__(
+        self,
+        backend: str,
+        redis_url: str,
+        rate: float,
+        burst: int,
+        background_reserve: float,
+        max_wait: Dict[str, float]
+    ):
+        """
+        Args:
+            backend: "memory", "redis" or "none" (unlimited)
+            redis_url: Redis URL (redis backend only)
+            rate: Tokens per second per endpoint
+            burst: Bucket size
+            background_reserve: Fraction of the bucket background requests may not use
+            max_wait: Maximum queueing seconds per priority class before giving up
+        """
+        if backend not in ("memory", "redis", "none"):
+            raise ValueError(f"Unknown quota backend: {backend}")
+
+        self.backend = backend
+        self.rate = rate
+        self.burst = burst
+        self.background_reserve = background_reserve
+        self.max_wait = max_wait
+
+        self._local: Dict[str, LocalTokenBucket] = {}
+        self._redis = None
+        self._script = None
+        if backend == "redis":
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(redis_url)
+            self._script = self._redis.register_script(_TOKEN_BUCKET_LUA)
+
+        self.fallbacks = 0
+        self._stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def _reserve(self, priority: str) -> float:
+        return self.burst * self.background_reserve if priority == BACKGROUND else 0.0
+
+    async def _take(self, endpoint: str, reserve: float) -> float:
+        """Try to take a token; returns seconds to wait (0 if granted)."""
+        if self._script is not None:
+            try:
+                wait = await self._script(
+                    keys=[f"w2m:quota:{endpoint}"],
+                    args=[self.rate, self.burst, time.time(), reserve]
+                )
+                return float(wait)
+            except Exception as e:
+                # Redis down: fall back to this worker's own bucket
+                self.fallbacks += 1
+                log.warning("quota_backend_error", endpoint=endpoint, error=str(e))
+
+        bucket = self._local.get(endpoint)
+        if bucket is None:
+            bucket = self._local[endpoint] = LocalTokenBucket(self.rate, self.burst)
+        return bucket.take(reserve)
+
+    def _endpoint_stats(self, endpoint: str, priority: str) -> Dict[str, Any]:
+        stats = self._stats.get((endpoint, priority))
+        if stats is None:
+            stats = self._stats[(endpoint, priority)] = {
+                "acquired": 0, "queued": 0, "rejected": 0, "skipped": 0, "wait": LatencyWindow(), "max_wait": 0.0
+            }
+        return stats
+
+    async def acquire(self, endpoint: str) -> float:
+        """
+        Wait for a token of endpoint at the current priority.
+
+        Returns:
+            Seconds spent queueing
+
+        Raises:
+            QuotaExceededError: A token would not be available within the class's max wait
+        """
+        if self.backend == "none":
+            return 0.0
+
+        priority = current_priority()
+        reserve = self._reserve(priority)
+        max_wait = self.max_wait.get(priority, self.max_wait[INTERACTIVE])
+        stats = self._endpoint_stats(endpoint, priority)
+
+        started = time.monotonic()
+        wait = await self._take(endpoint, reserve)
+        if wait > 0:
+            stats["queued"] += 1
+
+        while wait > 0:
+            if time.monotonic() - started + wait > max_wait:
+                stats["rejected"] += 1
+                raise QuotaExceededError(endpoint, wait)
+            # Jitter so queued callers do not all retry at the same instant
+            await asyncio.sleep(wait * random.uniform(1.0, 1.2))
+            wait = await self._take(endpoint, reserve)
+
+        waited = time.monotonic() - started
+        stats["acquired"] += 1
+        stats["wait"].record(waited)
+        stats["max_wait"] = max(stats["max_wait"], waited)
+        return waited
+
+    async def try_acquire(self, endpoint: str) -> bool:
+        """
+        Take a token of endpoint at the current priority only if one is available now.
+
+        For optional calls (hedges) that should be skipped rather than queued.
+        """
+        if self.backend == "none":
+            return True
+
+        priority = current_priority()
+        stats = self._endpoint_stats(endpoint, priority)
+        if await self._take(endpoint, self._reserve(priority)) > 0:
+            stats["skipped"] += 1
+            return False
+
+        stats["acquired"] += 1
+        stats["wait"].record(0.0)
+        return True
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queueing metrics per endpoint and priority class."""
+        endpoints: Dict[str, Dict[str, Any]] = {}
+        for (endpoint, priority), stats in self._stats.items():
+            p50 = stats["wait"].percentile(0.5)
+            p95 = stats["wait"].percentile(0.95)
+            endpoints.setdefault(endpoint, {})[priority] = {
+                "acquired": stats["acquired"],
+                "queued": stats["queued"],
+                "rejected": stats["rejected"],
+                "skipped": stats["skipped"],
+                "p50_wait_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p95_wait_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "max_wait_ms": round(stats["max_wait"] * 1000, 1),
+            }
+
+        return {
+            "backend": self.backend,
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "fallbacks": self.fallbacks,
+            "endpoints": endpoints,
+        }
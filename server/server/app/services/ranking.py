@@ -0,0 +1,116 @@
+"""Composite candidate ranking.
+
+Scores every candidate of an event in one vectorized pass from its rating,
+number of ratings, distance from the search center, in-circle flag and live
+vote count, then selects the top k with a partial sort. Each signal is
+normalized to [0, 1] before weighting:
+
+- rating: rating / 5 (unrated counts as 0)
+- popularity: log(1 + ratings) / log(1 + max ratings in the pool)
+- proximity: 1 - distance / max distance in the pool (unknown counts as 0)
+- in_circle: 1 or 0
+- votes: votes / max votes in the pool
+"""
+
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+
+
+class RankingWeights(NamedTuple):
+    """Weight of each normalized signal in the composite score."""
+    rating: float
+    popularity: float
+    proximity: float
+    in_circle: float
+    votes: float
+
+
+def default_weights() -> RankingWeights:
+    """Weights from settings."""
+    return RankingWeights(
+        rating=settings.RANKING_WEIGHT_RATING,
+        popularity=settings.RANKING_WEIGHT_POPULARITY,
+        proximity=settings.RANKING_WEIGHT_PROXIMITY,
+        in_circle=settings.RANKING_WEIGHT_IN_CIRCLE,
+        votes=settings.RANKING_WEIGHT_VOTES,
+    )
+
+
+def _scale_to_max(values: np.ndarray) -> np.ndarray:
+    """Divide by the pool maximum (all zeros if the maximum is 0)."""
+    peak = values.max()
+    return values / peak if peak > 0 else np.zeros_like(values)
+
+
+def compute_scores(
+    ratings: Sequence[Optional[float]],
+    ratings_total: Sequence[Optional[int]],
+    distances_km: Sequence[Optional[float]],
+    in_circle: Sequence[bool],
+    votes: Sequence[int],
+    weights: Optional[RankingWeights] = None
+) -> np.ndarray:
+    """
+    Composite score for each candidate.
+
+    Args:
+        ratings: Google rating (0-5) per candidate, None if unrated
+        ratings_total: Number of Google ratings per candidate
+        distances_km: Distance from the search center, None if unknown
+        in_circle: Whether each candidate is inside the search circle
+        votes: Live vote count per candidate
+        weights: Signal weights (defaults from settings)
+
+    Returns:
+        Array of scores, higher is better
+    """
+    weights = weights or default_weights()
+    if len(ratings) == 0:
+        return np.zeros(0)
+
+    # None -> NaN via float conversion, then to the "worst" value
+    rating = np.nan_to_num(np.array(ratings, dtype=np.float64), nan=0.0) / 5.0
+    totals = np.nan_to_num(np.array(ratings_total, dtype=np.float64), nan=0.0)
+    distance = np.array(distances_km, dtype=np.float64)
+    inside = np.array(in_circle, dtype=np.float64)
+    vote = np.array(votes, dtype=np.float64)
+
+    popularity = _scale_to_max(np.log1p(totals))
+    known = ~np.isnan(distance)
+    proximity = np.zeros_like(distance)
+    if known.any():
+        farthest = distance[known].max()
+        proximity[known] = 1.0 - distance[known] / farthest if farthest > 0 else 1.0
+
+    return (
+        weights.rating * rating
+        + weights.popularity * popularity
+        + weights.proximity * proximity
+        + weights.in_circle * inside
+        + weights.votes * _scale_to_max(vote)
+    )
+
+
+def top_k(scores: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first.
+
+    Uses a partial selection (O(n)) and only sorts the k selected entries.
+
+    Args:
+        scores: Array of scores
+        k: Number of results (all if None)
+
+    Returns:
+        Array of indices into scores
+    """
+    n = len(scores)
+    if k is None or k >= n:
+        return np.argsort(-scores, kind="stable")
+
+    selected = np.argpartition(-scores, k - 1)[:k]
+    # Ties keep their original (index) order
+    return selected[np.lexsort((selected, -scores[selected]))]
@@ -0,0 +1,200 @@
+"""Resilience primitives for upstream HTTP calls.
+
+- backoff_delay: exponential backoff with full jitter between retries
+- CircuitBreaker: fails fast after repeated upstream failures, then lets a
+  single trial request through once the reset timeout has passed
+- LatencyWindow: recent latencies of an endpoint, for its p95
+- hedged: sends a second identical request if the first has not answered
+  within a delay (and the caller allows it, e.g. quota permitting); the
+  first response wins and the other is cancelled
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class UpstreamUnavailableError(Exception):
+    """An upstream endpoint failed after retries (maps to 503)."""
+
+    def __init__(self, endpoint: str, message: str = "upstream unavailable"):
+        super().__init__(f"{endpoint}: {message}")
+        self.endpoint = endpoint
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """The endpoint's circuit breaker is open; the call was not attempted."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(endpoint, "circuit open")
+        self.retry_after = retry_after
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Full-jitter exponential backoff.
+
+    Args:
+        attempt: Retry number (0 for the first retry)
+        base: Base delay in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Seconds to wait, uniform in [0, min(cap, base * 2^attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open)."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_after(self) -> float:
+        """Seconds until a trial request will be allowed."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the half-open trial slot)."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def release_trial(self) -> None:
+        """Give back the half-open trial slot without a verdict (e.g. cancelled call)."""
+        self.trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.trial_in_flight or self.failures >= self.failure_threshold:
+            # Failed trial or too many failures: (re)open
+            self.opened_at = time.monotonic()
+        self.trial_in_flight = False
+
+
+class LatencyWindow:
+    """Sliding window of recent latencies (seconds)."""
+
+    def __init__(self, size: int = 200):
+        self._samples = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q-th percentile (0-1), or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+async def hedged(
+    fn: Callable[[], Awaitable[T]],
+    delay: float,
+    stats: Optional[Dict[str, Any]] = None,
+    may_hedge: Optional[Callable[[], Awaitable[bool]]] = None
+) -> T:
+    """
+    Run fn(), and run it a second time if the first has not finished after delay.
+
+    The first successful result wins and the other call is cancelled. If
+    both fail, the last error is raised.
+
+    Args:
+        fn: Coroutine factory of an idempotent call
+        delay: Seconds to wait before hedging
+        stats: Optional dict whose "hedges" / "hedges_skipped" / "hedge_wins" counters are incremented
+        may_hedge: Optional check made when the delay has passed; the hedge is
+            skipped (the first call is awaited alone) if it returns False
+
+    Returns:
+        Result of the winning call
+    """
+    first = asyncio.ensure_future(fn())
+    pending = {first}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return first.result()
+
+        if may_hedge is not None and not await may_hedge():
+            if stats is not None:
+                stats["hedges_skipped"] = stats.get("hedges_skipped", 0) + 1
+            return await first
+
+        second = asyncio.ensure_future(fn())
+        pending.add(second)
+        if stats is not None:
+            stats["hedges"] = stats.get("hedges", 0) + 1
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is second and stats is not None:
+                        stats["hedge_wins"] = stats.get("hedge_wins", 0) + 1
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class EndpointHealth:
+    """Breaker, latency window and counters of one upstream endpoint."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, window: int = 200):
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.latency = LatencyWindow(window)
+        self.counters = {
+            "failures": 0, "retries": 0, "deadline_exceeded": 0, "over_query_limit": 0,
+            "hedges": 0, "hedges_skipped": 0, "hedge_wins": 0
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        p50 = self.latency.percentile(0.5)
+        p95 = self.latency.percentile(0.95)
+        return {
+            "state": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "rejected": self.breaker.rejected,
+            **self.counters,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+        }
@@ -0,0 +1,97 @@
+"""Coalescing of identical concurrent async calls ("singleflight").
+
+While a call for a key is in flight, further calls with the same key await
+the same task instead of starting their own. The task is shielded from any
+single caller: one caller getting cancelled (e.g. a client disconnect) does
+not cancel the shared upstream request for the others. Once every caller
+has been cancelled the task is cancelled too, so abandoned calls (a blown
+time budget, the losing probes of a race) stop instead of spending quota.
+Results are shared, not copied: callers must treat them as read-only.
+
+Maps calls made by the shared task are attributed to the event and request
+of every caller waiting on it (see app.services.instrumentation).
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.services.instrumentation import current_call_contexts, shared_call_contexts
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A shared call with the number of callers still waiting on it."""
+
+    def __init__(self, contexts: List[Tuple[Optional[str], Optional[str]]]):
+        self.task: Optional[asyncio.Task] = None
+        self.waiters = 0
+        self.contexts = contexts
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls by key."""
+
+    def __init__(self):
+        self._in_flight: Dict[str, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+        self.cancelled = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() for key, or join the call already in flight.
+
+        Args:
+            key: Normalized request key
+            fn: Coroutine factory for the upstream call
+
+        Returns:
+            The result of the (shared) call; its exception is raised to every caller
+        """
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            flight.contexts.extend(c for c in current_call_contexts() if c not in flight.contexts)
+        else:
+            self.calls += 1
+            flight = self._in_flight[key] = _Flight(current_call_contexts())
+            flight.task = asyncio.ensure_future(self._run(flight, fn))
+            flight.task.add_done_callback(lambda done: self._forget(key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled: stop the upstream call, and let
+                # new callers start a fresh one instead of joining a dying task
+                self.cancelled += 1
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    @staticmethod
+    async def _run(flight: _Flight, fn: Callable[[], Awaitable[T]]) -> T:
+        with shared_call_contexts(flight.contexts):
+            return await fn()
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for key is currently in flight."""
+        return key in self._in_flight
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        # Mark the exception retrieved even if every caller was cancelled
+        if flight.task.done() and not flight.task.cancelled():
+            flight.task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "cancelled": self.cancelled,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,79 @@
+"""Hexagonal tiling of a search circle.
+
+Nearby Search returns at most 60 results per query, ranked by prominence,
+so one query over a large circle yields a thin sample biased towards its
+center. Covering the circle with smaller tiles on a hexagonal lattice and
+querying each tile gives even coverage instead.
+"""
+
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+from app.services.geo_kernels import unproject_local
+
+SQRT3 = math.sqrt(3.0)
+
+
+def _hex_offsets(radius_km: float, tile_radius_km: float) -> List[Tuple[float, float]]:
+    """Lattice offsets (km) of the tiles intersecting the circle, nearest first."""
+    # Circles of radius r on a hexagonal lattice of spacing r*sqrt(3) circumscribe
+    # the lattice's hexagons, so together they cover the plane
+    spacing = tile_radius_km * SQRT3
+    n = int(math.ceil((radius_km + tile_radius_km) / spacing)) + 1
+
+    offsets = []
+    for r in range(-n, n + 1):
+        for q in range(-n, n + 1):
+            x = spacing * (q + r / 2.0)
+            y = spacing * SQRT3 / 2.0 * r
+            # The tile's hexagon lies within tile_radius_km of its center
+            if math.hypot(x, y) - tile_radius_km < radius_km:
+                offsets.append((x, y))
+
+    offsets.sort(key=lambda p: (round(math.hypot(*p), 6), math.atan2(p[1], p[0])))
+    return offsets
+
+
+def tile_radius(radius_km: float, min_tile_radius_km: float, max_tiles: int) -> float:
+    """
+    Smallest tile radius (at least min_tile_radius_km) that covers the circle with max_tiles tiles.
+
+    Args:
+        radius_km: Search circle radius
+        min_tile_radius_km: Preferred tile radius
+        max_tiles: Upper bound on the number of tiles
+
+    Returns:
+        Tile radius in kilometers
+    """
+    tile_radius_km = min_tile_radius_km
+    while tile_radius_km < radius_km and len(_hex_offsets(radius_km, tile_radius_km)) > max_tiles:
+        tile_radius_km *= 1.1
+    return min(tile_radius_km, radius_km)
+
+
+def hex_tiles(lat: float, lng: float, radius_km: float, tile_radius_km: float) -> List[Tuple[float, float]]:
+    """
+    Tile centers covering a circle with circles of tile_radius_km.
+
+    Args:
+        lat, lng: Circle center
+        radius_km: Circle radius
+        tile_radius_km: Radius of each tile
+
+    Returns:
+        (lat, lng) of each tile, the center tile first and then ring by ring outwards
+    """
+    if tile_radius_km >= radius_km:
+        return [(lat, lng)]
+
+    offsets = np.array(_hex_offsets(radius_km, tile_radius_km))
+    lats, lngs = unproject_local(offsets[:, 0], offsets[:, 1], lat, lng)
+    return list(zip(lats.tolist(), lngs.tolist()))
+
+
+def target_results(radius_km: float, density_per_km2: float, max_results: int) -> int:
+    """Number of unique venues after which a tiled search stops querying tiles."""
+    return max(1, min(max_results, int(math.ceil(density_per_km2 * math.pi * radius_km ** 2))))
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Google Maps web services, for load and latency tests.
+
+Serves Nearby Search, Place Details and reverse geocoding from a synthetic,
+deterministic world: a wavy coastline with lakes and bays (water where a sum
+of sinusoids exceeds a threshold) and venues scattered over the land with
+ratings, popularity and categories. Responses follow the Google JSON shapes
+the server relies on, including next_page_token semantics (20 results per
+page, 60 at most, tokens only valid after a delay), and every endpoint can
+be given a latency distribution and injected errors.
+
+Point the API at it with:
+    GOOGLE_MAPS_BASE_URL=http://127.0.0.1:8090/maps/api
+    GOOGLE_MAPS_PAGE_TOKEN_DELAY_SECONDS=<same as --page-token-delay>
+
+Usage:
+    python benchmarks/fake_maps_server.py --port 8090
+    python benchmarks/fake_maps_server.py --latency lognormal:120:0.5 --latency geocode=fixed:40 \\
+        --inject http_503=0.02 --inject OVER_QUERY_LIMIT=0.01 --page-token-delay 0.5
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+import uuid
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+ENDPOINTS = ["nearbysearch", "details", "geocode"]
+INJECTABLE = ["http_500", "http_503", "http_429", "timeout", "OVER_QUERY_LIMIT", "UNKNOWN_ERROR"]
+
+CATEGORIES = ["cafe", "restaurant", "bar", "bakery", "park", "library", "museum", "gym", "cinema", "bookstore"]
+NAME_WORDS = ["Golden", "Blue", "Corner", "Harbor", "Maple", "Union", "Sunny", "Old Town", "Little", "Grand"]
+STREETS = ["Main", "Oak", "Pine", "Market", "Church", "Mill", "Bridge", "Station", "Park", "High"]
+
+CELL_DEGREES = 0.01  # Venues are generated per cell of the lat/lng grid
+PAGE_SIZE = 20
+MAX_RESULTS = 60
+TOKEN_TTL_SECONDS = 120.0
+
+
+# ---------------------------------------------------------------------------
+# Synthetic world
+# ---------------------------------------------------------------------------
+
+class SyntheticWorld:
+    """Deterministic coastline and venues for a seed."""
+
+    def __init__(self, seed: int, water_fraction: float, venues_per_km2: float):
+        rng = np.random.default_rng(seed)
+        self.seed = seed
+        self.venues_per_km2 = venues_per_km2
+
+        # Sinusoid terms (frequency in radians per degree, phases); features of ~5-30 km
+        self._terms = [
+            (rng.uniform(15, 40), rng.uniform(15, 40), rng.uniform(0, 2 * np.pi), weight)
+            for weight in (1.0, 0.6, 0.3)
+        ]
+
+        # Threshold so that about water_fraction of the surface is water
+        samples = self._field(rng.uniform(-60, 60, 20000), rng.uniform(-180, 180, 20000))
+        self.threshold = float(np.quantile(samples, 1.0 - water_fraction)) if water_fraction > 0 else np.inf
+
+        self._cell = lru_cache(maxsize=100000)(self._generate_cell)
+
+    def _field(self, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        value = np.zeros(np.shape(lats))
+        for i, (fa, fb, phase, weight) in enumerate(self._terms):
+            value = value + weight * np.sin(fa * lats + phase) * np.cos(fb * lngs + phase * (i + 1))
+        return value
+
+    def is_water(self, lat: float, lng: float) -> bool:
+        return bool(self._field(np.array([lat]), np.array([lng]))[0] > self.threshold)
+
+    def _generate_cell(self, ci: int, cj: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Venues of one grid cell: (lats, lngs, prominence, category index)."""
+        rng = np.random.default_rng(zlib.crc32(f"{self.seed}:{ci}:{cj}".encode()))
+        lat0, lng0 = ci * CELL_DEGREES, cj * CELL_DEGREES
+        area_km2 = (CELL_DEGREES * 111.195) ** 2 * max(math.cos(math.radians(lat0)), 0.01)
+
+        n = rng.poisson(self.venues_per_km2 * area_km2)
+        lats = lat0 + rng.uniform(0, CELL_DEGREES, n)
+        lngs = lng0 + rng.uniform(0, CELL_DEGREES, n)
+        prominence = rng.pareto(1.5, n)
+        categories = rng.integers(0, len(CATEGORIES), n)
+
+        # Venues only exist on land
+        land = self._field(lats, lngs) <= self.threshold
+        return lats[land], lngs[land], prominence[land], categories[land]
+
+    def venue(self, ci: int, cj: int, k: int) -> Optional[Dict[str, Any]]:
+        """Full record of venue k of a cell, or None if it does not exist."""
+        lats, lngs, prominence, categories = self._cell(ci, cj)
+        if not 0 <= k < len(lats):
+            return None
+
+        rng = random.Random(f"{self.seed}:{ci}:{cj}:{k}")
+        category = CATEGORIES[int(categories[k])]
+        rating = round(min(5.0, 3.0 + 2.0 * (1 - math.exp(-float(prominence[k])))), 1)
+        return {
+            "place_id": f"fake_{ci}_{cj}_{k}",
+            "name": f"{rng.choice(NAME_WORDS)} {category.title()} {k}",
+            "lat": float(lats[k]),
+            "lng": float(lngs[k]),
+            "category": category,
+            "rating": rating if rng.random() > 0.05 else None,
+            "user_ratings_total": int(float(prominence[k]) * 200),
+            "street": f"{rng.randint(1, 999)} {rng.choice(STREETS)} St",
+            "open_hour": rng.choice([6, 7, 8, 9, 10, 11]),
+            "close_hour": rng.choice([17, 18, 20, 22, 23]),
+        }
+
+    def search(self, lat: float, lng: float, radius_m: float, keyword: str) -> List[Dict[str, Any]]:
+        """Venues within radius matching keyword, most prominent first (at most 60)."""
+        radius_km = radius_m / 1000
+        dlat = radius_km / 111.195
+        dlng = dlat / max(math.cos(math.radians(lat)), 0.01)
+
+        ids, lat_parts, lng_parts, prominence_parts, category_parts = [], [], [], [], []
+        for ci in range(math.floor((lat - dlat) / CELL_DEGREES), math.floor((lat + dlat) / CELL_DEGREES) + 1):
+            for cj in range(math.floor((lng - dlng) / CELL_DEGREES), math.floor((lng + dlng) / CELL_DEGREES) + 1):
+                lats, lngs, prominence, categories = self._cell(ci, cj)
+                if len(lats):
+                    ids.extend((ci, cj, k) for k in range(len(lats)))
+                    lat_parts.append(lats)
+                    lng_parts.append(lngs)
+                    prominence_parts.append(prominence)
+                    category_parts.append(categories)
+
+        if not ids:
+            return []
+
+        lats = np.concatenate(lat_parts)
+        lngs = np.concatenate(lng_parts)
+        prominence = np.concatenate(prominence_parts)
+        categories = np.concatenate(category_parts)
+
+        phi0, phi = np.radians(lat), np.radians(lats)
+        a = (np.sin((phi - phi0) / 2) ** 2 +
+             np.cos(phi0) * np.cos(phi) * np.sin(np.radians(lngs - lng) / 2) ** 2)
+        mask = 2 * 6371.0 * np.arcsin(np.sqrt(np.clip(a, 0, 1))) <= radius_km
+
+        keyword = keyword.lower().strip()
+        if keyword:
+            matching = [i for i, c in enumerate(CATEGORIES) if c in keyword or keyword in c]
+            if matching:
+                mask &= np.isin(categories, matching)
+            else:
+                # Unknown keywords match a stable subset of all venues
+                mask &= (categories + zlib.crc32(keyword.encode())) % 3 == 0
+
+        selected = np.flatnonzero(mask)
+        selected = selected[np.argsort(-prominence[selected], kind="stable")][:MAX_RESULTS]
+        return [self.venue(*ids[i]) for i in selected]
+
+
+# ---------------------------------------------------------------------------
+# Google response shapes
+# ---------------------------------------------------------------------------
+
+def nearby_result(venue: Dict[str, Any]) -> Dict[str, Any]:
+    result = {
+        "place_id": venue["place_id"],
+        "name": venue["name"],
+        "vicinity": venue["street"],
+        "geometry": {"location": {"lat": venue["lat"], "lng": venue["lng"]}},
+        "types": [venue["category"], "point_of_interest", "establishment"],
+        "user_ratings_total": venue["user_ratings_total"],
+        "opening_hours": {"open_now": venue["open_hour"] <= time.localtime().tm_hour < venue["close_hour"]},
+    }
+    if venue["rating"] is not None:
+        result["rating"] = venue["rating"]
+    return result
+
+
+def details_result(venue: Dict[str, Any]) -> Dict[str, Any]:
+    result = nearby_result(venue)
+    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    result["formatted_address"] = f"{venue['street']}, Synthetic City"
+    result["opening_hours"] = {
+        "open_now": result["opening_hours"]["open_now"],
+        "periods": [
+            {"open": {"day": d, "time": f"{venue['open_hour']:02d}00"},
+             "close": {"day": d, "time": f"{venue['close_hour']:02d}00"}}
+            for d in range(7)
+        ],
+        "weekday_text": [f"{day}: {venue['open_hour']}:00 – {venue['close_hour']}:00" for day in days],
+    }
+    return result
+
+
+def geocode_results(world: SyntheticWorld, lat: float, lng: float) -> List[Dict[str, Any]]:
+    if world.is_water(lat, lng):
+        return [{
+            "formatted_address": "Synthetic Bay",
+            "types": ["natural_feature"],
+            "address_components": [{"long_name": "Synthetic Bay", "types": ["natural_feature"]}],
+            "geometry": {"location": {"lat": lat, "lng": lng}},
+        }]
+
+    number = zlib.crc32(f"{lat:.4f},{lng:.4f}".encode()) % 999 + 1
+    street = STREETS[zlib.crc32(f"{lat:.3f}".encode()) % len(STREETS)]
+    return [{
+        "formatted_address": f"{number} {street} St, Synthetic City",
+        "types": ["street_address"],
+        "address_components": [
+            {"long_name": str(number), "types": ["street_number"]},
+            {"long_name": f"{street} Street", "types": ["route"]},
+            {"long_name": "Downtown", "types": ["neighborhood", "political"]},
+            {"long_name": "Synthetic City", "types": ["locality", "political"]},
+        ],
+        "geometry": {"location": {"lat": lat, "lng": lng}},
+    }]
+
+
+# ---------------------------------------------------------------------------
+# Latency and error injection
+# ---------------------------------------------------------------------------
+
+def parse_latency(spec: str) -> Tuple[Optional[str], str, List[float]]:
+    """Parse "[endpoint=]none|fixed:MS|uniform:MIN:MAX|lognormal:MEDIAN:SIGMA"."""
+    endpoint = None
+    if "=" in spec:
+        endpoint, spec = spec.split("=", 1)
+        if endpoint not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint {endpoint!r}, expected one of {ENDPOINTS}")
+
+    kind, *args = spec.split(":")
+    expected = {"none": 0, "fixed": 1, "uniform": 2, "lognormal": 2}
+    if kind not in expected or len(args) != expected[kind]:
+        raise argparse.ArgumentTypeError(f"invalid latency spec {spec!r}")
+    return endpoint, kind, [float(a) for a in args]
+
+
+def sample_latency(kind: str, args: List[float]) -> float:
+    """Seconds to wait before answering."""
+    if kind == "fixed":
+        return args[0] / 1000
+    if kind == "uniform":
+        return random.uniform(args[0], args[1]) / 1000
+    if kind == "lognormal":
+        return random.lognormvariate(math.log(args[0]), args[1]) / 1000
+    return 0.0
+
+
+def parse_injection(spec: str) -> Tuple[Optional[str], str, float]:
+    """Parse "KIND=RATE[@endpoint]"."""
+    endpoint = None
+    if "@" in spec:
+        spec, endpoint = spec.rsplit("@", 1)
+        if endpoint not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint {endpoint!r}, expected one of {ENDPOINTS}")
+
+    kind, _, rate = spec.partition("=")
+    if kind not in INJECTABLE:
+        raise argparse.ArgumentTypeError(f"unknown error kind {kind!r}, expected one of {INJECTABLE}")
+    return endpoint, kind, float(rate)
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+def create_app(
+    world: SyntheticWorld,
+    latency: Dict[str, Tuple[str, List[float]]],
+    injections: Dict[str, List[Tuple[str, float]]],
+    page_token_delay: float,
+    timeout_seconds: float
+) -> FastAPI:
+    """Build the fake Maps app."""
+    app = FastAPI(title="Fake Google Maps")
+    tokens: Dict[str, Tuple[List[Dict[str, Any]], float]] = {}
+    stats: Counter = Counter()
+
+    async def simulate(endpoint: str) -> Optional[JSONResponse]:
+        """Apply latency and maybe an injected error (returned as the response)."""
+        stats[f"{endpoint}.requests"] += 1
+        kind, args = latency[endpoint]
+        delay = sample_latency(kind, args)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = random.random()
+        for error, rate in injections[endpoint]:
+            if roll < rate:
+                stats[f"{endpoint}.{error}"] += 1
+                if error == "timeout":
+                    await asyncio.sleep(timeout_seconds)
+                    return JSONResponse({"status": "UNKNOWN_ERROR", "results": []})
+                if error.startswith("http_"):
+                    return JSONResponse({"error": "injected"}, status_code=int(error[5:]))
+                return JSONResponse({"status": error, "results": [], "error_message": "Injected error"})
+            roll -= rate
+        return None
+
+    def page(results: List[Dict[str, Any]], offset: int) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            "status": "OK" if results else "ZERO_RESULTS",
+            "results": [nearby_result(v) for v in results[offset:offset + PAGE_SIZE]],
+        }
+        if offset + PAGE_SIZE < len(results):
+            token = uuid.uuid4().hex
+            tokens[token] = (results[offset + PAGE_SIZE:], time.monotonic() + page_token_delay)
+            body["next_page_token"] = token
+        return body
+
+    @app.get("/maps/api/place/nearbysearch/json")
+    async def nearbysearch(request: Request):
+        injected = await simulate("nearbysearch")
+        if injected is not None:
+            return injected
+
+        params = request.query_params
+        if "pagetoken" in params:
+            entry = tokens.get(params["pagetoken"])
+            now = time.monotonic()
+            # Like Google: a token is rejected until it becomes valid, and expires later
+            if entry is None or now < entry[1] or now > entry[1] + TOKEN_TTL_SECONDS:
+                stats["nearbysearch.invalid_token"] += 1
+                return {"status": "INVALID_REQUEST", "results": []}
+            del tokens[params["pagetoken"]]
+            return page(entry[0], 0)
+
+        try:
+            lat, lng = (float(v) for v in params["location"].split(","))
+            radius = min(float(params["radius"]), 50000.0)
+        except (KeyError, ValueError):
+            return {"status": "INVALID_REQUEST", "results": []}
+
+        # Forget expired tokens now and then
+        if len(tokens) > 10000:
+            cutoff = time.monotonic() - TOKEN_TTL_SECONDS
+            for token in [t for t, (_, ready) in tokens.items() if ready < cutoff]:
+                del tokens[token]
+
+        return page(world.search(lat, lng, radius, params.get("keyword", "")), 0)
+
+    @app.get("/maps/api/place/details/json")
+    async def details(request: Request):
+        injected = await simulate("details")
+        if injected is not None:
+            return injected
+
+        try:
+            _, ci, cj, k = request.query_params["place_id"].split("_")
+            venue = world.venue(int(ci), int(cj), int(k))
+        except (KeyError, ValueError):
+            venue = None
+        if venue is None:
+            return {"status": "NOT_FOUND"}
+        return {"status": "OK", "result": details_result(venue)}
+
+    @app.get("/maps/api/geocode/json")
+    async def geocode(request: Request):
+        injected = await simulate("geocode")
+        if injected is not None:
+            return injected
+
+        try:
+            lat, lng = (float(v) for v in request.query_params["latlng"].split(","))
+        except (KeyError, ValueError):
+            return {"status": "INVALID_REQUEST", "results": []}
+        return {"status": "OK", "results": geocode_results(world, lat, lng)}
+
+    @app.get("/_stats")
+    async def server_stats():
+        return {"counters": dict(stats), "outstanding_page_tokens": len(tokens)}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Google Maps server for load and latency tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--seed", type=int, default=0, help="World seed (same seed, same venues and coastline)")
+    parser.add_argument("--water-fraction", type=float, default=0.3, help="Share of the surface that is water")
+    parser.add_argument("--venues-per-km2", type=float, default=10.0, help="Venue density on land")
+    parser.add_argument("--latency", type=parse_latency, action="append", default=[],
+                        help="[endpoint=]none|fixed:MS|uniform:MIN:MAX|lognormal:MEDIAN:SIGMA (repeatable)")
+    parser.add_argument("--inject", type=parse_injection, action="append", default=[],
+                        help=f"KIND=RATE[@endpoint] with KIND in {', '.join(INJECTABLE)} (repeatable)")
+    parser.add_argument("--page-token-delay", type=float, default=2.0, help="Seconds before a page token is valid")
+    parser.add_argument("--timeout-seconds", type=float, default=30.0, help="Stall of an injected timeout")
+    args = parser.parse_args()
+
+    latency = {endpoint: ("none", []) for endpoint in ENDPOINTS}
+    for endpoint, kind, values in sorted(args.latency, key=lambda spec: spec[0] is not None):
+        for target in ([endpoint] if endpoint else ENDPOINTS):
+            latency[target] = (kind, values)
+
+    injections: Dict[str, List[Tuple[str, float]]] = {endpoint: [] for endpoint in ENDPOINTS}
+    for endpoint, kind, rate in args.inject:
+        for target in ([endpoint] if endpoint else ENDPOINTS):
+            injections[target].append((kind, rate))
+
+    world = SyntheticWorld(args.seed, args.water_fraction, args.venues_per_km2)
+    app = create_app(world, latency, injections, args.page_token_delay, args.timeout_seconds)
+
+    print(f"🗺️  Fake Google Maps on http://{args.host}:{args.port}/maps/api "
+          f"(seed {args.seed}, {args.water_fraction:.0%} water, {args.venues_per_km2:g} venues/km²)")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Geometry micro-benchmarks for Where2Meet server algorithms.
+
+Runs compute_mec, compute_centroid, haversine_distance (scalar and batch)
+and apply_fuzzing on synthetic participant sets from 2 to 100k points in
+three layouts (clustered, uniform, antimeridian-straddling). Reports
+ops/sec, p50/p99 latency and peak memory, checks every result against a
+brute-force oracle, and writes JSON so two runs can be diffed.
+
+Usage:
+    python benchmarks/geometry_bench.py --out bench.json
+    python benchmarks/geometry_bench.py --sizes 2,100,10000 --compare bench.json
+"""
+
+import argparse
+import itertools
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services import geo_kernels  # noqa: E402
+from app.services.algorithms import (  # noqa: E402
+    apply_fuzzing,
+    compute_centroid,
+    compute_mec,
+    haversine_distance,
+)
+
+DEFAULT_SIZES = [2, 10, 100, 1000, 10000, 100000]
+DISTRIBUTIONS = ["clustered", "uniform", "antimeridian"]
+
+# Largest set the O(n^4) brute-force MEC oracle is run on
+BRUTE_FORCE_MEC_LIMIT = 40
+
+
+# ---------------------------------------------------------------------------
+# Synthetic participant sets
+# ---------------------------------------------------------------------------
+
+def generate_points(distribution: str, size: int, seed: int = 0) -> list:
+    """Generate a list of (lat, lng) tuples."""
+    rng = np.random.default_rng(seed + size)
+
+    if distribution == "clustered":
+        # A few neighbourhoods around a metro center
+        centers = rng.normal((40.73, -73.99), 0.08, size=(5, 2))
+        labels = rng.integers(0, len(centers), size)
+        coords = centers[labels] + rng.normal(0, 0.01, size=(size, 2))
+    elif distribution == "uniform":
+        # Uniform over a ~50km box
+        coords = np.column_stack((
+            rng.uniform(40.5, 40.95, size),
+            rng.uniform(-74.3, -73.7, size),
+        ))
+    elif distribution == "antimeridian":
+        # Straddles 180° (e.g. Fiji), half the points on each side
+        lngs = rng.uniform(179.7, 180.3, size)
+        coords = np.column_stack((
+            rng.uniform(-17.0, -16.5, size),
+            np.where(lngs > 180.0, lngs - 360.0, lngs),
+        ))
+    else:
+        raise ValueError(f"Unknown distribution: {distribution}")
+
+    return [(float(lat), float(lng)) for lat, lng in coords]
+
+
+# ---------------------------------------------------------------------------
+# Brute-force oracles (plain math, no shared code with the implementations)
+# ---------------------------------------------------------------------------
+
+def oracle_haversine(lat1, lng1, lat2, lng2):
+    """Reference great-circle distance (km)."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((p2 - p1) / 2) ** 2 +
+         math.cos(p1) * math.cos(p2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2)
+    return 2 * 6371.0 * math.asin(math.sqrt(min(1.0, a)))
+
+
+def oracle_centroid(points):
+    """Reference spherical centroid."""
+    x = y = z = 0.0
+    for lat, lng in points:
+        p, l = math.radians(lat), math.radians(lng)
+        x += math.cos(p) * math.cos(l)
+        y += math.cos(p) * math.sin(l)
+        z += math.sin(p)
+    return (math.degrees(math.atan2(z, math.hypot(x, y))), math.degrees(math.atan2(y, x)))
+
+
+def oracle_mec_radius(points):
+    """
+    Reference MEC radius (km): the smallest circle through every pair and
+    triple of points (planar, in a local frame) that encloses all points.
+    """
+    ref_lat, ref_lng = oracle_centroid(points)
+    kx = math.cos(math.radians(ref_lat)) * 111.19492664455873
+    xy = [(((lng - ref_lng + 180) % 360 - 180) * kx, (lat - ref_lat) * 111.19492664455873) for lat, lng in points]
+
+    def encloses(cx, cy, r):
+        return all(math.hypot(x - cx, y - cy) <= r * (1 + 1e-7) + 1e-9 for x, y in xy)
+
+    best = math.inf
+    for (ax, ay), (bx, by) in itertools.combinations(xy, 2):
+        cx, cy = (ax + bx) / 2, (ay + by) / 2
+        r = math.hypot(ax - cx, ay - cy)
+        if r < best and encloses(cx, cy, r):
+            best = r
+    for (ax, ay), (bx, by), (qx, qy) in itertools.combinations(xy, 3):
+        d = 2 * (ax * (by - qy) + bx * (qy - ay) + qx * (ay - by))
+        if abs(d) < 1e-12:
+            continue
+        a2, b2, q2 = ax * ax + ay * ay, bx * bx + by * by, qx * qx + qy * qy
+        cx = (a2 * (by - qy) + b2 * (qy - ay) + q2 * (ay - by)) / d
+        cy = (a2 * (qx - bx) + b2 * (ax - qx) + q2 * (bx - ax)) / d
+        r = math.hypot(ax - cx, ay - cy)
+        if r < best and encloses(cx, cy, r):
+            best = r
+    return best
+
+
+def check_mec(points, result):
+    """Every point enclosed; radius matches brute force on small sets."""
+    center_lat, center_lng, radius = result
+    if any(oracle_haversine(center_lat, center_lng, lat, lng) > radius + 1e-6 for lat, lng in points):
+        return "fail"
+    if len(points) <= BRUTE_FORCE_MEC_LIMIT:
+        expected = max(oracle_mec_radius(points), 1.0)
+        # Planar optimum vs. great-circle radius differ by projection distortion only
+        if abs(radius - expected) > expected * 0.005 + 1e-6:
+            return "fail"
+    return "pass"
+
+
+def check_centroid(points, result):
+    expected = oracle_centroid(points)
+    return "pass" if abs(result[0] - expected[0]) < 1e-9 and abs(result[1] - expected[1]) < 1e-9 else "fail"
+
+
+def check_distances(points, result):
+    center = points[0]
+    ok = all(
+        abs(d - oracle_haversine(center[0], center[1], lat, lng)) < 1e-6
+        for d, (lat, lng) in zip(result, points)
+    )
+    return "pass" if ok else "fail"
+
+
+def check_fuzzing(points, result):
+    # apply_fuzzing offsets each coordinate by at most radius_km (0.5km) per axis
+    ok = all(
+        oracle_haversine(lat, lng, flat, flng) <= 0.5 * math.sqrt(2) * 1.01
+        for (lat, lng), (flat, flng) in zip(points, result)
+    )
+    return "pass" if ok else "fail"
+
+
+# ---------------------------------------------------------------------------
+# Benchmarked operations: name -> (run(points), check(points, result))
+# ---------------------------------------------------------------------------
+
+def _scalar_distances(points):
+    lat0, lng0 = points[0]
+    return [haversine_distance(lat0, lng0, lat, lng) for lat, lng in points]
+
+
+def _batch_distances(points):
+    coords = np.asarray(points)
+    return geo_kernels.haversine(points[0], coords[:, 0], coords[:, 1]).tolist()
+
+
+def _fuzz_all(points):
+    return [apply_fuzzing(lat, lng) for lat, lng in points]
+
+
+OPERATIONS = {
+    "compute_mec": (compute_mec, check_mec),
+    "compute_centroid": (compute_centroid, check_centroid),
+    "haversine_distance": (_scalar_distances, check_distances),
+    "haversine_batch": (_batch_distances, check_distances),
+    "apply_fuzzing": (_fuzz_all, check_fuzzing),
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def measure(run, points, min_time: float, min_reps: int, max_reps: int) -> dict:
+    """Time repeated calls and measure peak memory of one call."""
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < max_reps and (len(samples) < min_reps or time.perf_counter() - started < min_time):
+        t0 = time.perf_counter()
+        run(points)
+        samples.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    run(points)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples_ms = np.array(samples) * 1000
+    return {
+        "reps": len(samples),
+        "ops_per_sec": len(samples) / samples_ms.sum() * 1000,
+        "p50_ms": float(np.percentile(samples_ms, 50)),
+        "p99_ms": float(np.percentile(samples_ms, 99)),
+        "peak_kib": peak / 1024,
+    }
+
+
+def run_suite(sizes, distributions, operations, min_time, min_reps, max_reps) -> list:
+    results = []
+    for name in operations:
+        run, check = OPERATIONS[name]
+        for distribution in distributions:
+            for size in sizes:
+                points = generate_points(distribution, size)
+                oracle = check(points, run(points))
+                stats = measure(run, points, min_time, min_reps, max_reps)
+                row = {"op": name, "distribution": distribution, "size": size, "oracle": oracle, **stats}
+                results.append(row)
+                flag = "✅" if oracle == "pass" else "❌"
+                print(f"{flag} {name:<20} {distribution:<13} n={size:<7} "
+                      f"{row['ops_per_sec']:>12.1f} ops/s  p50={row['p50_ms']:>9.3f}ms  "
+                      f"p99={row['p99_ms']:>9.3f}ms  peak={row['peak_kib']:>9.1f}KiB")
+    return results
+
+
+def compare(current: list, baseline_path: str, threshold: float) -> bool:
+    """Print p50 ratios against a baseline run. Returns True if nothing regressed."""
+    with open(baseline_path) as f:
+        baseline = {(r["op"], r["distribution"], r["size"]): r for r in json.load(f)["results"]}
+
+    print("\n" + "=" * 70)
+    print(f"Comparison against {baseline_path} (regression threshold {threshold:.0%})")
+    print("=" * 70)
+
+    ok = True
+    for row in current:
+        old = baseline.get((row["op"], row["distribution"], row["size"]))
+        if not old:
+            continue
+        ratio = row["p50_ms"] / old["p50_ms"] if old["p50_ms"] > 0 else 1.0
+        regressed = ratio > 1 + threshold
+        ok = ok and not regressed
+        flag = "❌" if regressed else "✅"
+        print(f"{flag} {row['op']:<20} {row['distribution']:<13} n={row['size']:<7} "
+              f"p50 {old['p50_ms']:.3f}ms -> {row['p50_ms']:.3f}ms ({ratio:.2f}x)")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Geometry micro-benchmarks.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated point counts")
+    parser.add_argument("--distributions", default=",".join(DISTRIBUTIONS), help="Comma-separated layouts")
+    parser.add_argument("--ops", default=",".join(OPERATIONS), help="Comma-separated operations")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds to spend per case")
+    parser.add_argument("--min-reps", type=int, default=3)
+    parser.add_argument("--max-reps", type=int, default=1000)
+    parser.add_argument("--out", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to diff against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown before failing")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    distributions = args.distributions.split(",")
+    operations = args.ops.split(",")
+
+    results = run_suite(sizes, distributions, operations, args.min_time, args.min_reps, args.max_reps)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({
+                "meta": {
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "machine": platform.machine(),
+                    "platform": platform.platform(),
+                },
+                "results": results,
+            }, f, indent=2)
+        print(f"\n📄 Results written to {args.out}")
+
+    ok = all(row["oracle"] == "pass" for row in results)
+    if args.compare:
+        ok = compare(results, args.compare, args.threshold) and ok
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -49,7 +49,22 @@ def test_imports():
         "app.models.event",
         "app.schemas.event",
         "app.services.algorithms",
+        "app.services.geo_kernels",
+        "app.services.projection",
         "app.services.google_maps",
+        "app.services.mec_state",
+        "app.services.center_solvers",
+        "app.services.batch_analysis",
+        "app.services.ranking",
+        "app.services.cache",
+        "app.services.land_mask",
+        "app.services.singleflight",
+        "app.services.resilience",
+        "app.services.quota",
+        "app.services.tiling",
+        "app.services.enrichment",
+        "app.services.instrumentation",
+        "app.services.places",
         "app.services.sse",
     ]
 
@@ -155,17 +170,43 @@ def test_algorithms():
         distance = haversine_distance(40.7128, -74.0060, 34.0522, -118.2437)
         print(f"✅ Distance NYC-LA: {distance:.2f} km")
         assert distance > 3000, "NYC-LA distance should be > 3000 km"
+        batch = haversine_distance(40.7128, -74.0060, [34.0522, 40.7128], [-118.2437, -74.0060])
+        assert abs(batch[0] - distance) < 1e-9 and batch[1] == 0.0, "Array distances should match the scalar path"
 
         # Test MEC calculation
         mec = compute_mec(locations)
         print(f"✅ MEC calculated: center=({mec[0]:.4f}, {mec[1]:.4f}), radius={mec[2]:.2f} km")
         assert mec is not None, "MEC should not be None"
 
+        # Test MEC on a large group (no recursion limit, every point enclosed)
+        import math
+        import random
+        rng = random.Random(42)
+        group = [(40.75 + rng.gauss(0, 0.05), -73.98 + rng.gauss(0, 0.05)) for _ in range(5000)]
+        mec = compute_mec(group)
+        print(f"✅ MEC for {len(group)} points: radius={mec[2]:.2f} km")
+        assert all(haversine_distance(mec[0], mec[1], lat, lng) <= mec[2] + 1e-9 for lat, lng in group), \
+            "MEC should enclose every point"
+
+        # Test MEC three-point case is the true circumcircle (equilateral triangle, ~10km apart)
+        triangle = [(0.0, 0.0), (0.0, 0.09), (0.0779, 0.045)]
+        mec = compute_mec(triangle)
+        expected = haversine_distance(0.0, 0.0, 0.0, 0.09) / math.sqrt(3)
+        print(f"✅ MEC circumcircle: radius={mec[2]:.3f} km (expected {expected:.3f} km)")
+        assert abs(mec[2] - expected) < 0.01, "Three-point MEC should be the circumcircle"
+
         # Test fuzzing
         fuzzy = apply_fuzzing(40.7128, -74.0060)
         print(f"✅ Fuzzing applied: ({fuzzy[0]:.4f}, {fuzzy[1]:.4f})")
         assert fuzzy != (40.7128, -74.0060), "Fuzzy coordinates should differ"
 
+        # Test composite ranking: voted, close, well-rated venue wins; top-k is best first
+        from app.services.ranking import compute_scores, top_k
+        scores = compute_scores([4.0, 4.8, None], [120, 900, 0], [2.0, 0.5, None], [True, True, False], [0, 3, 0])
+        top = top_k(scores, 2).tolist()
+        print(f"✅ Ranking top-2: {top}")
+        assert top == [1, 0], "Ranking should order by composite score"
+
         return True
     except Exception as e:
         print(f"❌ Algorithm test failed: {e}")
@@ -309,6 +350,22 @@ def test_main_app():
         assert any("/health" in route for route in routes), "Health endpoint missing"
         print("✅ Health endpoint registered")
 
+        # Monitoring endpoints list event IDs: hidden without a token, 401 with a wrong one
+        from fastapi.testclient import TestClient
+        from app.core.config import settings
+        client = TestClient(app)
+        saved_token = settings.METRICS_TOKEN
+        try:
+            settings.METRICS_TOKEN = ""
+            assert client.get("/metrics/events").status_code == 404, "Metrics should be disabled without a token"
+            settings.METRICS_TOKEN = "test-token"
+            assert client.get("/metrics/events").status_code == 401, "Metrics should require the token"
+            response = client.get("/metrics/events", headers={"Authorization": "Bearer test-token"})
+            assert response.status_code == 200, "Metrics should accept the token"
+        finally:
+            settings.METRICS_TOKEN = saved_token
+        print("✅ Metrics endpoints require METRICS_TOKEN")
+
         return True
     except Exception as e:
         print(f"❌ Main app test failed: {e}")
@@ -362,6 +419,402 @@ def test_file_structure():
     return True
 
 
+def test_mec_state():
+    """Test the incremental MEC state against a from-scratch computation."""
+    print("\n" + "=" * 60)
+    print("TEST 11: Incremental MEC State Validation")
+    print("=" * 60)
+
+    import random
+    from datetime import datetime, timedelta
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.db.base import Base
+    from app.models.event import Candidate, Event, Participant, Vote
+    from app.services.algorithms import compute_mec, haversine_distance
+    from app.services.mec_state import (
+        get_event_circle,
+        on_participant_added,
+        on_participant_moved,
+        on_participant_removed,
+        read_event_mec,
+        rebuild_event_mec,
+    )
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (Event, Participant, Candidate, Vote)])
+    db = sessionmaker(bind=engine)()
+
+    event = Event(
+        id="evt_mec_test", title="MEC", category="cafe", visibility="show", allow_vote=True,
+        expires_at=datetime.utcnow() + timedelta(days=1)
+    )
+    db.add(event)
+    db.commit()
+    rebuild_event_mec(db, event)
+    db.commit()
+
+    def check(step: str) -> None:
+        locations = [(p.lat, p.lng) for p in db.query(Participant).filter(Participant.event_id == event.id)]
+        expected = compute_mec(locations)
+        cached = get_event_circle(event)
+        assert event.mec_participant_count == len(locations), f"{step}: participant count drifted"
+        if expected is None:
+            assert cached is None, f"{step}: empty event should have no circle"
+            return
+        # The cached circle must enclose everyone and be as small as a fresh one, up to
+        # the planar solver's precision (it projects around the current point set)
+        assert all(haversine_distance(cached[0], cached[1], lat, lng) <= cached[2] + 1e-6 for lat, lng in locations), \
+            f"{step}: cached circle does not enclose every participant"
+        assert abs(cached[2] - expected[2]) < max(1e-3, expected[2] * 1e-4), \
+            f"{step}: cached {cached} != from scratch {expected}"
+
+    rng = random.Random(7)
+    participants = []
+    for step in range(200):
+        op = rng.random()
+        if not participants or op < 0.45:
+            participant = Participant(
+                id=f"p_{step}", event_id=event.id,
+                lat=40.7 + rng.gauss(0, 0.05), lng=-74.0 + rng.gauss(0, 0.05)
+            )
+            participant.fuzzy_lat, participant.fuzzy_lng = participant.lat, participant.lng
+            db.add(participant)
+            on_participant_added(db, event, participant)
+            participants.append(participant)
+            name = "add"
+        elif op < 0.8:
+            participant = rng.choice(participants)
+            # Mostly small moves (often staying inside), sometimes far out
+            spread = 0.005 if rng.random() < 0.7 else 0.1
+            participant.lat += rng.gauss(0, spread)
+            participant.lng += rng.gauss(0, spread)
+            on_participant_moved(db, event, participant)
+            name = "move"
+        else:
+            participant = participants.pop(rng.randrange(len(participants)))
+            db.delete(participant)
+            on_participant_removed(db, event, participant.id)
+            name = "remove"
+        db.commit()
+        check(f"step {step} ({name})")
+
+    print(f"✅ Cached circle matched compute_mec after 200 add/move/remove steps ({len(participants)} left)")
+
+    # A full rebuild of a drifted state restores it
+    event.mec_center_lat, event.mec_radius_km, event.mec_participant_count = 0.0, 0.0, 999
+    rebuild_event_mec(db, event)
+    db.commit()
+    check("rebuild")
+    print("✅ rebuild_event_mec restored a corrupted circle")
+
+    # Events that were never backfilled are computed on read, without writing the event
+    for column in ("mec_center_lat", "mec_center_lng", "mec_radius_km", "mec_support", "mec_participant_count"):
+        setattr(event, column, None)
+    db.commit()
+    locations = [(p.lat, p.lng) for p in participants]
+    circle, count = read_event_mec(db, event)
+    assert count == len(locations) and circle == compute_mec(locations), "Fallback should match compute_mec"
+    assert not db.dirty and event.mec_participant_count is None, "Reads should not backfill the event"
+    print("✅ read_event_mec computes un-backfilled events without storing them")
+
+    db.close()
+    return True
+
+
+def test_tiled_search():
+    """Test tiled venue search on small and large circles."""
+    print("\n" + "=" * 60)
+    print("TEST 12: Tiled Places Search Validation")
+    print("=" * 60)
+
+    import asyncio
+    from app.services.geo_kernels import haversine
+    from app.services.google_maps import GoogleMapsService
+    from app.services.places import Place
+
+    service = GoogleMapsService()
+    requested = []
+
+    async def fake_pages(lat, lng, radius, keyword, min_rating, max_results):
+        # 20 venues per page spread over the query circle, as many pages as allowed
+        requested.append(max_results)
+        pages = max_results // 20
+        for page in range(pages):
+            yield [
+                Place(
+                    f"fake_{lat:.4f}_{lng:.4f}_{page}_{i}", "Venue", "Street",
+                    lat + radius / 111.0 * 0.6 * ((i % 5) / 4 - 0.5),
+                    lng + radius / 111.0 * 0.6 * ((i // 5) / 3 - 0.5),
+                    4.0, 10, None
+                )
+                for i in range(20)
+            ], "OK", page == pages - 1
+
+    service._iter_places_pages = fake_pages
+
+    # A circle that fits in one tile gets the plain search's page budget
+    small = asyncio.run(service.search_places_tiled(40.7, -74.0, 1.4, "cafe"))
+    print(f"✅ Small circle: {len(small)} places from {len(requested)} query (max_results={requested})")
+    assert requested == [60], "A single-tile search should request up to 60 results"
+    assert len(small) == 60, "A single-tile search should return as many places as the plain search"
+
+    # Repeating it is answered from the cache in one batch marked as the last
+    async def batches():
+        return [(len(page), last) async for page, last in service.iter_places_nearby(40.7, -74.0, 1.4, "cafe")]
+    cached = asyncio.run(batches())
+    print(f"✅ Cached progressive search: batches {cached}")
+    assert cached == [(60, True)], "A cached progressive search should be one final batch"
+    assert requested == [60], "A cached search should not query again"
+
+    # A large circle is covered by several one-page tiles, de-duplicated and clipped to the circle
+    requested.clear()
+    large = asyncio.run(service.search_places_tiled(40.7, -74.0, 5.0, "cafe"))
+    distances = haversine((40.7, -74.0), [p.lat for p in large], [p.lng for p in large])
+    print(f"✅ Large circle: {len(large)} places from {len(requested)} tile queries")
+    assert len(requested) > 1 and set(requested) == {20}, "Tiles should query one page each"
+    assert len({p.place_id for p in large}) == len(large), "Tiled results should be de-duplicated"
+    assert (distances <= 5.0).all(), "Tiled results should lie inside the circle"
+
+    return True
+
+
+def test_resilience():
+    """Test the quota bucket, circuit breaker and singleflight primitives."""
+    print("\n" + "=" * 60)
+    print("TEST 13: Quota, Circuit Breaker and Singleflight Validation")
+    print("=" * 60)
+
+    import asyncio
+    from app.services.quota import BACKGROUND, INTERACTIVE, LocalTokenBucket, QuotaGovernor, QuotaExceededError, request_priority
+    from app.services.resilience import CircuitBreaker
+    from app.services.singleflight import SingleFlight
+
+    # Token bucket: burst drains, then refills at the rate
+    bucket = LocalTokenBucket(rate=10.0, burst=5)
+    assert [bucket.take() for _ in range(5)] == [0.0] * 5, "A full bucket should grant its burst"
+    wait = bucket.take()
+    assert 0.09 < wait <= 0.1, "An empty bucket should ask to wait 1/rate"
+    bucket.updated -= 0.35  # 0.35 s later: 3.5 tokens refilled
+    assert [bucket.take() for _ in range(3)] == [0.0] * 3 and bucket.take() > 0, "Refill should follow the rate"
+    bucket.updated -= 100  # refill never exceeds the burst
+    assert sum(bucket.take() == 0.0 for _ in range(10)) == 5, "Refill should be capped at the burst"
+    print("✅ Token bucket drains its burst and refills at its rate")
+
+    # Priority reserve: background calls leave half of the bucket to interactive ones
+    bucket = LocalTokenBucket(rate=10.0, burst=10)
+    granted = sum(bucket.take(reserve=5) == 0.0 for _ in range(10))
+    assert granted == 5, "Background takes should stop at the reserve"
+    assert bucket.take(reserve=0) == 0.0, "Interactive takes should use the reserve"
+    print("✅ Background takes leave the reserve to interactive ones")
+
+    async def governor_priorities():
+        governor = QuotaGovernor(
+            "memory", "", rate=1.0, burst=4, background_reserve=0.5,
+            max_wait={INTERACTIVE: 0.0, BACKGROUND: 0.0}
+        )
+        with request_priority(BACKGROUND):
+            background = 0
+            try:
+                while True:
+                    await governor.acquire("geocode")
+                    background += 1
+            except QuotaExceededError:
+                pass
+        interactive = 0
+        try:
+            while True:
+                await governor.acquire("geocode")
+                interactive += 1
+        except QuotaExceededError:
+            pass
+        return background, interactive
+
+    background, interactive = asyncio.run(governor_priorities())
+    assert (background, interactive) == (2, 2), "Governor should split the bucket by priority"
+    print(f"✅ Quota governor: {background} background + {interactive} interactive grants, then 429-style rejection")
+
+    # Circuit breaker: closed -> open after N failures -> half-open trial -> closed or reopened
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow(), "Breaker should open after the threshold"
+    breaker.opened_at -= 31
+    assert breaker.state == "half_open", "Breaker should half-open after the reset timeout"
+    assert breaker.allow() and not breaker.allow(), "Half-open breaker should allow a single trial"
+    breaker.record_failure()
+    assert breaker.state == "open", "A failed trial should reopen the breaker"
+    breaker.opened_at -= 31
+    assert breaker.allow()
+    breaker.release_trial()
+    assert breaker.allow(), "A released trial slot should be claimable again"
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.failures == 0, "A successful trial should close the breaker"
+    print("✅ Circuit breaker opens, half-opens for one trial and closes")
+
+    # Singleflight: concurrent calls share one upstream call
+    async def coalescing():
+        flight = SingleFlight()
+        calls = 0
+
+        async def upstream():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "result"
+
+        results = await asyncio.gather(*[flight.do("key", upstream) for _ in range(5)])
+        return results, calls, flight.stats()
+
+    results, calls, stats = asyncio.run(coalescing())
+    assert results == ["result"] * 5 and calls == 1, "Concurrent calls should share one upstream call"
+    assert stats["coalesced"] == 4 and stats["in_flight"] == 0
+    print("✅ Singleflight coalesces 5 concurrent calls into 1")
+
+    # Singleflight cancellation: one waiter leaving keeps the call, the last one cancels it
+    async def cancellation():
+        flight = SingleFlight()
+        outcome = []
+
+        async def upstream():
+            try:
+                await asyncio.sleep(0.2)
+                outcome.append("finished")
+                return "result"
+            except asyncio.CancelledError:
+                outcome.append("cancelled")
+                raise
+
+        first = asyncio.ensure_future(flight.do("a", upstream))
+        second = asyncio.ensure_future(flight.do("a", upstream))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        shared = await second
+
+        lone = asyncio.ensure_future(flight.do("b", upstream))
+        await asyncio.sleep(0.01)
+        lone.cancel()
+        await asyncio.sleep(0.01)
+        return shared, outcome, flight.stats()
+
+    shared, outcome, stats = asyncio.run(cancellation())
+    assert shared == "result" and outcome == ["finished", "cancelled"], \
+        "The shared call should survive one waiter and stop with the last"
+    assert stats["cancelled"] == 1 and stats["in_flight"] == 0
+    print("✅ Singleflight keeps shared calls for remaining waiters and cancels abandoned ones")
+
+    return True
+
+
+def test_batch_reprocess():
+    """Test the batch reprocess used by app.cli.reprocess_events."""
+    print("\n" + "=" * 60)
+    print("TEST 14: Batch Reprocess Validation")
+    print("=" * 60)
+
+    import os
+    import random
+    import tempfile
+    from datetime import datetime, timedelta
+    from sqlalchemy import create_engine, event as sa_event
+    from sqlalchemy.orm import sessionmaker
+    from app.db.base import Base
+    from app.models.event import Candidate, Event, Participant, Vote
+    from app.services.algorithms import MIN_RADIUS_KM, compute_mec
+    from app.services.batch_analysis import reprocess_events
+
+    # A file database in WAL mode, so the streaming reader and the writer can overlap
+    path = os.path.join(tempfile.mkdtemp(), "reprocess.db")
+    engine = create_engine(f"sqlite:///{path}")
+    sa_event.listen(engine, "connect", lambda conn, _: conn.execute("PRAGMA journal_mode=WAL"))
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (Event, Participant, Candidate, Vote)])
+    Session = sessionmaker(bind=engine)
+
+    rng = random.Random(7)
+    db = Session()
+    expected = {}
+    for i in range(25):
+        event_id = f"evt_batch_{i:02d}"
+        db.add(Event(
+            id=event_id, title="Batch", category="cafe", visibility="show", allow_vote=True,
+            expires_at=datetime.utcnow() + timedelta(days=1),
+            deleted_at=datetime.utcnow() if i == 24 else None
+        ))
+        locations = [(40.7 + rng.uniform(-0.1, 0.1), -74.0 + rng.uniform(-0.1, 0.1)) for _ in range(i % 6)]
+        for j, (lat, lng) in enumerate(locations):
+            db.add(Participant(id=f"{event_id}_p{j}", event_id=event_id, name=f"P{j}", lat=lat, lng=lng))
+        expected[event_id] = compute_mec(locations)
+    db.commit()
+    db.close()
+
+    updated = reprocess_events(workers=2, chunk_size=4, session_factory=Session)
+    assert updated == 24, "Every live event (and only those) should be reprocessed"
+
+    db = Session()
+    for stored in db.query(Event):
+        circle = expected[stored.id]
+        if stored.deleted_at is not None:
+            assert stored.mec_participant_count is None, "Deleted events should be skipped"
+        elif circle is None:
+            assert stored.mec_participant_count == 0 and stored.mec_radius_km is None, \
+                "Events without participants should have their state reset"
+        else:
+            # The stored radius is exact; compute_mec applies the visibility minimum
+            assert abs(max(stored.mec_radius_km, MIN_RADIUS_KM) - circle[2]) < 1e-6, \
+                f"{stored.id}: radius differs from compute_mec"
+            assert abs(stored.mec_center_lat - circle[0]) < 1e-6 and abs(stored.mec_center_lng - circle[1]) < 1e-6
+    db.close()
+    print(f"✅ Reprocessed {updated} events across 2 workers, matching compute_mec")
+
+    updated = reprocess_events(workers=1, event_ids=["evt_batch_03"], session_factory=Session)
+    assert updated == 1, "--event-id should restrict the reprocess"
+    print("✅ Reprocess can be restricted to specific events")
+
+    return True
+
+
+def test_candidate_storage():
+    """Test bulk candidate storage with place IDs that share a prefix."""
+    print("\n" + "=" * 60)
+    print("TEST 15: Candidate Storage Validation")
+    print("=" * 60)
+
+    from datetime import datetime, timedelta
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.api.v1.candidates import _store_candidates
+    from app.db.base import Base
+    from app.models.event import Candidate, Event, Participant, Vote
+    from app.schemas.event import SearchAreaInfo
+    from app.services.places import Place
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (Event, Participant, Candidate, Vote)])
+    db = sessionmaker(bind=engine)()
+    db.add(Event(
+        id="evt_store", title="Store", category="cafe", visibility="show", allow_vote=True,
+        expires_at=datetime.utcnow() + timedelta(days=1)
+    ))
+    db.commit()
+
+    # Real place IDs often share long prefixes (e.g. "ChIJN1t_tDeuEmsR...")
+    places = [
+        Place(f"ChIJN1t_tDeuEmsR{suffix}", f"Cafe {suffix}", "", 40.7 + i * 0.001, -74.0, 4.5, 10, None)
+        for i, suffix in enumerate(["UsoyG83frY4", "UsoyG83frY5", "AbcdEfghIjk"])
+    ]
+    areas = [SearchAreaInfo(center_lat=40.7, center_lng=-74.0, radius_km=2.0)]
+    circles = [(40.7, -74.0, 2.0)]
+
+    stored = _store_candidates(db, "evt_store", places + places[:1], areas, circles)
+    assert len(stored) == 4 and db.query(Candidate).count() == 3, "Prefix-sharing places should all be stored once"
+    _store_candidates(db, "evt_store", places, areas, circles)
+    assert db.query(Candidate).count() == 3, "Repeated searches should not duplicate candidates"
+    print("✅ Places sharing a 16-character prefix are stored as distinct candidates")
+
+    return True
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -379,6 +832,11 @@ def main():
         ("API Structure", test_api_structure),
         ("Main App", test_main_app),
         ("File Structure", test_file_structure),
+        ("MEC State", test_mec_state),
+        ("Tiled Search", test_tiled_search),
+        ("Resilience", test_resilience),
+        ("Batch Reprocess", test_batch_reprocess),
+        ("Candidate Storage", test_candidate_storage),
     ]
 
     results = []